@@ -0,0 +1,125 @@
+"""
+JSON Codec Micro-benchmark
+
+WS 수신 경로의 프레임 decode / 송신 encode 비용을 codec별로 비교한다.
+
+프레임 소스:
+- 인자로 JSONL 파일을 주면 한 줄 = 원본 WS 프레임 하나로 읽어 사용 (녹화된 프레임)
+- .mpws 파일(wrappers.ws_recorder 녹화)이면 text 프레임을 그대로 사용
+- 없으면 Pacifica prices / Backpack depth / HL allMids 형태의 대표 프레임을 생성
+
+Usage:
+    python benchmarks/bench_json_codec.py [frames.jsonl | capture.mpws] [--rounds 2000]
+"""
+import argparse
+import random
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wrappers.json_codec import CODEC_PREFERENCE, get_codec
+from wrappers.ws_recorder import read_frames
+
+
+def _sample_frames():
+    """녹화 프레임이 없을 때 사용할 대표 프레임 (실제 스트림과 같은 구조/크기)"""
+    rnd = random.Random(7)
+    coins = [f"COIN{i}" for i in range(60)] + ["BTC", "ETH", "SOL"]
+    stdlib = get_codec("stdlib")
+
+    # Pacifica prices: 전체 심볼 브로드캐스트
+    prices = {
+        "channel": "prices",
+        "data": [
+            {
+                "symbol": c,
+                "mark": f"{rnd.uniform(1, 100000):.4f}",
+                "mid": f"{rnd.uniform(1, 100000):.4f}",
+                "oracle": f"{rnd.uniform(1, 100000):.4f}",
+                "funding": f"{rnd.uniform(-0.001, 0.001):.8f}",
+                "next_funding": f"{rnd.uniform(-0.001, 0.001):.8f}",
+                "open_interest": f"{rnd.uniform(0, 1e6):.2f}",
+                "volume_24h": f"{rnd.uniform(0, 1e8):.2f}",
+                "yesterday_price": f"{rnd.uniform(1, 100000):.4f}",
+                "timestamp": 1760000000000 + i,
+            }
+            for i, c in enumerate(coins)
+        ],
+    }
+
+    # Backpack depth delta
+    def depth(u):
+        return {
+            "stream": "depth.BTC_USDC_PERP",
+            "data": {
+                "e": "depth",
+                "E": 1760000000000000 + u,
+                "s": "BTC_USDC_PERP",
+                "a": [[f"{100000 + rnd.randint(0, 500) / 10:.1f}", f"{rnd.uniform(0, 2):.5f}"] for _ in range(rnd.randint(1, 12))],
+                "b": [[f"{99990 - rnd.randint(0, 500) / 10:.1f}", f"{rnd.uniform(0, 2):.5f}"] for _ in range(rnd.randint(1, 12))],
+                "U": u,
+                "u": u + 1,
+                "T": 1760000000000000 + u,
+            },
+        }
+
+    # HL allMids
+    all_mids = {
+        "channel": "allMids",
+        "data": {"mids": {c: f"{rnd.uniform(0.001, 100000):.6f}" for c in coins * 4}},
+    }
+
+    frames = [stdlib.dumps(prices), stdlib.dumps(all_mids)]
+    frames += [stdlib.dumps(depth(u)) for u in range(0, 40, 2)]
+    return frames
+
+
+def _load_frames(path):
+    if path.endswith(".mpws"):
+        return [raw for _, raw in read_frames(path) if isinstance(raw, str)]
+    with open(path, encoding="utf-8") as f:
+        return [line.rstrip("\n") for line in f if line.strip()]
+
+
+def _bench(fn, items, rounds):
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for item in items:
+            fn(item)
+    return (time.perf_counter() - t0) / (rounds * len(items)) * 1e6  # us/msg
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("frames", nargs="?", help="JSONL file with one raw WS frame per line")
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    frames = _load_frames(args.frames) if args.frames else _sample_frames()
+    stdlib = get_codec("stdlib")
+    objects = [stdlib.loads(f) for f in frames]
+    avg_size = sum(len(f) for f in frames) / len(frames)
+    print(f"frames: {len(frames)} (avg {avg_size:.0f} bytes), rounds: {args.rounds}")
+
+    results = {}
+    for name in CODEC_PREFERENCE:
+        codec = get_codec(name)
+        if codec.name != name:
+            print(f"{name:>8}: not installed")
+            continue
+        # 결과 동일성 확인
+        assert [codec.loads(f) for f in frames] == objects, f"{name} decode mismatch"
+        results[name] = (_bench(codec.loads, frames, args.rounds), _bench(codec.dumps, objects, args.rounds))
+
+    base_dec, base_enc = results["stdlib"]
+    print(f"{'codec':>8} | {'decode us/msg':>13} | {'encode us/msg':>13} | {'decode saving':>13}")
+    for name, (dec, enc) in results.items():
+        saving = (base_dec - dec) / base_dec * 100
+        print(f"{name:>8} | {dec:13.2f} | {enc:13.2f} | {saving:12.1f}%")
+    print(f"selected by default: {get_codec().name}")
+
+
+if __name__ == "__main__":
+    main()
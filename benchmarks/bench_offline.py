@@ -0,0 +1,235 @@
+"""
+Offline MultiPerpDex Benchmark Suite (mock exchange servers)
+
+benchmarks/mock_exchange.py 의 로컬 서버에 실제 래퍼를 붙여서 측정한다. 키/네트워크 불필요.
+- orders/sec    : create_order를 --concurrency 동시성으로 --orders 건 (limit은 체결되지 않는 가격, 종료 후 cancel_orders)
+- 메서드 latency: wrappers.metrics.METRICS (venue/method/path별 p50/p99, WS->REST fallback 포함)
+- WS 처리량     : mock 서버가 시세 프레임을 연속 전송 -> 래퍼 WS 클라이언트가 decode/handle까지 끝낸 msgs/sec
+
+mock 응답 지연/지터/429 비율을 바꿔가며 돌리면 배포 전에 래퍼 쪽 회귀(서명/직렬화/락/재시도)를 볼 수 있다.
+rate limiter는 기본 비활성 (래퍼 자체 비용만 측정). --rate-limit 으로 실제 한도 적용.
+
+Usage:
+    python benchmarks/bench_offline.py [--venues backpack,pacifica,extended,variational]
+                                       [--orders 200] [--concurrency 8] [--reads 100] [--ws-messages 5000]
+                                       [--latency 5] [--jitter 2] [--rate-429 0.0] [--market] [--rate-limit]
+"""
+import argparse
+import asyncio
+import base64
+import logging
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.mock_exchange import COINS, MockCluster, MockConfig
+from mpdex.utils.sign_executor import SIGN_EXECUTOR
+from wrappers.http_pool import HTTP_POOL
+from wrappers.meta_cache import META_CACHE
+from wrappers.metrics import METRICS
+from wrappers.rate_limiter import RATE_LIMITER
+
+COIN = "BTC"
+SYMBOLS = {"backpack": "BTC_USDC_PERP", "pacifica": "BTC", "extended": "BTCUSD", "variational": "BTC"}
+ORDER_SIZE = 0.001
+READ_METHODS = ("get_mark_price", "get_position", "get_collateral", "get_open_orders")
+
+
+async def build_exchange(name: str, cluster: MockCluster):
+    """mock 서버를 가리키는 래퍼 인스턴스 생성 + init (키는 매번 새로 생성한 더미)"""
+    if name == "backpack":
+        from wrappers.backpack import BackpackExchange
+        ex = BackpackExchange("mock-api-key", base64.b64encode(os.urandom(32)).decode())
+        cluster.point_instance(name, ex)
+        return await ex.init()
+    if name == "pacifica":
+        from solders.keypair import Keypair
+        from wrappers.pacifica import PacificaExchange
+        agent = Keypair()
+        ex = PacificaExchange(str(Keypair().pubkey()), str(agent.pubkey()), str(agent))
+        return await ex.init()
+    if name == "extended":
+        from wrappers.extended import ExtendedExchange
+        ex = ExtendedExchange("548793718399582326", hex(random.randrange(1, 2 ** 250)))
+        cluster.point_instance(name, ex)
+        return await ex.init()
+    if name == "variational":
+        from wrappers.variational import VariationalExchange
+        ex = VariationalExchange("0x" + os.urandom(20).hex(), session_cookies={"vr-token": "mock-token"},
+                                 options={"auto_login_on_demand": False})
+        return await ex.init()
+    raise ValueError(f"unknown venue {name}")
+
+
+def _order_price(name: str, side: str, market: bool):
+    if market and name != "extended":
+        return None
+    # limit: 체결되지 않도록 mid에서 10% 떨어진 가격 (post-only)
+    p = COINS[COIN] * (0.9 if side == "buy" else 1.1)
+    return Decimal(str(round(p, 1))) if name == "extended" else round(p, 1)
+
+
+async def bench_orders(name: str, ex, n: int, concurrency: int, market: bool):
+    symbol = SYMBOLS[name]
+    sem = asyncio.Semaphore(concurrency)
+    errors = 0
+
+    async def one(i):
+        nonlocal errors
+        side = "buy" if i % 2 == 0 else "sell"
+        async with sem:
+            try:
+                await ex.create_order(symbol, side, ORDER_SIZE, price=_order_price(name, side, market))
+            except Exception:
+                errors += 1
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(n)))
+    elapsed = time.perf_counter() - t0
+    try:
+        await ex.cancel_orders(symbol)
+    except Exception:
+        pass
+    return n / elapsed if elapsed else 0.0, errors
+
+
+async def bench_reads(name: str, ex, rounds: int):
+    symbol = SYMBOLS[name]
+    for _ in range(rounds):
+        for method in READ_METHODS:
+            fn = getattr(ex, method)
+            try:
+                await (fn() if method == "get_collateral" else fn(symbol))
+            except Exception:
+                pass
+
+
+def _ws_client(name: str, ex):
+    if name == "backpack":
+        return ex._ws_client
+    if name == "pacifica":
+        return ex.ws_client
+    return None
+
+
+async def bench_ws(name: str, ex, cluster: MockCluster, count: int):
+    """mock -> 래퍼 WS 클라이언트 처리량 (msgs/sec, 수신 handler 완료 기준)"""
+    client = _ws_client(name, ex)
+    if client is None:
+        return None
+    if name == "backpack":
+        # markPrice 스트림 구독 (get_mark_price가 첫 호출 시 구독)
+        await ex.get_mark_price(SYMBOLS[name])
+    venue = cluster.venues[name]
+
+    received = 0
+    target = None
+    done = asyncio.Event()
+    handle = client._handle_message
+
+    async def counting(data):
+        nonlocal received
+        received += 1
+        await handle(data)
+        if target is not None and received >= target:
+            done.set()
+
+    client._handle_message = counting
+    try:
+        sent0 = venue.ws_messages_sent
+        t0 = time.perf_counter()
+        await venue.flood(count)
+        target = venue.ws_messages_sent - sent0
+        if received >= target:
+            done.set()
+        try:
+            await asyncio.wait_for(done.wait(), timeout=max(10.0, count / 500))
+        except asyncio.TimeoutError:
+            pass
+        elapsed = time.perf_counter() - t0
+    finally:
+        del client._handle_message
+    return received / elapsed if elapsed else 0.0, received, target
+
+
+async def close_all(exchanges) -> None:
+    from wrappers.backpack_ws_client import WS_POOL
+    from wrappers.pacifica_ws_client import PACIFICA_WS_POOL
+
+    for ex in exchanges:
+        try:
+            await ex.close()
+        except Exception:
+            pass
+    await WS_POOL.close_all()
+    await PACIFICA_WS_POOL.close_all()
+    await HTTP_POOL.close_all()
+
+
+async def run(args) -> None:
+    RATE_LIMITER.enabled = args.rate_limit
+    META_CACHE.enabled = False  # mock 메타데이터를 디스크 캐시에 남기지 않음
+    venues = [v.strip() for v in args.venues.split(",") if v.strip()]
+
+    cluster = MockCluster(MockConfig(args.latency, args.jitter, args.rate_429), venues=venues)
+    await cluster.start()
+    cluster.point_wrappers()
+
+    exchanges = []
+    results = {}
+    try:
+        for name in venues:
+            try:
+                ex = await build_exchange(name, cluster)
+            except Exception as e:
+                print(f"[{name}] init failed: {e!r}")
+                continue
+            exchanges.append(ex)
+            METRICS.reset()
+            ops, errors = await bench_orders(name, ex, args.orders, args.concurrency, args.market)
+            await bench_reads(name, ex, args.reads)
+            ws = await bench_ws(name, ex, cluster, args.ws_messages) if args.ws_messages else None
+            results[name] = (ops, errors, ws, METRICS.snapshot(), dict(METRICS.fallbacks))
+    finally:
+        await close_all(exchanges)
+        await cluster.stop()
+        SIGN_EXECUTOR.shutdown()
+
+    print(f"\nmock latency {args.latency}ms ± {args.jitter}ms, 429 rate {args.rate_429}, "
+          f"orders {args.orders} x{args.concurrency}, reads {args.reads}, rate limiter {'on' if args.rate_limit else 'off'}")
+    for name, (ops, errors, ws, snap, fallbacks) in results.items():
+        print(f"\n[{name}] create_order: {ops:8.1f} orders/sec ({errors} errors)")
+        if ws:
+            rate, received, target = ws
+            print(f"[{name}] ws: {rate:10.0f} msgs/sec ({received}/{target} handled)")
+        print(f"  {'method':<34} {'n':>6} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+        for key, s in snap.items():
+            print(f"  {key.split('.', 1)[1]:<34} {s['count']:>6} {s['p50_ms']:8.2f} {s['p99_ms']:8.2f} {s['max_ms']:8.2f}")
+        for (_, method), n in fallbacks.items():
+            print(f"  ws->rest fallback {method}: {n}")
+    print("\nmock servers:", cluster.stats())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--venues", default="backpack,pacifica,extended,variational")
+    parser.add_argument("--orders", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--reads", type=int, default=100, help="rounds of get_mark_price/get_position/get_collateral/get_open_orders")
+    parser.add_argument("--ws-messages", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.0, help="mock response latency (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="mock latency stddev (ms)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="probability of a 429 per REST request")
+    parser.add_argument("--market", action="store_true", help="market orders (extended always uses limit)")
+    parser.add_argument("--rate-limit", action="store_true", help="keep wrappers.rate_limiter enabled")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Stark Signing Micro-benchmark (Extended / EdgeX)
+
+주문 1건당 서명 비용 비교:
+- legacy: 요청마다 private key 파싱 + ec_mult(공개키 y) + asset id 파싱 + pedersen 4회 + sign 2회
+- context: StarkSigningContext (공개키/asset pair 해시 사전 계산) -> pedersen 2회 + sign 2회
+
+create_order 1건 = L2 주문 서명 + API 요청 헤더 서명.
+두 방식의 서명 결과가 같은지도 확인한다 (sign은 결정적 nonce라 동일해야 함).
+
+Usage:
+    python benchmarks/bench_stark_signing.py [--rounds 50]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eth_hash.auto import keccak
+from starkware.crypto.signature.fast_pedersen_hash import pedersen_hash
+from starkware.crypto.signature.signature import sign, ec_mult, ALPHA, FIELD_PRIME, EC_GEN
+
+from mpdex.utils.common_stark import K_MODULUS, LIMIT_ORDER_WITH_FEES, StarkSigningContext
+
+PRIVATE_KEY_HEX = "0x3c1e9550e66958296d11b60f8e8e7a7ad990d07fa65d5f7652c4a6c87d4e3cc"
+ACCOUNT_ID = "548793718399582326"
+CONTRACT_ID = "10000001"
+CONTRACT_INFO = {
+    "contract": {
+        "starkExResolution": "0x2540be400",
+        "starkExSyntheticAssetId": "0x4254432d3130000000000000000000",
+    },
+    "meta": {"global": {"starkExCollateralCoin": {"starkExAssetId": "0x2ce625e94458d39dd0bf3b45a843544dd4a14b8169045a3a3d15aa564b936c5"}}},
+    "defaultTakerFeeRate": "0.00038",
+}
+ORDER_ARGS = dict(is_buy=True, amt_synth=10_000_000, amt_coll=1_000_000_000, amt_fee=380_000, l2_nonce=0x1a2b3c4d, expire_ts=490_000)
+REQUEST = ("POST", "/api/v1/private/order/createOrder", {"accountId": ACCOUNT_ID, "contractId": CONTRACT_ID, "price": "100000", "size": "0.001"})
+TIMESTAMP = "1760000000000"
+
+
+def legacy_sign(private_key_hex, account_id, contract_info, is_buy, amt_synth, amt_coll, amt_fee, l2_nonce, expire_ts):
+    """기존 wrappers/extended.py create_order + generate_signature 경로 그대로"""
+    asset_id_synth = int(contract_info['contract']['starkExSyntheticAssetId'], 16)
+    asset_id_coll = int(contract_info['meta']['global']['starkExCollateralCoin']['starkExAssetId'], 16)
+    h = pedersen_hash(asset_id_coll if is_buy else asset_id_synth,
+                      asset_id_synth if is_buy else asset_id_coll)
+    h = pedersen_hash(h, asset_id_coll)
+    packed_0 = (amt_coll if is_buy else amt_synth)
+    packed_0 = (packed_0 << 64) + (amt_synth if is_buy else amt_coll)
+    packed_0 = (packed_0 << 64) + amt_fee
+    packed_0 = (packed_0 << 32) + l2_nonce
+    h = pedersen_hash(h, packed_0)
+    packed_1 = LIMIT_ORDER_WITH_FEES
+    pid = int(account_id)
+    packed_1 = (packed_1 << 64) + pid
+    packed_1 = (packed_1 << 64) + pid
+    packed_1 = (packed_1 << 64) + pid
+    packed_1 = (packed_1 << 32) + expire_ts
+    packed_1 = (packed_1 << 17)
+    h = pedersen_hash(h, packed_1)
+    private_key_int = int(private_key_hex.replace("0x", ""), 16)
+    r, s = sign(h, private_key_int)
+    l2_signature = r.to_bytes(32, "big").hex() + s.to_bytes(32, "big").hex()
+
+    method, path, params = REQUEST
+    message = TIMESTAMP + method + path + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+    msg_hash = int.from_bytes(keccak(message.encode("utf-8")), "big") % K_MODULUS
+    private_key_int = int(private_key_hex.replace("0x", ""), 16)
+    r, s = sign(msg_hash, private_key_int)
+    _, y = ec_mult(private_key_int, EC_GEN, ALPHA, FIELD_PRIME)
+    request_signature = r.to_bytes(32, "big").hex() + s.to_bytes(32, "big").hex() + y.to_bytes(32, "big").hex()
+    return l2_signature, request_signature
+
+
+def context_sign(ctx):
+    c = ctx.contract(CONTRACT_ID, CONTRACT_INFO)
+    l2_signature = ctx.sign_order(c, **ORDER_ARGS)
+    request_signature, _ = ctx.sign_request(*REQUEST, timestamp=TIMESTAMP)
+    return l2_signature, request_signature
+
+
+def _bench(fn, rounds):
+    fn()  # warm-up
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - t0) / rounds * 1e3  # ms/order
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    ctx = StarkSigningContext(PRIVATE_KEY_HEX, ACCOUNT_ID)
+    ctx.contract(CONTRACT_ID, CONTRACT_INFO)
+    setup_ms = (time.perf_counter() - t0) * 1e3
+
+    legacy = lambda: legacy_sign(PRIVATE_KEY_HEX, ACCOUNT_ID, CONTRACT_INFO, **ORDER_ARGS)
+    assert legacy() == context_sign(ctx), "signature mismatch"
+
+    legacy_ms = _bench(legacy, args.rounds)
+    context_ms = _bench(lambda: context_sign(ctx), args.rounds)
+    print(f"rounds: {args.rounds}")
+    print(f"{'path':>8} | {'ms/order':>9}")
+    print(f"{'legacy':>8} | {legacy_ms:9.2f}")
+    print(f"{'context':>8} | {context_ms:9.2f}")
+    print(f"saving: {(legacy_ms - context_ms) / legacy_ms * 100:.1f}% (one-time context setup {setup_ms:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
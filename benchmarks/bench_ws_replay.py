@@ -0,0 +1,76 @@
+"""
+WS Handler Replay Benchmark
+
+wrappers.ws_recorder 로 녹화한 .mpws 파일을 클라이언트 handler(_decode_message -> _handle_message)에
+네트워크 없이 다시 흘려보내 처리량/메시지당 비용을 측정한다.
+
+녹화:
+    MPDEX_WS_RECORD_DIR=./captures python multi_hedge_bot.py     # 또는 client.start_recording(path)
+
+Usage:
+    python benchmarks/bench_ws_replay.py captures/PacificaWSClient-20250101-120000.mpws --client pacifica
+        [--speed 0] [--codec orjson] [--repeat 3] [--profile]
+
+--speed 0 은 최대 속도, 1 은 녹화 시각 그대로, N 은 N배속.
+Backpack depth 프레임은 스냅샷이 없으면 REST 스냅샷 조회를 시작하므로 오프라인에서는 조회 실패 로그가 남는다.
+"""
+import argparse
+import asyncio
+import cProfile
+import os
+import pstats
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wrappers.json_codec import get_codec
+from wrappers.ws_recorder import WSReplayer
+
+
+def make_client(name: str):
+    if name == "backpack":
+        from wrappers.backpack_ws_client import BackpackWSClient
+        return BackpackWSClient()
+    if name == "pacifica":
+        from wrappers.pacifica_ws_client import PacificaWSClient
+        return PacificaWSClient()
+    raise ValueError(f"unknown client {name}")
+
+
+async def run(args) -> None:
+    for i in range(args.repeat):
+        client = make_client(args.client)  # 매 회 새 클라이언트 (빈 캐시에서 시작)
+        if args.codec:
+            client._codec = get_codec(args.codec)
+        replayer = WSReplayer(client, args.path, speed=args.speed)
+        stats = await replayer.run(limit=args.limit)
+        print(
+            f"[{i + 1}/{args.repeat}] {args.client} codec={client._codec.name}: {stats['frames']} frames "
+            f"in {stats['elapsed_s']:.3f}s -> {stats['msgs_per_sec']:,.0f} msgs/sec, "
+            f"{stats['handler_us_per_msg']:.1f} us/msg, {stats['errors']} errors"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path")
+    parser.add_argument("--client", choices=("backpack", "pacifica"), required=True)
+    parser.add_argument("--speed", type=float, default=0.0)
+    parser.add_argument("--codec", default=None, help="override client JSON codec (stdlib/orjson/msgspec)")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--limit", type=int, default=None, help="replay only the first N frames")
+    parser.add_argument("--profile", action="store_true", help="print top handler functions (cProfile)")
+    args = parser.parse_args()
+
+    if not args.profile:
+        asyncio.run(run(args))
+        return
+    prof = cProfile.Profile()
+    prof.enable()
+    asyncio.run(run(args))
+    prof.disable()
+    pstats.Stats(prof).sort_stats("cumulative").print_stats(25)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,793 @@
+"""
+Local Mock Exchange Servers (Backpack / Pacifica / Extended / Variational)
+
+래퍼가 실제로 호출하는 REST 엔드포인트와 WS 채널만 흉내내는 로컬 서버.
+키/잔고 없이 오프라인에서 래퍼 성능(주문 처리량, 메서드별 latency, WS 수신 처리량)을 측정하는 용도.
+
+- REST: aiohttp.web (venue별 app, 127.0.0.1 임의 포트)
+- WS  : websockets 서버 (Backpack, Pacifica)
+- 지연/지터/429: MockConfig (REST 응답과 WS 주문 응답 모두 적용)
+- 주문은 인메모리 원장(MockLedger)에 기록: market은 즉시 체결(포지션 반영), limit은 open order로 남음
+- 서명은 검증하지 않음 (클라이언트 서명 비용은 그대로 측정됨)
+
+사용법:
+    cluster = MockCluster(MockConfig(latency_ms=5, jitter_ms=2, rate_429=0.01))
+    await cluster.start()
+    cluster.point_wrappers()          # 래퍼 모듈/클래스의 URL을 mock 서버로 교체
+    ex = BackpackExchange(api_key, secret); cluster.point_instance("backpack", ex)
+    ...
+    await cluster.stop()
+"""
+import asyncio
+import itertools
+import json
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+import websockets
+from aiohttp import web
+
+# 모든 venue 공통 시장 (venue별 심볼 표기만 다름)
+COINS = {"BTC": 100_000.0, "ETH": 4_000.0, "SOL": 200.0}
+
+
+@dataclass
+class MockConfig:
+    latency_ms: float = 0.0  # 응답 지연 평균
+    jitter_ms: float = 0.0  # 응답 지연 표준편차 (gauss, 0 미만은 0)
+    rate_429: float = 0.0  # REST 요청이 429로 거절될 확률
+    tick_interval: float = 0.1  # WS 시세 push 주기 (초)
+    seed: int = 7
+
+    def delay(self, rng: random.Random) -> float:
+        if self.latency_ms <= 0 and self.jitter_ms <= 0:
+            return 0.0
+        return max(0.0, rng.gauss(self.latency_ms, self.jitter_ms)) / 1000
+
+
+class MockLedger:
+    """venue 하나의 주문/포지션 상태 (coin 단위)"""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.prices = dict(COINS)
+        self.orders: Dict[str, Dict[str, Any]] = {}  # order_id -> order
+        self.positions: Dict[str, Dict[str, float]] = {}  # coin -> {"qty": signed, "entry": float}
+        self._ids = itertools.count(1_000_000)
+        self.order_count = 0
+        self.update_seq = 0
+
+    def step_prices(self) -> None:
+        for coin, p in self.prices.items():
+            self.prices[coin] = round(p * (1 + self.rng.gauss(0, 0.0002)), 2)
+        self.update_seq += 1
+
+    def book(self, coin: str, levels: int = 20, tick: float = 0.1):
+        mid = self.prices[coin]
+        bids = [[round(mid - tick * (i + 1), 2), round(0.5 + i * 0.1, 4)] for i in range(levels)]
+        asks = [[round(mid + tick * (i + 1), 2), round(0.5 + i * 0.1, 4)] for i in range(levels)]
+        return bids, asks
+
+    def place(self, coin: str, side: str, qty: float, price: Optional[float]) -> Dict[str, Any]:
+        """side: buy/sell. price None -> market (즉시 체결)"""
+        self.order_count += 1
+        oid = str(next(self._ids))
+        order = {
+            "id": oid,
+            "coin": coin,
+            "side": side,
+            "qty": qty,
+            "price": price if price is not None else self.prices.get(coin, 0.0),
+            "type": "market" if price is None else "limit",
+            "filled": 0.0,
+            "status": "open",
+            "ts": int(time.time() * 1000),
+        }
+        if price is None:
+            self._fill(order)
+        else:
+            self.orders[oid] = order
+        return order
+
+    def _fill(self, order: Dict[str, Any]) -> None:
+        signed = order["qty"] if order["side"] == "buy" else -order["qty"]
+        pos = self.positions.setdefault(order["coin"], {"qty": 0.0, "entry": 0.0})
+        new_qty = pos["qty"] + signed
+        if pos["qty"] == 0 or (pos["qty"] > 0) == (signed > 0):
+            total = abs(pos["qty"]) + abs(signed)
+            pos["entry"] = (pos["entry"] * abs(pos["qty"]) + order["price"] * abs(signed)) / total if total else 0.0
+        pos["qty"] = round(new_qty, 8)
+        if pos["qty"] == 0:
+            self.positions.pop(order["coin"], None)
+        order["filled"] = order["qty"]
+        order["status"] = "filled"
+
+    def cancel(self, oid: str) -> Optional[Dict[str, Any]]:
+        order = self.orders.pop(str(oid), None)
+        if order:
+            order["status"] = "cancelled"
+        return order
+
+    def open_orders(self, coin: Optional[str] = None) -> List[Dict[str, Any]]:
+        return [o for o in self.orders.values() if coin is None or o["coin"] == coin]
+
+
+def _coin_of(symbol: str) -> str:
+    """BTC_USDC_PERP / BTCUSD / BTC -> BTC"""
+    s = str(symbol or "").upper()
+    for sep in ("_", "-", "/"):
+        s = s.split(sep)[0]
+    return s[:-3] if s.endswith("USD") and s[:-3] in COINS else s
+
+
+class MockVenue:
+    """REST app + (선택) WS 서버 하나"""
+
+    name = ""
+    has_ws = False
+
+    def __init__(self, config: MockConfig):
+        self.config = config
+        self.rng = random.Random(f"{config.seed}:{self.name}")
+        self.ledger = MockLedger(self.rng)
+        self.rest_requests = 0
+        self.rest_429 = 0
+        self.ws_messages_sent = 0
+        self._runner: Optional[web.AppRunner] = None
+        self._ws_server = None
+        self._ws_clients: Set[Any] = set()
+        self._tick_task: Optional[asyncio.Task] = None
+        self.rest_port = 0
+        self.ws_port = 0
+
+    # ---------- REST ----------
+
+    def routes(self, app: web.Application) -> None:
+        raise NotImplementedError
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        self.rest_requests += 1
+        delay = self.config.delay(self.rng)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.config.rate_429 and self.rng.random() < self.config.rate_429:
+            self.rest_429 += 1
+            return web.json_response({"code": "TOO_MANY_REQUESTS", "message": "rate limited"}, status=429,
+                                     headers={"Retry-After": "1"})
+        return await handler(request)
+
+    @staticmethod
+    async def _body(request: web.Request) -> Dict[str, Any]:
+        if not request.can_read_body:
+            return {}
+        try:
+            return await request.json()
+        except (json.JSONDecodeError, ValueError):
+            return {}
+
+    # ---------- WS ----------
+
+    async def on_ws_message(self, ws, msg: Dict[str, Any]) -> None:
+        pass
+
+    async def on_tick(self) -> None:
+        pass
+
+    async def _ws_handler(self, ws, *_):
+        self._ws_clients.add(ws)
+        try:
+            async for raw in ws:
+                try:
+                    msg = json.loads(raw)
+                except (TypeError, ValueError):
+                    continue
+                await self.on_ws_message(ws, msg)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self._ws_clients.discard(ws)
+            self.on_ws_closed(ws)
+
+    def on_ws_closed(self, ws) -> None:
+        pass
+
+    async def ws_send(self, ws, payload: Dict[str, Any]) -> None:
+        try:
+            await ws.send(json.dumps(payload))
+            self.ws_messages_sent += 1
+        except websockets.ConnectionClosed:
+            pass
+
+    async def _tick_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.tick_interval)
+            self.ledger.step_prices()
+            await self.on_tick()
+
+    async def flood(self, count: int) -> float:
+        """WS 처리량 측정용: 시세 프레임 count개를 모든 클라이언트에 연속 전송. Returns 전송 소요 시간(초)"""
+        t0 = time.perf_counter()
+        for _ in range(count):
+            self.ledger.step_prices()
+            await self.on_tick()
+        return time.perf_counter() - t0
+
+    # ---------- lifecycle ----------
+
+    async def start(self) -> None:
+        app = web.Application(middlewares=[self._middleware])
+        self.routes(app)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.rest_port = site._server.sockets[0].getsockname()[1]
+        if self.has_ws:
+            self._ws_server = await websockets.serve(self._ws_handler, "127.0.0.1", 0, ping_interval=None)
+            self.ws_port = next(iter(self._ws_server.sockets)).getsockname()[1]
+            self._tick_task = asyncio.create_task(self._tick_loop())
+
+    async def stop(self) -> None:
+        if self._tick_task:
+            self._tick_task.cancel()
+            self._tick_task = None
+        if self._ws_server is not None:
+            self._ws_server.close()
+            await self._ws_server.wait_closed()
+            self._ws_server = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @property
+    def rest_url(self) -> str:
+        return f"http://127.0.0.1:{self.rest_port}"
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://127.0.0.1:{self.ws_port}"
+
+
+# ==================== Backpack ====================
+
+class BackpackMock(MockVenue):
+    name = "backpack"
+    has_ws = True
+
+    def __init__(self, config: MockConfig):
+        super().__init__(config)
+        self._subs: Dict[Any, Set[str]] = {}
+
+    @staticmethod
+    def symbol(coin: str) -> str:
+        return f"{coin}_USDC_PERP"
+
+    def _market(self, coin: str) -> Dict[str, Any]:
+        return {
+            "symbol": self.symbol(coin),
+            "baseSymbol": coin,
+            "quoteSymbol": "USDC",
+            "marketType": "PERP",
+            "filters": {"price": {"tickSize": "0.1"}, "quantity": {"stepSize": "0.00001"}},
+        }
+
+    def _order(self, o: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": o["id"],
+            "symbol": self.symbol(o["coin"]),
+            "quantity": str(o["qty"]),
+            "executedQuantity": str(o["filled"]),
+            "price": str(o["price"]),
+            "side": "Bid" if o["side"] == "buy" else "Ask",
+            "orderType": "Market" if o["type"] == "market" else "Limit",
+            "status": {"open": "New", "filled": "Filled", "cancelled": "Cancelled"}[o["status"]],
+        }
+
+    def routes(self, app: web.Application) -> None:
+        r = app.router
+        r.add_get("/api/v1/markets", lambda req: web.json_response([self._market(c) for c in COINS]))
+        r.add_get("/api/v1/market", lambda req: web.json_response(self._market(_coin_of(req.query.get("symbol")))))
+        r.add_get("/api/v1/markPrices", self.mark_prices)
+        r.add_get("/api/v1/ticker", lambda req: web.json_response(
+            {"symbol": req.query.get("symbol"), "lastPrice": str(self.ledger.prices[_coin_of(req.query.get("symbol"))])}))
+        r.add_get("/api/v1/depth", self.depth)
+        r.add_post("/api/v1/order", self.create_order)
+        r.add_delete("/api/v1/order", self.cancel_order)
+        r.add_delete("/api/v1/orders", self.cancel_all)
+        r.add_get("/api/v1/orders", self.open_orders)
+        r.add_get("/api/v1/position", self.positions)
+        r.add_get("/api/v1/capital/collateral", lambda req: web.json_response(
+            {"netEquityAvailable": "9000", "assetsValue": "10000"}))
+        r.add_get("/api/v1/capital", lambda req: web.json_response(
+            {"USDC": {"available": "9000", "locked": "1000", "staked": "0"}}))
+
+    async def mark_prices(self, request):
+        coin = _coin_of(request.query.get("symbol"))
+        p = str(self.ledger.prices[coin])
+        return web.json_response([{"symbol": self.symbol(coin), "markPrice": p, "indexPrice": p, "fundingRate": "0.0001"}])
+
+    async def depth(self, request):
+        bids, asks = self.ledger.book(_coin_of(request.query.get("symbol")))
+        return web.json_response({
+            "lastUpdateId": str(self.ledger.update_seq),
+            "bids": [[str(p), str(q)] for p, q in bids],
+            "asks": [[str(p), str(q)] for p, q in asks],
+        })
+
+    async def create_order(self, request):
+        body = await self._body(request)
+        price = body.get("price")
+        order = self.ledger.place(
+            _coin_of(body.get("symbol")),
+            "buy" if body.get("side") == "Bid" else "sell",
+            float(body.get("quantity") or 0),
+            float(price) if price is not None else None,
+        )
+        await self._push_order(order)
+        return web.json_response(self._order(order))
+
+    async def cancel_order(self, request):
+        body = await self._body(request)
+        order = self.ledger.cancel(body.get("orderId"))
+        if order is None:
+            return web.json_response({"code": "RESOURCE_NOT_FOUND", "message": "Order not found"}, status=404)
+        await self._push_order(order)
+        return web.json_response(self._order(order))
+
+    async def cancel_all(self, request):
+        body = await self._body(request)
+        out = []
+        for o in self.ledger.open_orders(_coin_of(body.get("symbol"))):
+            self.ledger.cancel(o["id"])
+            await self._push_order(o)
+            out.append(self._order(o))
+        return web.json_response(out)
+
+    async def open_orders(self, request):
+        coin = _coin_of(request.query.get("symbol")) if request.query.get("symbol") else None
+        return web.json_response([self._order(o) for o in self.ledger.open_orders(coin)])
+
+    async def positions(self, request):
+        return web.json_response([
+            {"symbol": self.symbol(c), "netQuantity": str(p["qty"]), "entryPrice": str(p["entry"]), "pnlRealized": "0"}
+            for c, p in self.ledger.positions.items()
+        ])
+
+    # ---- WS ----
+
+    async def on_ws_message(self, ws, msg):
+        method = msg.get("method")
+        streams = msg.get("params") or []
+        subs = self._subs.setdefault(ws, set())
+        if method == "SUBSCRIBE":
+            subs.update(streams)
+        elif method == "UNSUBSCRIBE":
+            subs.difference_update(streams)
+
+    def on_ws_closed(self, ws):
+        self._subs.pop(ws, None)
+
+    async def on_tick(self):
+        seq = self.ledger.update_seq
+        for ws, subs in list(self._subs.items()):
+            for stream in list(subs):
+                kind, _, sym = stream.partition(".")
+                if kind == "markPrice":
+                    p = str(self.ledger.prices[_coin_of(sym)])
+                    await self.ws_send(ws, {"stream": stream, "data": {
+                        "e": "markPrice", "s": sym, "p": p, "i": p, "f": "0.0001", "n": 0}})
+                elif kind == "depth":
+                    bids, asks = self.ledger.book(_coin_of(sym), levels=1)
+                    await self.ws_send(ws, {"stream": stream, "data": {
+                        "e": "depth", "s": sym, "U": seq, "u": seq,
+                        "b": [[str(p), str(q)] for p, q in bids], "a": [[str(p), str(q)] for p, q in asks]}})
+
+    async def _push_order(self, o: Dict[str, Any]) -> None:
+        event = {"open": "orderAccepted", "filled": "orderFill", "cancelled": "orderCancelled"}[o["status"]]
+        order_msg = {"e": event, "i": o["id"], "s": self.symbol(o["coin"]), "S": "Bid" if o["side"] == "buy" else "Ask",
+                     "q": str(o["qty"]), "z": str(o["filled"]), "p": str(o["price"]), "o": o["type"].upper(), "X": o["status"]}
+        if o["status"] == "filled":
+            order_msg.update({"l": str(o["qty"]), "L": str(o["price"]), "t": int(o["id"]), "m": o["type"] != "market",
+                              "n": "0", "T": o["ts"] * 1000})
+        pos = self.ledger.positions.get(o["coin"])
+        pos_msg = {"e": "positionAdjusted" if pos else "positionClosed", "s": self.symbol(o["coin"]),
+                   "q": pos["qty"] if pos else 0, "B": str(pos["entry"]) if pos else "0", "P": "0", "p": "0"}
+        for ws, subs in list(self._subs.items()):
+            if "account.orderUpdate" in subs:
+                await self.ws_send(ws, {"stream": "account.orderUpdate", "data": order_msg})
+            if o["status"] == "filled" and "account.positionUpdate" in subs:
+                await self.ws_send(ws, {"stream": "account.positionUpdate", "data": pos_msg})
+
+
+# ==================== Pacifica ====================
+
+class PacificaMock(MockVenue):
+    name = "pacifica"
+    has_ws = True
+
+    def __init__(self, config: MockConfig):
+        super().__init__(config)
+        self._subs: Dict[Any, Set[str]] = {}
+
+    def _prices(self) -> List[Dict[str, Any]]:
+        ts = int(time.time() * 1000)
+        return [{"symbol": c, "mark": str(p), "mid": str(p), "oracle": str(p), "funding": "0.0001", "timestamp": ts}
+                for c, p in self.ledger.prices.items()]
+
+    def _wire_positions(self):
+        return [{"s": c, "d": "bid" if p["qty"] > 0 else "ask", "a": str(abs(p["qty"])), "p": str(p["entry"]), "i": False}
+                for c, p in self.ledger.positions.items()]
+
+    def _wire_orders(self):
+        return [{"i": int(o["id"]), "s": o["coin"], "d": "bid" if o["side"] == "buy" else "ask", "p": str(o["price"]),
+                 "a": str(o["qty"]), "f": str(o["filled"]), "c": "0", "t": o["ts"], "ot": o["type"], "ro": False}
+                for o in self.ledger.open_orders()]
+
+    def _wire_trade(self, o):
+        trade_side = "open_long" if o["side"] == "buy" else "open_short"
+        return {"h": int(o["id"]), "i": int(o["id"]), "s": o["coin"], "p": str(o["price"]), "a": str(o["qty"]),
+                "te": "fulfill_taker" if o["type"] == "market" else "fulfill_maker", "ts": trade_side, "f": "0", "t": o["ts"]}
+
+    def _account_info(self):
+        return {"ae": "10000", "as": "9000", "aw": "9000", "b": "10000", "pc": len(self.ledger.positions),
+                "oc": len(self.ledger.orders), "t": int(time.time() * 1000)}
+
+    def routes(self, app: web.Application) -> None:
+        r = app.router
+        r.add_get("/api/v1/info", lambda req: web.json_response({"success": True, "data": [
+            {"symbol": c, "tick_size": "0.1", "lot_size": "0.00001", "min_order_size": "10", "max_order_size": "1000000",
+             "max_leverage": 50, "isolated_only": False} for c in COINS]}))
+        r.add_get("/api/v1/info/prices", lambda req: web.json_response({"success": True, "data": self._prices()}))
+        r.add_post("/api/v1/account/leverage", lambda req: web.json_response({"success": True}))
+        r.add_post("/api/v1/orders/create_market", self.create_order)
+        r.add_post("/api/v1/orders/create", self.create_order)
+        r.add_post("/api/v1/orders/cancel", self.cancel_order)
+        r.add_get("/api/v1/positions", lambda req: web.json_response({"success": True, "data": [
+            {"symbol": c, "side": "bid" if p["qty"] > 0 else "ask", "amount": str(abs(p["qty"])), "entry_price": str(p["entry"])}
+            for c, p in self.ledger.positions.items()]}))
+        r.add_get("/api/v1/account", lambda req: web.json_response({"success": True, "data": {
+            "account_equity": "10000", "available_to_spend": "9000"}}))
+        r.add_get("/api/v1/orders", lambda req: web.json_response({"success": True, "data": [
+            {"order_id": int(o["id"]), "symbol": o["coin"], "side": "bid" if o["side"] == "buy" else "ask",
+             "price": str(o["price"]), "initial_amount": str(o["qty"]), "filled_amount": str(o["filled"]), "order_type": o["type"]}
+            for o in self.ledger.open_orders()]}))
+
+    def _place(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        price = p.get("price")
+        return self.ledger.place(
+            _coin_of(p.get("symbol")),
+            "buy" if p.get("side") == "bid" else "sell",
+            float(p.get("amount") or 0),
+            float(price) if price is not None else None,
+        )
+
+    async def create_order(self, request):
+        order = self._place(await self._body(request))
+        await self._push_account()
+        await self._push_fill(order)
+        return web.json_response({"success": True, "data": {"order_id": int(order["id"])}})
+
+    async def cancel_order(self, request):
+        body = await self._body(request)
+        ok = self.ledger.cancel(body.get("order_id")) is not None
+        await self._push_account()
+        return web.json_response({"success": ok})
+
+    # ---- WS ----
+
+    async def on_ws_message(self, ws, msg):
+        method = msg.get("method")
+        if method == "ping":
+            await self.ws_send(ws, {"channel": "pong"})
+            return
+        if method in ("subscribe", "unsubscribe"):
+            params = msg.get("params") or {}
+            key = params.get("source", "")
+            if key == "book":
+                key = f"book:{str(params.get('symbol', '')).upper()}"
+            subs = self._subs.setdefault(ws, set())
+            if method == "subscribe":
+                subs.add(key)
+                await self.ws_send(ws, {"channel": "subscribe", "data": params})
+                await self._push_snapshot(ws, key)
+            else:
+                subs.discard(key)
+            return
+        if "id" in msg and isinstance(msg.get("params"), dict):
+            await self._handle_trading(ws, msg)
+
+    def on_ws_closed(self, ws):
+        self._subs.pop(ws, None)
+
+    async def _handle_trading(self, ws, msg):
+        req_type, payload = next(iter(msg["params"].items()))
+        delay = self.config.delay(self.rng)
+        if delay:
+            await asyncio.sleep(delay)
+        data: Dict[str, Any] = {}
+        order = None
+        if req_type in ("create_order", "create_market_order"):
+            order = self._place(payload)
+            data = {"i": int(order["id"]), "I": payload.get("client_order_id"), "s": order["coin"]}
+        elif req_type == "cancel_order":
+            self.ledger.cancel(payload.get("order_id"))
+        elif req_type == "cancel_all_orders":
+            for o in self.ledger.open_orders():
+                self.ledger.cancel(o["id"])
+            data = {"cancelled_count": 0}
+        await self.ws_send(ws, {"id": msg["id"], "code": 200, "type": req_type, "data": data, "t": int(time.time() * 1000)})
+        await self._push_account()
+        if order is not None:
+            await self._push_fill(order)
+
+    async def _push_snapshot(self, ws, key: str) -> None:
+        if key == "prices":
+            await self.ws_send(ws, {"channel": "prices", "data": self._prices()})
+        elif key.startswith("book:"):
+            await self._push_book(ws, key[5:])
+        elif key == "account_info":
+            await self.ws_send(ws, {"channel": "account_info", "data": self._account_info()})
+        elif key == "account_positions":
+            await self.ws_send(ws, {"channel": "account_positions", "data": self._wire_positions()})
+        elif key == "account_orders":
+            await self.ws_send(ws, {"channel": "account_orders", "data": self._wire_orders()})
+
+    async def _push_book(self, ws, coin: str) -> None:
+        if coin not in self.ledger.prices:
+            return
+        bids, asks = self.ledger.book(coin, levels=10)
+        await self.ws_send(ws, {"channel": "book", "data": {
+            "s": coin, "t": int(time.time() * 1000),
+            "l": [[{"p": str(p), "a": str(q), "n": 1} for p, q in bids], [{"p": str(p), "a": str(q), "n": 1} for p, q in asks]],
+        }})
+
+    async def _push_account(self) -> None:
+        for ws, subs in list(self._subs.items()):
+            for key in ("account_positions", "account_orders", "account_info"):
+                if key in subs:
+                    await self._push_snapshot(ws, key)
+
+    async def _push_fill(self, order: Dict[str, Any]) -> None:
+        if order["status"] != "filled":
+            return
+        for ws, subs in list(self._subs.items()):
+            if "account_trades" in subs:
+                await self.ws_send(ws, {"channel": "account_trades", "data": [self._wire_trade(order)]})
+
+    async def on_tick(self):
+        for ws, subs in list(self._subs.items()):
+            if "prices" in subs:
+                await self.ws_send(ws, {"channel": "prices", "data": self._prices()})
+            for key in subs:
+                if key.startswith("book:"):
+                    await self._push_book(ws, key[5:])
+
+
+# ==================== Extended ====================
+
+class ExtendedMock(MockVenue):
+    name = "extended"
+
+    CONTRACT_IDS = {c: str(10000001 + i) for i, c in enumerate(COINS)}
+
+    def _coin(self, contract_id: str) -> Optional[str]:
+        for c, cid in self.CONTRACT_IDS.items():
+            if cid == str(contract_id):
+                return c
+        return None
+
+    def _meta(self) -> Dict[str, Any]:
+        return {
+            "global": {"starkExCollateralCoin": {
+                "starkExAssetId": "0x2ce625e94458d39dd0bf3b45a843544dd4a14b8169045a3a3d15aa564b936c5"}},
+            "contractList": [{
+                "contractId": cid,
+                "contractName": f"{c}USD",
+                "quoteCoinId": "1000",
+                "tickSize": "0.1",
+                "stepSize": "0.001",
+                "minOrderSize": "0.001",
+                "maxOrderSize": "100",
+                "defaultTakerFeeRate": "0.00038",
+                "starkExResolution": "0x2540be400",
+                "starkExSyntheticAssetId": "0x" + f"{c}-10".encode().hex().ljust(30, "0"),
+            } for c, cid in self.CONTRACT_IDS.items()],
+            "symbolList": [],
+        }
+
+    def routes(self, app: web.Application) -> None:
+        r = app.router
+        r.add_get("/api/v1/public/meta/getMetaData", lambda req: web.json_response({"code": "SUCCESS", "data": self._meta()}))
+        r.add_get("/api/v1/public/quote/getTicker", self.ticker)
+        r.add_post("/api/v1/private/order/createOrder", self.create_order)
+        r.add_get("/api/v1/private/account/getAccountAsset", self.account_asset)
+        r.add_get("/api/v1/private/order/getActiveOrderPage", self.active_orders)
+        r.add_post("/api/v1/private/order/cancelOrderById", self.cancel_orders)
+
+    async def ticker(self, request):
+        p = str(self.ledger.prices[self._coin(request.query.get("contractId"))])
+        return web.json_response({"code": "SUCCESS", "data": [{"lastPrice": p, "oraclePrice": p, "indexPrice": p}]})
+
+    async def create_order(self, request):
+        body = await self._body(request)
+        is_market = str(body.get("type")).upper() == "MARKET"
+        order = self.ledger.place(
+            self._coin(body.get("contractId")),
+            "buy" if str(body.get("side")).upper() == "BUY" else "sell",
+            float(body.get("size") or 0),
+            None if is_market else float(body.get("price") or 0),
+        )
+        return web.json_response({"code": "SUCCESS", "data": {"orderId": order["id"]}})
+
+    async def account_asset(self, request):
+        positions = [(self.CONTRACT_IDS[c], p) for c, p in self.ledger.positions.items()]
+        return web.json_response({"code": "SUCCESS", "data": {
+            "positionList": [{"contractId": cid, "openSize": str(p["qty"])} for cid, p in positions],
+            "positionAssetList": [{"contractId": cid, "avgEntryPrice": str(p["entry"]), "unrealizePnl": "0"}
+                                  for cid, p in positions],
+            "collateralAssetModelList": [{"coinId": "1000", "availableAmount": "9000", "totalEquity": "10000"}],
+        }})
+
+    async def active_orders(self, request):
+        wanted = request.query.get("filterContractIdList")
+        coin = self._coin(wanted) if wanted else None
+        return web.json_response({"code": "SUCCESS", "data": {"dataList": [
+            {"id": o["id"], "contractId": self.CONTRACT_IDS[o["coin"]], "size": str(o["qty"]), "price": str(o["price"]),
+             "side": o["side"].upper(), "type": "LIMIT", "status": "OPEN"}
+            for o in self.ledger.open_orders(coin)]}})
+
+    async def cancel_orders(self, request):
+        body = await self._body(request)
+        result = {str(oid): "SUCCESS" if self.ledger.cancel(oid) else "UNKNOWN_ORDER" for oid in body.get("orderIdList") or []}
+        return web.json_response({"code": "SUCCESS", "data": {"cancelResultMap": result}})
+
+
+# ==================== Variational ====================
+
+class VariationalMock(MockVenue):
+    name = "variational"
+
+    def __init__(self, config: MockConfig):
+        super().__init__(config)
+        self._quotes: Dict[str, Dict[str, Any]] = {}  # quote_id -> {"coin", "qty"}
+        self._quote_ids = itertools.count(1)
+
+    @staticmethod
+    def _instrument(coin: str) -> Dict[str, Any]:
+        return {"instrument_type": "perpetual_future", "underlying": coin, "funding_interval_s": 3600,
+                "settlement_asset": "USDC"}
+
+    def routes(self, app: web.Application) -> None:
+        r = app.router
+        r.add_get("/api/settlement_pools/details", lambda req: web.json_response(
+            {"balance": "10000", "max_withdrawable_amount": "9000"}))
+        r.add_get("/api/metadata/supported_assets", lambda req: web.json_response({
+            c: [{"asset": c, "has_perp": True, "is_close_only_mode": False, "price": str(p)}]
+            for c, p in self.ledger.prices.items()}))
+        r.add_post("/api/quotes/indicative", self.indicative)
+        r.add_post("/api/orders/new/market", self.market_order)
+        r.add_post("/api/orders/new/limit", self.limit_order)
+        r.add_get("/api/positions", lambda req: web.json_response([
+            {"position_info": {"instrument": self._instrument(c), "qty": str(p["qty"]), "avg_entry_price": str(p["entry"])}}
+            for c, p in self.ledger.positions.items()]))
+        r.add_get("/api/orders/v2", lambda req: web.json_response({"result": [
+            {"order_id": o["id"], "rfq_id": o["id"], "instrument": self._instrument(o["coin"]), "order_type": "limit",
+             "side": o["side"], "status": "pending", "qty": str(o["qty"]), "limit_price": str(o["price"])}
+            for o in self.ledger.open_orders()]}))
+        r.add_post("/api/orders/cancel", self.cancel)
+
+    async def indicative(self, request):
+        body = await self._body(request)
+        coin = _coin_of((body.get("instrument") or {}).get("underlying"))
+        p = self.ledger.prices[coin]
+        quote_id = f"q-{next(self._quote_ids)}"
+        self._quotes[quote_id] = {"coin": coin, "qty": float(body.get("qty") or 0)}
+        return web.json_response({
+            "instrument": self._instrument(coin),
+            "qty": body.get("qty"),
+            "bid": str(round(p * 0.9999, 2)),
+            "ask": str(round(p * 1.0001, 2)),
+            "mark_price": str(p),
+            "index_price": str(p),
+            "quote_id": quote_id,
+            "margin_requirements": {},
+            "qty_limits": {"bid": {"min_qty": "0.00001"}, "ask": {"min_qty": "0.00001"}},
+        })
+
+    async def market_order(self, request):
+        body = await self._body(request)
+        quote = self._quotes.pop(body.get("quote_id"), None)
+        if quote is None:
+            return web.json_response({"error": "quote expired"}, status=400)
+        order = self.ledger.place(quote["coin"], body.get("side", "buy"), quote["qty"], None)
+        return web.json_response({"rfq_id": order["id"]})
+
+    async def limit_order(self, request):
+        body = await self._body(request)
+        order = self.ledger.place(_coin_of((body.get("instrument") or {}).get("underlying")), body.get("side", "buy"),
+                                  float(body.get("qty") or 0), float(body.get("limit_price") or 0))
+        return web.json_response({"rfq_id": order["id"]})
+
+    async def cancel(self, request):
+        body = await self._body(request)
+        self.ledger.cancel(body.get("rfq_id"))
+        return web.json_response({})
+
+
+# ==================== Cluster ====================
+
+VENUES = {"backpack": BackpackMock, "pacifica": PacificaMock, "extended": ExtendedMock, "variational": VariationalMock}
+
+
+class MockCluster:
+    def __init__(self, config: Optional[MockConfig] = None, venues=tuple(VENUES)):
+        self.config = config or MockConfig()
+        self.venues: Dict[str, MockVenue] = {name: VENUES[name](self.config) for name in venues}
+
+    async def start(self) -> "MockCluster":
+        for v in self.venues.values():
+            await v.start()
+        return self
+
+    async def stop(self) -> None:
+        for v in self.venues.values():
+            await v.stop()
+
+    def point_wrappers(self) -> None:
+        """모듈/클래스 수준 URL 상수를 mock 서버로 교체 (인스턴스 URL은 point_instance)"""
+        if "backpack" in self.venues:
+            from wrappers import backpack_ws_client
+            v = self.venues["backpack"]
+            backpack_ws_client.BACKPACK_REST_URL = f"{v.rest_url}/api/v1"
+            backpack_ws_client.BackpackWSClient.WS_URL = v.ws_url
+        if "pacifica" in self.venues:
+            from wrappers import pacifica, pacifica_ws_client
+            v = self.venues["pacifica"]
+            pacifica.BASE_URL = f"{v.rest_url}/api/v1"
+            pacifica.WS_URL = v.ws_url
+            pacifica_ws_client.PacificaWSClient.WS_URL = v.ws_url
+        if "variational" in self.venues:
+            from wrappers import variational
+            variational.BASE_URL = self.venues["variational"].rest_url
+
+    def point_instance(self, name: str, ex) -> None:
+        """인스턴스 속성으로 URL을 들고 있는 래퍼 (Backpack, Extended)"""
+        v = self.venues[name]
+        if name == "backpack":
+            ex.BASE_URL = f"{v.rest_url}/api/v1"
+        elif name == "extended":
+            ex.base_url = v.rest_url
+            ex.base_url_spot = v.rest_url
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            name: {"rest_requests": v.rest_requests, "rest_429": v.rest_429, "ws_sent": v.ws_messages_sent,
+                   "orders": v.ledger.order_count}
+            for name, v in self.venues.items()
+        }
+
+
+async def _serve_forever(args) -> None:
+    cluster = await MockCluster(MockConfig(args.latency, args.jitter, args.rate_429)).start()
+    for name, v in cluster.venues.items():
+        print(f"{name:>12}: rest {v.rest_url}" + (f"  ws {v.ws_url}" if v.has_ws else ""))
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await cluster.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="run mock exchange servers until interrupted")
+    parser.add_argument("--latency", type=float, default=0.0, help="mean response latency (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="latency stddev (ms)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="probability of 429 per REST request")
+    try:
+        asyncio.run(_serve_forever(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -1,4 +1,8 @@
+import asyncio
 import importlib  # [ADDED]
+import logging
+
+logger = logging.getLogger(__name__)
 
 def _load(exchange_platform: str):  # [ADDED] 필요한 경우에만 모듈 로드
     mapping = {
@@ -16,11 +20,27 @@ def _load(exchange_platform: str):  # [ADDED] 필요한 경우에만 모듈 로
     module = importlib.import_module(mod)
     return getattr(module, cls)
 
+# 공유 HTTP 세션 풀(wrappers.http_pool)을 사용하는 REST 래퍼
+HTTP_POOLED_EXCHANGES = {"backpack", "pacifica", "extended"}
+
 async def create_exchange(exchange_platform: str, key_params=None):  # [MODIFIED] 지연 로드 사용
     if key_params is None:
         raise ValueError(f"[ERROR] key_params is required for exchange: {exchange_platform}")
     Ex = _load(exchange_platform)  # [ADDED]
-    
+
+    if exchange_platform not in HTTP_POOLED_EXCHANGES:
+        return await _create(exchange_platform, Ex, key_params)
+
+    # keep-alive 세션 참조를 하나 잡아 래퍼에 주입 (래퍼 close()에서 release)
+    from wrappers.http_pool import HTTP_POOL
+    http_session = HTTP_POOL.acquire()
+    try:
+        return await _create(exchange_platform, Ex, key_params, http_session=http_session)
+    except Exception:
+        await HTTP_POOL.release(http_session)
+        raise
+
+async def _create(exchange_platform: str, Ex, key_params, http_session=None):
     if exchange_platform == "grvt":
         return await Ex(
             key_params.api_key, 
@@ -31,7 +51,8 @@ async def create_exchange(exchange_platform: str, key_params=None):  # [MODIFIED
     elif exchange_platform == "backpack":
         return await Ex(
             key_params.api_key, 
-            key_params.secret_key
+            key_params.secret_key,
+            http_session=http_session
             ).init()
     
     elif exchange_platform == "variational":
@@ -45,13 +66,15 @@ async def create_exchange(exchange_platform: str, key_params=None):  # [MODIFIED
         return await Ex(
             key_params.public_key, 
             key_params.agent_public_key, 
-            key_params.agent_private_key
+            key_params.agent_private_key,
+            http_session=http_session
             ).init()
     
     elif exchange_platform == "extended":
         return await Ex(
             key_params.account_id, 
-            key_params.private_key
+            key_params.private_key,
+            http_session=http_session
             ).init()
     
     elif exchange_platform == "lighter":
@@ -65,6 +88,130 @@ async def create_exchange(exchange_platform: str, key_params=None):  # [MODIFIED
     else:
         raise ValueError(f"Unsupported exchange: {exchange_platform}")
 
+# create_exchanges 기본 동시 초기화 수 (메타데이터 다운로드 + WS 연결/로그인이 동시에 몰리지 않도록 제한)
+CREATE_CONCURRENCY = 4
+
+async def create_exchanges(configs, max_concurrency: int = CREATE_CONCURRENCY):
+    """
+    여러 거래소를 동시에 초기화 (bounded parallelism).
+    configs: {exchange_platform: key_params}
+    Returns: (instances, errors)
+        instances: {name: exchange instance} - 초기화 성공한 거래소만
+        errors:    {name: Exception}         - 실패한 거래소 (부분 기동 허용, 처리 여부는 호출자가 결정)
+    """
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _one(name, key_params):
+        async with sem:
+            return await create_exchange(name, key_params)
+
+    names = list(configs)
+    results = await asyncio.gather(*(_one(n, configs[n]) for n in names), return_exceptions=True)
+
+    instances, errors = {}, {}
+    for name, res in zip(names, results):
+        if isinstance(res, BaseException):
+            if not isinstance(res, Exception):
+                raise res  # CancelledError / KeyboardInterrupt 는 그대로 전파
+            errors[name] = res
+        else:
+            instances[name] = res
+    return instances, errors
+
+class ExchangeRegistry:
+    """
+    장기 실행 루프용 거래소 인스턴스 레지스트리.
+    각 거래소를 한 번만 초기화해서 라운드마다 재사용하고, 헬스체크에 실패한 인스턴스만 재생성한다.
+
+    사용법:
+        registry = ExchangeRegistry({"backpack": BACKPACK_KEY, "grvt": GRVT_KEY})
+        exchanges = await registry.ensure_all()   # 최초 1회 생성 (실패한 거래소는 제외, registry.errors에 기록)
+        if registry.errors: ...                   # 일부 거래소 누락 -> 양방향 주문 금지 (호출자가 판단)
+        await registry.health_check()             # 라운드 사이: probe 실패 시 재생성
+        await registry.close_all()                # 종료 시
+    """
+
+    HEALTH_TIMEOUT = 10.0
+
+    def __init__(self, key_params_by_name):
+        self.key_params_by_name = dict(key_params_by_name)
+        self.instances = {}  # name -> exchange instance
+        self.rebuild_count = {}  # name -> 재생성 횟수
+        self.errors = {}  # name -> 마지막 생성 실패 Exception (현재 누락된 거래소만)
+
+    async def get(self, name):
+        """인스턴스 반환 (없으면 생성)"""
+        ex = self.instances.get(name)
+        if ex is None:
+            ex = await create_exchange(name, self.key_params_by_name[name])
+            self.instances[name] = ex
+        return ex
+
+    async def ensure_all(self):
+        """
+        등록된 모든 거래소 인스턴스 확보 (이미 있는 것은 재사용).
+        생성 실패한 거래소는 제외하고 self.errors에 기록 -> 다음 호출 때 재시도.
+        반환 dict에 빠진 거래소가 있을 수 있으므로 페어 주문 전에는 self.errors를 확인할 것.
+        """
+        missing = {n: k for n, k in self.key_params_by_name.items() if n not in self.instances}
+        self.errors = {}
+        if missing:
+            created, errors = await create_exchanges(missing)
+            self.instances.update(created)
+            self.errors = dict(errors)
+            for name, e in errors.items():
+                logger.error(f"[registry] {name} init failed: {e}")
+        return dict(self.instances)
+
+    async def rebuild(self, name):
+        """기존 인스턴스를 닫고 새로 생성"""
+        old = self.instances.pop(name, None)
+        if old is not None:
+            try:
+                await old.close()
+            except Exception as e:
+                logger.warning(f"[registry] {name} close failed: {e}")
+        self.rebuild_count[name] = self.rebuild_count.get(name, 0) + 1
+        return await self.get(name)
+
+    async def _probe(self, name, ex, probe, timeout):
+        try:
+            await asyncio.wait_for(probe(ex), timeout=timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"[registry] {name} health check failed: {e}")
+            return False
+
+    async def health_check(self, probe=None, timeout=None):
+        """
+        모든 인스턴스에 probe(ex)를 동시 실행 (기본: get_collateral), 실패한 인스턴스만 재생성.
+        Returns: 재생성한 거래소 이름 목록
+        """
+        probe = probe or (lambda ex: ex.get_collateral())
+        timeout = timeout or self.HEALTH_TIMEOUT
+        names = list(self.instances)
+        oks = await asyncio.gather(*(self._probe(n, self.instances[n], probe, timeout) for n in names))
+
+        rebuilt = []
+        for name, ok in zip(names, oks):
+            if ok:
+                continue
+            try:
+                await self.rebuild(name)
+                rebuilt.append(name)
+            except Exception as e:
+                logger.error(f"[registry] {name} rebuild failed: {e}")
+        await self.ensure_all()
+        return rebuilt
+
+    async def close_all(self):
+        for name, ex in list(self.instances.items()):
+            try:
+                await ex.close()
+            except Exception as e:
+                logger.warning(f"[registry] {name} close failed: {e}")
+        self.instances.clear()
+
 SYMBOL_FORMATS = {
     "grvt":     lambda c, q=None: f"{c}_USDT_Perp",
     "backpack": lambda c, q=None: f"{c}_USDC_PERP",
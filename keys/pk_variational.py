@@ -9,4 +9,5 @@ class VariationalKEY:
 VARIATIONAL_KEY = VariationalKEY(
     evm_wallet_address = '', # required, your evm address
     session_cookies = {"vr_token":""},  # aplication 탭 까보면 있음.
+    evm_private_key = '', # required, 로그인 서명용
     )
@@ -5,7 +5,7 @@ import random
 from datetime import datetime
 import json
 from dataclasses import dataclass
-from exchange_factory import create_exchange, symbol_create
+from exchange_factory import ExchangeRegistry, symbol_create
 from keys.pk_backpack import BACKPACK_KEY
 from keys.pk_edgex import EDGEX_KEY
 from keys.pk_grvt import GRVT_KEY
@@ -217,6 +217,16 @@ def select_next_module(positions):
     
 
 async def main():
+    # 거래소는 한 번만 초기화해서 라운드마다 재사용 (auto 모드에서 매 라운드 재생성/소켓 누수 방지)
+    registry = ExchangeRegistry({
+        name: cfg['key_params'] for name, cfg in exchange_configs.items() if cfg['create']
+    })
+    try:
+        await run(registry)
+    finally:
+        await registry.close_all()
+
+async def run(registry):
     positions = None
     run_forever = False
     if args.module == 'auto':
@@ -250,10 +260,21 @@ async def main():
         #if module_select == 'order' or module_select == 'reduce':
         #    continue
         
-        exchanges = {
-            name: await create_exchange(name, key_params=cfg['key_params'])
-            for name, cfg in exchange_configs.items() if cfg['create']
-        }
+        if run_cnt > 1:
+            # 라운드 사이 헬스체크: 응답 없는 인스턴스만 재생성
+            rebuilt = await registry.health_check()
+            if rebuilt:
+                print(f"[REBUILT] {', '.join(rebuilt)}")
+        exchanges = await registry.ensure_all()
+        if registry.errors:
+            # 일부 거래소 누락 상태에서 롱/숏 페어 주문을 보내면 한쪽 다리만 체결됨 -> 라운드 중단
+            for name, e in registry.errors.items():
+                print(f"[INIT FAILED] {name}: {e}")
+            if not run_forever:
+                raise RuntimeError(f"Exchange init failed: {', '.join(registry.errors)}")
+            print(f"[SKIP ROUND] missing exchanges: {', '.join(registry.errors)}")
+            await asyncio.sleep(random.uniform(AUTO_RUN_TIMER[0], AUTO_RUN_TIMER[1]))
+            continue
 
         open_orders = {}
         positions = {}
@@ -330,10 +351,6 @@ async def main():
             
             await asyncio.sleep(SLEEP_BETWEEN_CALLS)
 
-        for name, ex in exchanges.items():
-            if exchange_configs[name]['need_close']:
-                await ex.close()
-        
         if run_forever == False:
             break
         print('run complete', run_cnt)
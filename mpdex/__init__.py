@@ -7,6 +7,11 @@ async def create_exchange(exchange_name: str, key_params=None):
     from exchange_factory import create_exchange as _create_exchange
     return await _create_exchange(exchange_name, key_params)
 
+async def create_exchanges(configs, max_concurrency: int = 4):
+    # comment: 여러 거래소 동시 초기화 -> (instances, errors)
+    from exchange_factory import create_exchanges as _create_exchanges
+    return await _create_exchanges(configs, max_concurrency)
+
 def symbol_create(exchange_name: str, coin: str):
     from exchange_factory import symbol_create as _symbol_create
     return _symbol_create(exchange_name, coin)
@@ -36,7 +41,7 @@ def __getattr__(name):
 
 __all__ = [  # 공개 심볼 명시
     "MultiPerpDex", "MultiPerpDexMixin",
-    "create_exchange", "symbol_create",
+    "create_exchange", "create_exchanges", "symbol_create",
     "LighterExchange", "BackpackExchange", "EdgexExchange", "GrvtExchange", "ParadexExchange", "TreadfiHlExchange",
     "VariationalExchange", "PacificaExchange", "HyperliquidExchange", "StandXExchange"
 ]
\ No newline at end of file
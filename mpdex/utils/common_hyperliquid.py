@@ -84,55 +84,126 @@ _HL_SHARED_CACHE = {
 }
 _HL_INIT_LOCK = asyncio.Lock()
 
+_HL_META_CACHE_KEY = f"hyperliquid:{BASE_URL}/info"
+
+def _empty_hl_cache() -> dict:
+    return {
+        "inited": False,
+        "dex_list": ["hl"],
+        "spot_index_to_name": {},
+        "spot_name_to_index": {},
+        "spot_asset_index_to_pair": {},
+        "spot_asset_pair_to_index": {},
+        "spot_asset_index_to_bq": {},
+        "spot_token_sz_decimals": {},
+        "perp_metas_raw": [],
+        "perp_asset_map": {},
+    }
+
+def _dump_hl_cache(cache: dict) -> dict:
+    """디스크 캐시용 JSON 형태 (int key -> str, tuple -> list)"""
+    return {
+        "dex_list": list(cache["dex_list"]),
+        "spot_index_to_name": {str(k): v for k, v in cache["spot_index_to_name"].items()},
+        "spot_name_to_index": dict(cache["spot_name_to_index"]),
+        "spot_asset_index_to_pair": {str(k): v for k, v in cache["spot_asset_index_to_pair"].items()},
+        "spot_asset_index_to_bq": {str(k): list(v) for k, v in cache["spot_asset_index_to_bq"].items()},
+        "spot_token_sz_decimals": dict(cache["spot_token_sz_decimals"]),
+        "perp_metas_raw": list(cache["perp_metas_raw"]),
+        "perp_asset_map": {k: list(v) for k, v in cache["perp_asset_map"].items()},
+    }
+
+def _restore_hl_cache(data: dict) -> None:
+    """
+    _dump_hl_cache 결과를 _HL_SHARED_CACHE에 in-place 반영.
+    래퍼 인스턴스들이 내부 dict/list 참조를 들고 있으므로 객체를 교체하지 않고 clear + update 한다.
+    """
+    c = _HL_SHARED_CACHE
+    c["dex_list"][:] = data.get("dex_list") or ["hl"]
+
+    c["spot_index_to_name"].clear()
+    c["spot_index_to_name"].update({int(k): v for k, v in data["spot_index_to_name"].items()})
+    c["spot_name_to_index"].clear()
+    c["spot_name_to_index"].update(data["spot_name_to_index"])
+    c["spot_asset_index_to_pair"].clear()
+    c["spot_asset_index_to_pair"].update({int(k): v for k, v in data["spot_asset_index_to_pair"].items()})
+    c["spot_asset_pair_to_index"].clear()
+    c["spot_asset_pair_to_index"].update({v: k for k, v in c["spot_asset_index_to_pair"].items()})
+    c["spot_asset_index_to_bq"].clear()
+    c["spot_asset_index_to_bq"].update({int(k): tuple(v) for k, v in data["spot_asset_index_to_bq"].items()})
+    c["spot_token_sz_decimals"].clear()
+    c["spot_token_sz_decimals"].update(data["spot_token_sz_decimals"])
+
+    c["perp_metas_raw"][:] = data["perp_metas_raw"]
+    c["perp_asset_map"].clear()
+    c["perp_asset_map"].update({k: tuple(v) for k, v in data["perp_asset_map"].items()})
+    c["inited"] = True
+
+async def _fetch_hl_meta(session: Optional[aiohttp.ClientSession] = None) -> dict:
+    """
+    dex_list / spot / perp 메타를 새 dict에 조회해서 _dump_hl_cache 형태로 반환.
+    session이 없거나 닫혀있으면(백그라운드 재조회) 임시 세션을 생성/종료.
+    """
+    own_session = session is None or session.closed
+    if own_session:
+        from wrappers.http_pool import rate_limit_trace_config
+        session = aiohttp.ClientSession(trace_configs=[rate_limit_trace_config()])
+
+    fresh = _empty_hl_cache()
+    try:
+        # 1) dex_list
+        fresh["dex_list"] = await get_dex_list(session) or ["hl"]
+
+        # 2) spot meta
+        await init_spot_token_map(
+            session,
+            fresh["spot_index_to_name"],
+            fresh["spot_name_to_index"],
+            fresh["spot_asset_index_to_pair"],
+            fresh["spot_asset_index_to_bq"],
+            fresh["spot_token_sz_decimals"],
+        )
+
+        # 3) perp meta
+        await init_perp_meta_cache(
+            session,
+            fresh["perp_metas_raw"],
+            fresh["perp_asset_map"],
+        )
+    finally:
+        if own_session:
+            await session.close()
+
+    return _dump_hl_cache(fresh)
+
 async def init_shared_hl_cache(session: Optional[aiohttp.ClientSession] = None, *, force: bool = False) -> dict:
     """
     Hyperliquid 공용 메타(dex_list, spot, perp)를 1회만 로드하여 모듈 캐시에 저장.
     - 이미 초기화되었으면 즉시 반환(force=True면 강제 재로드).
+    - 디스크 메타 캐시(wrappers.meta_cache)가 TTL 이내면 네트워크 호출 없이 복원,
+      TTL이 지났으면 캐시로 먼저 기동하고 백그라운드에서 재조회 후 in-place 교체.
     - session이 None이면 내부에서 임시 생성/종료.
     반환: _HL_SHARED_CACHE dict (참조용)
     """
-    global _HL_SHARED_CACHE
+    from wrappers.meta_cache import META_CACHE
 
     async with _HL_INIT_LOCK:
         if _HL_SHARED_CACHE["inited"] and not force:
             #print('use cache')
             return _HL_SHARED_CACHE
 
-        own_session = False
-        if session is None:
-            session = aiohttp.ClientSession()
-            own_session = True
-
-        try:
-            # 1) dex_list
-            _HL_SHARED_CACHE["dex_list"] = await get_dex_list(session) or ["hl"]
-
-            # 2) spot meta
-            await init_spot_token_map(
-                session,
-                _HL_SHARED_CACHE["spot_index_to_name"],
-                _HL_SHARED_CACHE["spot_name_to_index"],
-                _HL_SHARED_CACHE["spot_asset_index_to_pair"],
-                _HL_SHARED_CACHE["spot_asset_index_to_bq"],
-                _HL_SHARED_CACHE["spot_token_sz_decimals"],
-            )
-            # reverse
-            _HL_SHARED_CACHE["spot_asset_pair_to_index"] = {
-                v: k for k, v in _HL_SHARED_CACHE["spot_asset_index_to_pair"].items()
-            }
-
-            # 3) perp meta
-            await init_perp_meta_cache(
-                session,
-                _HL_SHARED_CACHE["perp_metas_raw"],
-                _HL_SHARED_CACHE["perp_asset_map"],
+        if force:
+            data = await _fetch_hl_meta(session)
+            if data["perp_asset_map"]:
+                META_CACHE.save(_HL_META_CACHE_KEY, data)
+        else:
+            data, _ = await META_CACHE.get(
+                _HL_META_CACHE_KEY,
+                lambda: _fetch_hl_meta(session),
+                on_refresh=_restore_hl_cache,
+                validate=lambda d: bool(d.get("perp_asset_map")),  # 빈 응답(429 소진 등)은 저장하지 않음
             )
-
-            _HL_SHARED_CACHE["inited"] = True
-            
-        finally:
-            if own_session:
-                await session.close()
+        _restore_hl_cache(data)
 
     return _HL_SHARED_CACHE
 
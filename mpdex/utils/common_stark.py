@@ -0,0 +1,129 @@
+"""
+StarkEx 서명 컨텍스트 (Extended / EdgeX 공용)
+
+요청마다 반복되던 작업을 init 시점에 1회만 수행하고 캐시한다.
+- private key hex -> int 파싱
+- 공개키 y 좌표 (ec_mult, 요청당 가장 비싼 연산)
+- 계정 id 기반 packed_1 prefix
+- 계약별 asset id / resolution / fee rate 및 asset pair pedersen prefix (buy/sell)
+
+주문당 남는 연산은 packed_0, packed_1 해시 2회 + sign 1회뿐이다.
+*_async 메서드는 이 연산을 SIGN_EXECUTOR(프로세스 풀)에서 실행해 이벤트 루프를 막지 않는다.
+
+사용법:
+    ctx = StarkSigningContext(private_key_hex, account_id)
+    signature, ts = ctx.sign_request("POST", path, body)
+    c = ctx.contract(contract_id, contract_info)
+    l2_signature = ctx.sign_order(c, is_buy, amt_synth, amt_coll, amt_fee, l2_nonce, expire_ts)
+    l2_signature = await ctx.sign_order_async(c, is_buy, amt_synth, amt_coll, amt_fee, l2_nonce, expire_ts)
+"""
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
+import time
+
+from eth_hash.auto import keccak
+from starkware.crypto.signature.fast_pedersen_hash import pedersen_hash
+from starkware.crypto.signature.signature import sign, ec_mult, ALPHA, FIELD_PRIME, EC_GEN
+
+from mpdex.utils.sign_executor import SIGN_EXECUTOR
+
+K_MODULUS = int("0800000000000010ffffffffffffffffb781126dcae7b2321e66a241adc64d2f", 16)
+LIMIT_ORDER_WITH_FEES = 3
+
+
+# ---- executor 작업 함수 (모듈 최상위: 프로세스 풀로 pickle 전달) ----
+
+def _request_hash(timestamp: str, method: str, path: str, params: Dict[str, Any]) -> int:
+    param_str = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+    message = timestamp + method + path + param_str
+    return int.from_bytes(keccak(message.encode("utf-8")), "big") % K_MODULUS
+
+def sign_request_job(private_key_int: int, y_hex: str, timestamp: str, method: str, path: str, params: Dict[str, Any]) -> str:
+    r, s = sign(_request_hash(timestamp, method, path, params), private_key_int)
+    return r.to_bytes(32, "big").hex() + s.to_bytes(32, "big").hex() + y_hex
+
+def sign_order_job(private_key_int: int, h_prefix: int, packed_1_prefix: int, is_buy: bool,
+                   amt_synth: int, amt_coll: int, amt_fee: int, l2_nonce: int, expire_ts: int) -> str:
+    packed_0 = (amt_coll if is_buy else amt_synth)
+    packed_0 = (packed_0 << 64) + (amt_synth if is_buy else amt_coll)
+    packed_0 = (packed_0 << 64) + amt_fee
+    packed_0 = (packed_0 << 32) + l2_nonce
+    h = pedersen_hash(h_prefix, packed_0)
+
+    packed_1 = (packed_1_prefix << 32) + expire_ts
+    packed_1 = (packed_1 << 17)
+    h = pedersen_hash(h, packed_1)
+
+    r, s = sign(h, private_key_int)
+    return r.to_bytes(32, "big").hex() + s.to_bytes(32, "big").hex()
+
+
+class StarkContract:
+    """계약별 서명 상수 (asset id, resolution, fee, asset pair 해시)"""
+    __slots__ = ("contract_id", "resolution", "fee_rate", "asset_id_synth", "asset_id_coll", "h_buy", "h_sell")
+
+    def __init__(self, contract_id: str, contract_info: Dict[str, Any]):
+        self.contract_id = contract_id
+        self.resolution = Decimal(int(contract_info['contract']['starkExResolution'], 16))
+        self.fee_rate = Decimal(contract_info['defaultTakerFeeRate'])
+        self.asset_id_synth = int(contract_info['contract']['starkExSyntheticAssetId'], 16)
+        self.asset_id_coll = int(contract_info['meta']['global']['starkExCollateralCoin']['starkExAssetId'], 16)
+        # L2 order hash 앞 2단계는 방향(buy/sell)별로 고정
+        synth, coll = self.asset_id_synth, self.asset_id_coll
+        self.h_buy = pedersen_hash(pedersen_hash(coll, synth), coll)
+        self.h_sell = pedersen_hash(pedersen_hash(synth, coll), coll)
+
+
+class StarkSigningContext:
+    def __init__(self, private_key_hex: str, account_id):
+        self.private_key_int = int(private_key_hex.replace("0x", ""), 16)
+        _, y = ec_mult(self.private_key_int, EC_GEN, ALPHA, FIELD_PRIME)
+        self.public_key_y = y
+        self.y_hex = y.to_bytes(32, "big").hex()
+
+        pid = int(account_id)
+        packed_1 = LIMIT_ORDER_WITH_FEES
+        packed_1 = (packed_1 << 64) + pid
+        packed_1 = (packed_1 << 64) + pid
+        packed_1 = (packed_1 << 64) + pid
+        self._packed_1_prefix = packed_1
+
+        self._contracts: Dict[str, StarkContract] = {}
+
+    def contract(self, contract_id: str, contract_info: Dict[str, Any]) -> StarkContract:
+        c = self._contracts.get(contract_id)
+        if c is None:
+            c = StarkContract(contract_id, contract_info)
+            self._contracts[contract_id] = c
+        return c
+
+    def clear_contracts(self) -> None:
+        """메타데이터 갱신 시 호출 (asset id / fee 변경 반영)"""
+        self._contracts.clear()
+
+    def sign_request(self, method: str, path: str, params: Dict[str, Any], timestamp: Optional[str] = None) -> Tuple[str, str]:
+        """API 요청 헤더 서명 -> (r||s||y hex, timestamp)"""
+        if not timestamp:
+            timestamp = str(int(time.time() * 1000))
+        return sign_request_job(self.private_key_int, self.y_hex, timestamp, method, path, params), timestamp
+
+    async def sign_request_async(self, method: str, path: str, params: Dict[str, Any], timestamp: Optional[str] = None) -> Tuple[str, str]:
+        if not timestamp:
+            timestamp = str(int(time.time() * 1000))
+        signature = await SIGN_EXECUTOR.run(
+            sign_request_job, self.private_key_int, self.y_hex, timestamp, method, path, dict(params)
+        )
+        return signature, timestamp
+
+    def sign_order(self, c: StarkContract, is_buy: bool, amt_synth: int, amt_coll: int, amt_fee: int,
+                   l2_nonce: int, expire_ts: int) -> str:
+        """L2 주문 서명 -> r||s hex"""
+        return sign_order_job(self.private_key_int, c.h_buy if is_buy else c.h_sell, self._packed_1_prefix,
+                              is_buy, amt_synth, amt_coll, amt_fee, l2_nonce, expire_ts)
+
+    async def sign_order_async(self, c: StarkContract, is_buy: bool, amt_synth: int, amt_coll: int, amt_fee: int,
+                               l2_nonce: int, expire_ts: int) -> str:
+        return await SIGN_EXECUTOR.run(
+            sign_order_job, self.private_key_int, c.h_buy if is_buy else c.h_sell, self._packed_1_prefix,
+            is_buy, amt_synth, amt_coll, amt_fee, l2_nonce, expire_ts,
+        )
@@ -16,10 +16,11 @@ from .common_hyperliquid import (
     STABLES_DISPLAY,
 )
 from typing import Dict, Optional, List, Tuple, Any
+from wrappers.http_pool import HTTP_POOL
 import aiohttp
-from aiohttp import TCPConnector
 import asyncio
 import time
+import uuid
 
 # 전역 상수
 HL_BASE_URL = "https://api.hyperliquid.xyz"
@@ -184,14 +185,13 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
 
     def _session(self) -> aiohttp.ClientSession:
         if self._http is None or self._http.closed:
-            self._http = aiohttp.ClientSession(
-                connector=TCPConnector(force_close=True, enable_cleanup_closed=True)
-            )
+            self._http = HTTP_POOL.acquire()
         return self._http
 
     async def close(self):
-        if self._http and not self._http.closed:
-            await self._http.close()
+        if self._http is not None:
+            await HTTP_POOL.release(self._http)
+            self._http = None
         if self.ws_client:
             if self._ws_pool_key:
                 # Pool에서 가져온 경우 release
@@ -536,6 +536,43 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
                     if parsed["size"] and parsed["side"] != "flat":
                         return parsed
         return None
+
+    async def fetch_fills_rest(self, symbol, since_ms):
+        """
+        REST userFillsByTime (모든 dex 포함) - fills() 폴링 경로.
+        coin은 perp "BTC", HIP-3 "xyz:XYZ100", spot "@107" 형태 그대로 symbol과 비교합니다.
+        """
+        address = self.vault_address or self.wallet_address
+        if not address:
+            return []
+        s = self._session()
+        payload = {"type": "userFillsByTime", "user": address, "startTime": int(since_ms), "aggregateByTime": False}
+        async with s.post(f"{self.http_base}/info", json=payload, headers={"Content-Type": "application/json"}) as r:
+            data = await r.json()
+        sym = symbol.strip().upper() if symbol else None
+        results = []
+        for f in data if isinstance(data, list) else []:
+            coin = str(f.get("coin", ""))
+            if sym and coin.upper() != sym:
+                continue
+            try:
+                size = float(f.get("sz") or 0)
+            except (ValueError, TypeError):
+                continue
+            fee = f.get("fee")
+            results.append({
+                "symbol": coin,
+                "side": "buy" if f.get("side") == "B" else "sell",
+                "size": size,
+                "price": float(f["px"]) if f.get("px") is not None else None,
+                "order_id": f.get("oid"),
+                "fill_id": f.get("tid"),
+                "fee": float(fee) if fee is not None else None,
+                "is_maker": not f["crossed"] if "crossed" in f else None,
+                "time": int(f.get("time") or 0),
+            })
+        results.sort(key=lambda x: x["time"])
+        return results
     
     async def get_spot_balance(self, coin: str = None) -> dict:
         if "/" in coin: # symbol 대비
@@ -842,22 +879,24 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
             self._leverage_updated_to_max = True
         return resp
 
-    async def create_order(
+    def new_client_id(self):
+        """HL cloid: 0x + 16바이트 hex"""
+        return "0x" + uuid.uuid4().hex
+
+    async def _build_order_wire(
         self,
         symbol: str,
         side: str,
         amount: float,
-        price: Optional[float] = None,
-        order_type: str = "market",
+        price: Optional[float],
         *,
-        is_reduce_only: bool = False,
-        is_spot: bool = False,
-        tif: Optional[str] = None,
-        client_id: Optional[str] = None,
-        slippage: float = 0.05,
-        prefer_ws: bool = True,
-        timeout: float = 5.0,
+        is_reduce_only: bool,
+        is_spot: bool,
+        tif: Optional[str],
+        client_id: Optional[str],
+        slippage: float,
     ):
+        """주문 wire 객체 생성 (create_order / modify_order 공용) -> (order_obj, dex, ord_type, is_spot)"""
         if "/" in symbol:
             is_spot = True
 
@@ -899,6 +938,28 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
         order_obj = {"a": int(asset_id), "b": is_buy, "p": price_str, "s": size_str, "r": is_reduce_only, "t": {"limit": {"tif": tif_final}}}
         if client_id:
             order_obj["c"] = client_id
+        return order_obj, dex, ord_type, is_spot
+
+    async def create_order(
+        self,
+        symbol: str,
+        side: str,
+        amount: float,
+        price: Optional[float] = None,
+        order_type: str = "market",
+        *,
+        is_reduce_only: bool = False,
+        is_spot: bool = False,
+        tif: Optional[str] = None,
+        client_id: Optional[str] = None,
+        slippage: float = 0.05,
+        prefer_ws: bool = True,
+        timeout: float = 5.0,
+    ):
+        order_obj, dex, ord_type, is_spot = await self._build_order_wire(
+            symbol, side, amount, price,
+            is_reduce_only=is_reduce_only, is_spot=is_spot, tif=tif, client_id=client_id, slippage=slippage,
+        )
         action = {"type": "order", "orders": [order_obj], "grouping": "na"}
         if self.builder_code:
             fee = self._pick_builder_fee_int(dex, ord_type, is_spot=is_spot)
@@ -911,6 +972,33 @@ class HyperliquidBase(MultiPerpDexMixin, MultiPerpDex):
         except Exception as e:
             return str(e)
 
+    async def modify_order(
+        self,
+        symbol: str,
+        order_id,
+        side: str,
+        amount: float,
+        price: float,
+        *,
+        is_spot: bool = False,
+        tif: Optional[str] = None,
+        client_id: Optional[str] = None,
+        prefer_ws: bool = True,
+        timeout: float = 5.0,
+    ):
+        """
+        batchModify로 지정가 주문 정정 (cancel/create 왕복 없이 한 번에).
+        정정 후 oid가 바뀔 수 있으므로 반환된 oid로 추적을 갱신해야 합니다. 실패 시 RuntimeError.
+        """
+        order_obj, *_ = await self._build_order_wire(
+            symbol, side, amount, price,
+            is_reduce_only=False, is_spot=is_spot, tif=tif, client_id=client_id, slippage=0.0,
+        )
+        action = {"type": "batchModify", "modifies": [{"oid": int(order_id), "order": order_obj}]}
+        payload = await self._make_signed_payload(action)
+        resp = await self._send_action(payload, prefer_ws=prefer_ws, timeout=timeout)
+        return extract_order_id(resp) or str(order_id)
+
     async def cancel_orders(self, symbol: str, open_orders=None, *, is_spot: bool = False, prefer_ws: bool = True, timeout: float = 5.0):
         
         if open_orders is None:
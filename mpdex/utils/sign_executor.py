@@ -0,0 +1,117 @@
+"""
+Signing Executor
+================
+CPU를 오래 잡는 서명 연산(Stark pedersen hash / ECDSA sign 등)을 이벤트 루프 밖에서 실행.
+순수 파이썬 서명이 루프 스레드에서 돌면 그동안 같은 프로세스의 모든 WS 수신 루프가 멈춘다.
+
+모드 (MPDEX_SIGN_EXECUTOR):
+- "process" (기본): ProcessPoolExecutor - GIL과 무관하게 동시 주문 서명이 병렬로 실행
+- "thread": ThreadPoolExecutor - 루프는 막지 않지만 GIL 때문에 서명끼리는 직렬
+- "inline": 루프 스레드에서 바로 실행 (디버깅용, 기존 동작)
+프로세스 풀 생성/실행이 실패하면(BrokenProcessPool, 플랫폼 제약 등) thread 모드로 자동 전환.
+
+작업 함수는 프로세스 간 전달되므로 모듈 최상위 함수 + picklable 인자여야 한다.
+
+사용법:
+    from mpdex.utils.sign_executor import SIGN_EXECUTOR
+
+    sig = await SIGN_EXECUTOR.run(sign_job, msg_hash, private_key_int)
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+SIGN_EXECUTOR_MODES = ("process", "thread", "inline")
+
+
+def _warmup_job(module: Optional[str]) -> int:
+    # 워커에서 서명 모듈을 미리 import (첫 주문에서 import 비용을 내지 않도록)
+    if module:
+        __import__(module)
+    return os.getpid()
+
+
+class SignExecutor:
+    def __init__(self, mode: Optional[str] = None, max_workers: Optional[int] = None):
+        mode = (mode or os.environ.get("MPDEX_SIGN_EXECUTOR") or "process").lower()
+        if mode not in SIGN_EXECUTOR_MODES:
+            logger.warning(f"[sign_executor] unknown mode {mode!r}, using 'process'")
+            mode = "process"
+        self.mode = mode
+        self.max_workers = max_workers or int(os.environ.get("MPDEX_SIGN_WORKERS") or min(4, os.cpu_count() or 1))
+        self._executor: Optional[Executor] = None
+        self._warmup_task: Optional[asyncio.Task] = None
+
+    def _get_executor(self) -> Optional[Executor]:
+        if self.mode == "inline":
+            return None
+        if self._executor is not None:
+            return self._executor
+        if self.mode == "process":
+            try:
+                # fork는 이벤트 루프/세션 스레드가 살아있는 부모를 복제하므로 forkserver/spawn 사용
+                methods = multiprocessing.get_all_start_methods()
+                ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=ctx)
+                return self._executor
+            except (OSError, ValueError, NotImplementedError) as e:
+                logger.warning(f"[sign_executor] process pool unavailable ({e}), falling back to threads")
+                self.mode = "thread"
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mpdex-sign")
+        return self._executor
+
+    def _fallback_to_threads(self, reason: Exception) -> None:
+        logger.warning(f"[sign_executor] process pool failed ({reason}), falling back to threads")
+        old = self._executor
+        self._executor = None
+        self.mode = "thread"
+        if old is not None:
+            old.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """fn(*args)를 executor에서 실행하고 결과 반환"""
+        executor = self._get_executor()
+        if executor is None:
+            return fn(*args)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, fn, *args)
+        except BrokenProcessPool as e:
+            if self.mode != "process":
+                raise
+            self._fallback_to_threads(e)
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+
+    def warmup(self, module: Optional[str] = None) -> None:
+        """
+        워커 프로세스를 미리 띄우고 서명 모듈을 import (fire-and-forget).
+        거래소 init()에서 호출하면 첫 주문이 워커 기동 비용을 내지 않는다.
+        """
+        if self.mode != "process" or self._warmup_task is not None:
+            return
+
+        async def _run():
+            try:
+                await asyncio.gather(*(self.run(_warmup_job, module) for _ in range(self.max_workers)))
+            except Exception as e:
+                logger.warning(f"[sign_executor] warmup failed: {e}")
+
+        self._warmup_task = asyncio.create_task(_run())
+
+    def shutdown(self) -> None:
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            self._warmup_task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Global singleton
+SIGN_EXECUTOR = SignExecutor()
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import os
+import time
 import certifi
 from decimal import Decimal
 
@@ -8,7 +9,8 @@ from decimal import Decimal
 os.environ['SSL_CERT_FILE'] = certifi.where()
 os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
 
-from exchange_factory import create_exchange, symbol_create
+from exchange_factory import create_exchanges, symbol_create
+from wrappers.metrics import METRICS, start_metrics_server
 
 # ==========================================
 # 설정 변수 (Configuration)
@@ -18,6 +20,11 @@ HEDGE_EXCHANGE = "variational"            # 헤징을 수행할 단일 거래소
 COIN = "BTC"                              # 매매 코인
 SYNC_INTERVAL = 1                         # 감시 주기 (초)
 HEDGE_RATIO = 1.0                         # 헤징 비율 (1.0 = 100% 헤징)
+POSITION_TIMEOUT = 2.0                    # 거래소별 포지션 조회 타임아웃 (초)
+CYCLE_REPORT_EVERY = 60                   # N 주기마다 조회 소요시간 리포트
+HEDGE_MODE = "event"                      # "event": WS 포지션 푸시 즉시 헤징 (스트림 없는 거래소는 폴링), "poll": 주기 폴링만
+HEDGE_QUOTE_SIZES = []                    # 헤징 거래소가 quote 사전 조회를 지원하면(variational) 이 수량들의 quote를 미리 받아둠 (예: [0.001, 0.002])
+METRICS_PORT = int(os.environ.get("MPDEX_METRICS_PORT", "0"))  # >0 이면 http://127.0.0.1:<port>/metrics 로 거래소 메서드 latency 노출
 # ==========================================
 
 # 키 로드
@@ -57,73 +64,218 @@ class MultiHedgeBot:
         self.last_positions = {} # name -> last_known_signed_size
         self.running = True
 
+        # 이벤트 모드 상태
+        self.stream_names = set()   # WS 포지션 스트림이 있는 거래소
+        self.poll_names = set()     # 폴링으로 감시하는 거래소
+        self._listeners = {}        # name -> callback (종료 시 해제용)
+        self._pending_events = {}   # name -> 첫 이벤트 수신 시각 (perf_counter)
+        self._wakeup = None         # asyncio.Event - 실행 중인 loop 안(start)에서 생성 (py3.8/3.9 loop 바인딩)
+        self.hedge_latencies = []   # 이벤트 수신 -> 헤징 주문 완료 (ms)
+        self.cycle_times = []       # 주기별 포지션 조회 소요시간 (ms), 리포트 후 초기화
+
     async def init_exchanges(self):
         logger.info(f"거래소 초기화 중... [감시: {self.monitor_names}] -> [헤징: {self.hedge_name}]")
-        
+
         for name in self.monitor_names:
             if name not in KEYS:
                 raise ValueError(f"감시 거래소 '{name}'의 키 파일이 keys/ 폴더에 없습니다.")
-            ex = await create_exchange(name, KEYS[name])
-            self.monitor_exs[name] = ex
-            self.monitor_symbols[name] = symbol_create(name, self.coin)
-            
-            # 현재 포지션 기록 (이 시점부터의 변화만 쫓음)
-            pos = await ex.get_position(self.monitor_symbols[name])
-            self.last_positions[name] = self._get_signed_size(pos)
-            logger.info(f"[{name}] 기준 포지션 기록: {self.last_positions[name]}")
-
         if self.hedge_name not in KEYS:
             raise ValueError(f"헤징 거래소 '{self.hedge_name}'의 키 파일이 keys/ 폴더에 없습니다.")
-        self.hedge_ex = await create_exchange(self.hedge_name, KEYS[self.hedge_name])
+
+        # 감시 + 헤징 거래소 동시 초기화
+        names = list(dict.fromkeys(self.monitor_names + [self.hedge_name]))
+        instances, errors = await create_exchanges({name: KEYS[name] for name in names})
+        for name, e in errors.items():
+            logger.error(f"[{name}] 초기화 실패: {e}")
+
+        if self.hedge_name not in instances:
+            # 헤징 거래소 없이는 동작 불가 -> 이미 뜬 인스턴스 정리 후 중단
+            for ex in instances.values():
+                await ex.close()
+            raise RuntimeError(f"헤징 거래소 '{self.hedge_name}' 초기화 실패: {errors.get(self.hedge_name)}")
+        self.hedge_ex = instances.pop(self.hedge_name)
         self.hedge_symbol = symbol_create(self.hedge_name, self.coin)
+        if HEDGE_QUOTE_SIZES and hasattr(self.hedge_ex, "start_quote_prefetch"):
+            self.hedge_ex.start_quote_prefetch(self.hedge_symbol, HEDGE_QUOTE_SIZES)
+            logger.info(f"[{self.hedge_name}] quote 사전 조회 시작: {HEDGE_QUOTE_SIZES}")
+
+        # 초기화 성공한 감시 거래소만 사용 (부분 기동)
+        for name in self.monitor_names:
+            if name in instances:
+                self.monitor_exs[name] = instances[name]
+                self.monitor_symbols[name] = symbol_create(name, self.coin)
+        if not self.monitor_exs:
+            raise RuntimeError("초기화된 감시 거래소가 없습니다.")
+
+        # 현재 포지션 기록 (이 시점부터의 변화만 쫓음)
+        names = list(self.monitor_exs)
+        positions = await asyncio.gather(*(self.monitor_exs[n].get_position(self.monitor_symbols[n]) for n in names))
+        for name, pos in zip(names, positions):
+            self.last_positions[name] = self._get_signed_size(pos)
+            logger.info(f"[{name}] 기준 포지션 기록: {self.last_positions[name]}")
 
         logger.info("모든 거래소 초기화 완료.")
 
+    def register_listeners(self):
+        """WS 포지션 스트림이 있는 거래소는 푸시 구독, 나머지는 폴링 대상으로 분류"""
+        for name, ex in self.monitor_exs.items():
+            callback = lambda symbol, name=name: self._on_position_event(name, symbol)
+            if HEDGE_MODE == "event" and ex.add_position_listener(callback):
+                self._listeners[name] = callback
+                self.stream_names.add(name)
+            else:
+                self.poll_names.add(name)
+        logger.info(f"헤징 모드: {HEDGE_MODE} [스트림: {sorted(self.stream_names)}] [폴링: {sorted(self.poll_names)}]")
+
+    def unregister_listeners(self):
+        for name, callback in self._listeners.items():
+            try:
+                self.monitor_exs[name].remove_position_listener(callback)
+            except Exception:
+                pass
+        self._listeners.clear()
+
+    def _on_position_event(self, name, symbol):
+        # WS 수신 루프에서 동기 호출됨 -> 시각만 기록하고 메인 루프 깨움
+        if symbol is not None and symbol != self.monitor_symbols.get(name):
+            return
+        self._pending_events.setdefault(name, time.perf_counter())
+        self._wakeup.set()
+
     def _get_signed_size(self, pos):
         if not pos: return Decimal(0)
         size = Decimal(str(pos['size']))
         side = pos['side'].lower()
         return size if side in ['long', 'buy'] else -size
 
-    async def sync_positions(self):
+    async def fetch_position(self, name):
+        ex = self.monitor_exs[name]
+        return await asyncio.wait_for(ex.get_position(self.monitor_symbols[name]), timeout=POSITION_TIMEOUT)
+
+    async def hedge_net(self, changes, event_times):
+        """
+        changes: name -> 현재 signed size (변화가 있는 거래소만).
+        거래소별 변화량을 상계한 순변화량만큼 단일 헤징 주문 (상계되면 주문 없음).
+        """
+        deltas = {name: curr - self.last_positions.get(name, Decimal(0)) for name, curr in changes.items()}
+        net = sum(deltas.values(), Decimal(0))
+
+        for name, delta in deltas.items():
+            logger.info(f"[{name}] 변화 감지: {delta} (현재: {changes[name]})")
+
+        if abs(net) < Decimal("0.0000001"):
+            if len(deltas) > 1:
+                logger.info("거래소 간 변화량 상계 (순변화 0) - 헤징 주문 생략")
+            self.last_positions.update(changes)
+            return
+
+        # 즉시 헤징 주문 (Variational 잔고 상관없이 순변화량만큼만 주문)
+        side = "sell" if net > 0 else "buy"
+        amount = float(abs(net) * Decimal(str(HEDGE_RATIO)))
+
+        logger.info(f"[{self.hedge_name}] 대응 주문 실행: {side} {amount} (순변화 {net}, {len(deltas)}개 거래소)")
+        try:
+            await self.hedge_ex.create_order(self.hedge_symbol, side, amount, order_type="market")
+            # 기준점 업데이트 (주문 성공 시에만, 실패하면 다음 주기에 재시도)
+            self.last_positions.update(changes)
+            times = [event_times[n] for n in changes if n in event_times]
+            if times:
+                latency_ms = (time.perf_counter() - min(times)) * 1000
+                self.hedge_latencies.append(latency_ms)
+                logger.info(f"[{self.hedge_name}] 대응 주문 완료. (체결→헤징 {latency_ms:.1f}ms)")
+            else:
+                logger.info(f"[{self.hedge_name}] 대응 주문 완료.")
+        except Exception as e:
+            logger.error(f"[{self.hedge_name}] 대응 주문 실패: {e}")
+
+    async def sync_positions(self, names=None, event_times=None):
+        names = list(self.monitor_exs if names is None else names)
+        event_times = event_times or {}
         try:
-            for name, ex in self.monitor_exs.items():
-                curr_pos = await ex.get_position(self.monitor_symbols[name])
-                curr_signed = self._get_signed_size(curr_pos)
-                
-                delta = curr_signed - self.last_positions.get(name, Decimal(0))
-                
-                if abs(delta) < Decimal("0.0000001"):
+            # 모든 거래소 포지션 동시 조회 (느린 거래소가 다른 거래소 헤징을 막지 않도록 개별 타임아웃)
+            t0 = time.perf_counter()
+            results = await asyncio.gather(*(self.fetch_position(n) for n in names), return_exceptions=True)
+            self._record_cycle((time.perf_counter() - t0) * 1000)
+
+            changes = {}
+            for name, pos in zip(names, results):
+                if isinstance(pos, asyncio.TimeoutError):
+                    logger.warning(f"[{name}] 포지션 조회 타임아웃 ({POSITION_TIMEOUT}초) - 이번 주기 건너뜀")
+                    continue
+                if isinstance(pos, Exception):
+                    logger.error(f"[{name}] 포지션 조회 실패: {pos}")
                     continue
+                curr_signed = self._get_signed_size(pos)
+                if abs(curr_signed - self.last_positions.get(name, Decimal(0))) >= Decimal("0.0000001"):
+                    changes[name] = curr_signed
 
-                logger.info(f"[{name}] 변화 감지: {delta} (현재: {curr_signed})")
-                
-                # 즉시 헤징 주문 (Variational 잔고 상관없이 변화량만큼만 주문)
-                side = "sell" if delta > 0 else "buy"
-                amount = float(abs(delta) * Decimal(str(HEDGE_RATIO)))
-                
-                logger.info(f"[{self.hedge_name}] 대응 주문 실행: {side} {amount}")
-                try:
-                    await self.hedge_ex.create_order(self.hedge_symbol, side, amount, order_type="market")
-                    logger.info(f"[{self.hedge_name}] 대응 주문 완료.")
-                    # 기준점 업데이트
-                    self.last_positions[name] = curr_signed
-                except Exception as e:
-                    logger.error(f"[{self.hedge_name}] 대응 주문 실패: {e}")
-            
+            if changes:
+                await self.hedge_net(changes, event_times)
         except Exception as e:
             logger.error(f"[에러] 포지션 추적 중 오류: {e}")
 
+    def _record_cycle(self, elapsed_ms):
+        self.cycle_times.append(elapsed_ms)
+        if len(self.cycle_times) >= CYCLE_REPORT_EVERY:
+            avg = sum(self.cycle_times) / len(self.cycle_times)
+            logger.info(f"포지션 조회 소요시간 (최근 {len(self.cycle_times)}주기): avg={avg:.1f}ms max={max(self.cycle_times):.1f}ms")
+            self.cycle_times = []
+
+    async def run_polling(self):
+        while self.running:
+            await self.sync_positions()
+            await asyncio.sleep(SYNC_INTERVAL)
+
+    async def run_event_driven(self):
+        """
+        WS 포지션 푸시가 오면 즉시 해당 거래소만 헤징.
+        SYNC_INTERVAL마다 전체 거래소 폴링 (스트림 없는 거래소 감시 + 푸시 누락 대비).
+        """
+        next_poll = time.monotonic()
+        while self.running:
+            timeout = max(0.0, next_poll - time.monotonic())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            # 대기 중 쌓인 이벤트 일괄 처리 (거래소별 첫 이벤트 시각 기준으로 latency 측정)
+            event_times, self._pending_events = self._pending_events, {}
+            names = list(event_times)
+
+            # 폴링 주기: 스트림 거래소도 함께 대조 (누락된 푸시 / 실패한 헤징 재시도용 안전망)
+            if time.monotonic() >= next_poll:
+                names += [n for n in self.monitor_exs if n not in event_times]
+                next_poll = time.monotonic() + SYNC_INTERVAL
+
+            if names:
+                await self.sync_positions(names, event_times)
+
     async def start(self):
+        metrics_server = None
+        self._wakeup = asyncio.Event()
         try:
+            if METRICS_PORT:
+                metrics_server = await start_metrics_server(port=METRICS_PORT)
             await self.init_exchanges()
+            self.register_listeners()
             logger.info(f"범용 헤징 봇 가동 시작 (주기: {SYNC_INTERVAL}초)")
-            while self.running:
-                await self.sync_positions()
-                await asyncio.sleep(SYNC_INTERVAL)
+            if self.stream_names:
+                await self.run_event_driven()
+            else:
+                await self.run_polling()
         except Exception as e:
             logger.error(f"[치명적 에러] {e}")
         finally:
+            self.unregister_listeners()
+            if self.hedge_latencies:
+                lat = sorted(self.hedge_latencies)
+                logger.info(f"체결→헤징 지연: n={len(lat)} p50={lat[len(lat) // 2]:.1f}ms max={lat[-1]:.1f}ms")
+            for line in METRICS.summary_lines():
+                logger.info(f"[latency] {line}")
+            if metrics_server:
+                metrics_server.close()
             for ex in self.monitor_exs.values(): await ex.close()
             if self.hedge_ex: await self.hedge_ex.close()
 
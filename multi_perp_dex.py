@@ -1,6 +1,19 @@
+import asyncio
+import logging
+import time
+import uuid
 from abc import ABC, abstractmethod
 
+from wrappers.metrics import instrument_class
+
+logger = logging.getLogger(__name__)
+
 class MultiPerpDex(ABC):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # create_order / get_position / cancel_orders ... latency 계측 (wrappers.metrics.METRICS)
+        instrument_class(cls)
+
     def __init__(self):
         self.has_spot = False
         self.available_symbols = {}
@@ -116,6 +129,136 @@ class MultiPerpDexMixin:
 
     async def get_open_orders(self, symbol):
         return await self.exchange.fetch_open_orders(symbol)
+
+    def new_client_id(self):
+        """Fresh client order id in the venue's format (passed to create_order(client_id=...))."""
+        return str(uuid.uuid4())
+
+    async def modify_order(self, symbol, order_id, side, amount, price):
+        """
+        Amend a resting limit order in place (new price/amount) with the venue's native modify.
+        Returns the order id to track afterwards (may differ from order_id).
+        Raises NotImplementedError if the venue has no native modify (callers cancel + create instead).
+        """
+        raise NotImplementedError("modify_order method not implemented.")
+
+    async def get_tick_size(self, symbol):
+        """Price tick size (float) of the symbol. Raises NotImplementedError if the venue does not expose it."""
+        raise NotImplementedError("get_tick_size method not implemented.")
+
+    def add_position_listener(self, callback):
+        """
+        Register callback(symbol) fired when the venue pushes a position update over WS.
+        Returns False if the venue has no position stream (caller should poll get_position).
+        """
+        return False
+
+    def remove_position_listener(self, callback):
+        """Unregister a callback added with add_position_listener."""
+        return None
+
+    def add_fill_listener(self, callback):
+        """
+        Register callback(fill) fired when the venue pushes one of our fills over its private WS stream.
+        Returns False if the venue has no fill stream (fills() then polls REST).
+        """
+        return False
+
+    def remove_fill_listener(self, callback):
+        """Unregister a callback added with add_fill_listener."""
+        return None
+
+    async def fetch_fills_rest(self, symbol, since_ms):
+        """
+        Own fills with time >= since_ms from the venue's REST trade history, oldest first (same dict as fills()).
+        symbol None = all symbols. Raises NotImplementedError if the venue has no fill history endpoint.
+        """
+        raise NotImplementedError("fetch_fills_rest method not implemented.")
+
+    async def fills(self, symbol=None, *, poll_interval=1.0):
+        """
+        Async iterator of own fills from the moment iteration starts:
+
+            async for fill in ex.fills(symbol):
+                ...
+
+        Each fill is a dict:
+            - symbol: Trading pair symbol
+            - side: 'buy' or 'sell'
+            - size: Filled amount of this fill (float, partial fills are separate events)
+            - price: Fill price (float, None if unknown)
+            - order_id / fill_id: Venue ids (None if unknown)
+            - fee: Fee paid (float or None), is_maker: bool or None
+            - time: Fill time (ms)
+
+        Source: private WS fill stream (add_fill_listener) -> fetch_fills_rest polling
+        -> get_position diff polling (symbol required, price None) as the last resort.
+        """
+        sym = symbol.upper() if symbol else None
+        queue = asyncio.Queue()
+
+        def on_fill(fill):
+            if sym is None or str(fill.get("symbol") or "").upper() == sym:
+                queue.put_nowait(fill)
+
+        if self.add_fill_listener(on_fill):
+            try:
+                while True:
+                    yield await queue.get()
+            finally:
+                self.remove_fill_listener(on_fill)
+            return
+
+        async for fill in self._poll_fills(symbol, poll_interval):
+            yield fill
+
+    async def _poll_fills(self, symbol, poll_interval):
+        since = int(time.time() * 1000)
+        seen = {}  # fill key -> time (경계 시각 중복 제거용, since 이전 키는 정리)
+        use_history = True
+        prev = None
+        while True:
+            if use_history:
+                try:
+                    batch = await self.fetch_fills_rest(symbol, since)
+                except NotImplementedError:
+                    if not symbol:
+                        raise ValueError("fills() needs a symbol on venues without a fill stream or fill history")
+                    use_history = False
+                    continue
+                except Exception as e:
+                    logger.warning(f"[fills] fetch_fills_rest failed: {e}")
+                    batch = []
+                for fill in batch or []:
+                    key = fill.get("fill_id") or (fill.get("order_id"), fill.get("time"), fill.get("size"), fill.get("price"))
+                    if key in seen:
+                        continue
+                    seen[key] = fill.get("time") or since
+                    since = max(since, int(fill.get("time") or since))
+                    yield fill
+                seen = {k: t for k, t in seen.items() if t >= since}
+            else:
+                try:
+                    pos = await self.get_position(symbol)
+                except Exception as e:
+                    logger.warning(f"[fills] get_position failed: {e}")
+                else:
+                    size = float(pos.get("size") or 0) if pos else 0.0
+                    signed = size if pos and str(pos.get("side") or "").lower() in ("long", "buy") else -size
+                    if prev is not None and abs(signed - prev) > 1e-12:
+                        yield {
+                            "symbol": symbol,
+                            "side": "buy" if signed > prev else "sell",
+                            "size": round(abs(signed - prev), 12),
+                            "price": None,
+                            "order_id": None,
+                            "fill_id": None,
+                            "fee": None,
+                            "is_maker": None,
+                            "time": int(time.time() * 1000),
+                        }
+                    prev = signed
+            await asyncio.sleep(poll_interval)
     
     async def close_position(self, symbol, position, *, is_reduce_only=False):
         if not position:
@@ -0,0 +1,212 @@
+"""
+Resting order manager (amend-in-place requoting)
+================================================
+봇 자신의 resting 지정가 주문 1개를 client id로 추적하고, 재호가 시 가능한 한 적은 왕복으로 처리한다.
+- 가격이 그대로면 아무것도 하지 않음 (queue priority 유지)
+- 거래소에 native modify가 있으면 (modify_order, 예: Hyperliquid batchModify) 한 번의 요청으로 정정
+- 없으면 알고 있는 order id로 해당 주문만 취소 후 신규 주문 (cancel_orders(symbol)의 open orders 조회 생략)
+- 취소가 확인되지 않거나 order id를 모르면 심볼 전체 취소 + open orders 확인으로 fallback,
+  그래도 남아 있으면 기존 주문을 계속 추적하고 신규 주문은 내지 않음 (주문 2개가 동시에 걸리는 것 방지)
+- post_only=True: 래퍼의 post_only 인자 또는 tif="Alo"(Hyperliquid)로 전달, 둘 다 없는 래퍼면 생성 시 ValueError
+- fill 스트림(MultiPerpDex.fills)을 on_fill로 넘기면 잔량을 갱신하고 전량 체결 시 추적 해제
+
+사용:
+    om = OrderManager(ex, symbol, post_only=True)
+    await om.cancel_all()                         # 단계 전환 시 남은 주문 정리 (확인되면 True)
+    await om.requote("buy", price, amount)        # 가격이 같으면 no-op, 취소 미확인이면 None
+    await om.cancel()                             # 추적 중인 주문만 취소 (확인되면 True)
+"""
+import inspect
+import logging
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def extract_order_id(result: Any) -> Optional[Any]:
+    """
+    create_order/modify_order 반환값에서 order id 추출 (래퍼마다 형태가 다름):
+    Backpack [{"id": ...}], Pacifica order_id(int), Extended {"data": {"orderId": ...}}, Hyperliquid oid(str)
+    """
+    if isinstance(result, list):
+        result = result[0] if result else None
+    if isinstance(result, dict):
+        data = result.get("data") if isinstance(result.get("data"), dict) else result
+        for key in ("id", "orderId", "order_id", "oid"):
+            if data.get(key) is not None:
+                return data[key]
+        return None
+    if isinstance(result, int) and not isinstance(result, bool):
+        return result
+    if isinstance(result, str) and result.isdigit():
+        return result
+    return None
+
+
+def cancel_confirmed(result: Any) -> bool:
+    """
+    cancel_orders(symbol, [order]) 결과가 성공인지 (래퍼마다 형태가 다름, 빈 결과/에러 항목이면 False):
+    Backpack 성공 주문 목록(상태 키 없음, HTTP 에러는 빈 목록), Pacifica {"status": "OK"/"error"/bool},
+    Extended {"status": ...}, Hyperliquid {"ok": bool}
+    """
+    if isinstance(result, dict):
+        result = [result]
+    if not isinstance(result, list) or not result:
+        return False
+    for r in result:
+        if not isinstance(r, dict):
+            return False
+        if "ok" in r:
+            if r["ok"] is not True:
+                return False
+        elif "status" in r:
+            status = r["status"]
+            if status is not True and str(status).upper() not in ("OK", "SUCCESS", "CANCELED", "CANCELLED"):
+                return False
+    return True
+
+
+class OrderManager:
+    def __init__(self, ex, symbol, *, post_only: bool = True):
+        self.ex = ex
+        self.symbol = symbol
+        self.post_only = post_only
+        # 추적 중인 주문: {"client_id", "id", "side", "price", "size"} 또는 None
+        self.order: Optional[Dict[str, Any]] = None
+        self.native_modify = True  # modify_order가 NotImplementedError면 False로 전환
+
+        # 래퍼별 create_order 지원 인자 (client_id 미지원 래퍼에 넘기지 않음)
+        params = inspect.signature(ex.create_order).parameters
+        self._accepts = {name for name in ("post_only", "tif", "client_id") if name in params}
+        # post-only 전달 방법: post_only 인자 or tif="Alo" (Hyperliquid). 둘 다 없으면 보장할 수 없으므로 거부
+        if post_only and not self._accepts & {"post_only", "tif"}:
+            raise ValueError(f"{type(ex).__name__}.create_order는 post-only를 지원하지 않습니다 (post_only=False로 실행하거나 래퍼에 추가 필요)")
+        self._modify_tif = "tif" in inspect.signature(ex.modify_order).parameters
+
+        # 통계
+        self.creates = 0
+        self.modifies = 0
+        self.cancels = 0
+        self.skipped = 0
+
+    # ---------------------- 조회 ----------------------
+    def resting_price(self, side: str) -> Optional[float]:
+        """side 방향으로 걸려 있는 주문 가격 (없으면 None)"""
+        if self.order and self.order["side"] == side:
+            return self.order["price"]
+        return None
+
+    # ---------------------- 주문 ----------------------
+    async def requote(self, side: str, price: float, amount: float, *, force: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        side/price/amount로 resting 주문을 맞춘다. 같은 방향/가격 주문이 이미 있으면 no-op.
+        force=True: 가격이 같아도 취소 후 재주문 (주문이 오더북에 없는 것으로 판단된 경우 - 체결/post-only 거절)
+        반환: 추적 중인 주문 dict (주문 실패 시 None, 예외는 호출 측으로 전파)
+        """
+        order = self.order
+        if force:
+            if not await self.cancel():
+                return None
+            return await self._create(side, price, amount)
+        if order and order["side"] == side and order["price"] == price:
+            self.skipped += 1
+            return order
+
+        if order and order["side"] == side and order["id"] is not None and self.native_modify:
+            try:
+                kwargs = {"tif": "Alo"} if self.post_only and self._modify_tif else {}
+                new_id = await self.ex.modify_order(self.symbol, order["id"], side, amount, price, **kwargs)
+            except NotImplementedError:
+                self.native_modify = False
+            except Exception as e:
+                # 정정 실패 (이미 체결/취소 등) -> 취소 후 신규 주문으로 진행
+                logger.warning(f"[order] modify 실패 ({order['id']}), cancel/create로 전환: {e}")
+            else:
+                self.modifies += 1
+                order.update(id=new_id or order["id"], price=price, size=amount)
+                return order
+
+        if not await self.cancel():
+            return None  # 기존 주문이 살아 있을 수 있음 -> 추적 유지, 다음 tick에 재시도
+        return await self._create(side, price, amount)
+
+    async def _create(self, side: str, price: float, amount: float) -> Optional[Dict[str, Any]]:
+        client_id = self.ex.new_client_id()
+        kwargs = self._post_only_kwargs()
+        if "client_id" in self._accepts:
+            kwargs["client_id"] = client_id
+        result = await self.ex.create_order(self.symbol, side, amount, price, "limit", **kwargs)
+        self.creates += 1
+        order_id = extract_order_id(result)
+        if order_id is None and not result:
+            logger.error(f"[order] create_order 실패: {result}")
+            return None
+        self.order = {"client_id": client_id, "id": order_id, "side": side, "price": price, "size": amount}
+        return self.order
+
+    def _post_only_kwargs(self) -> Dict[str, Any]:
+        if "post_only" in self._accepts:
+            return {"post_only": self.post_only}
+        if "tif" in self._accepts and self.post_only:
+            return {"tif": "Alo"}
+        return {}
+
+    async def cancel(self) -> bool:
+        """
+        추적 중인 주문 취소 (order id를 알면 open orders 조회 없이). 취소가 확인되면 추적 해제 후 True.
+        확인 실패(429/네트워크/이미 없는 id 등) -> 심볼 전체 취소 + open orders 확인, 그래도 남아 있으면 추적 유지 후 False
+        """
+        order = self.order
+        if order is None:
+            return True
+        self.cancels += 1
+        if order["id"] is not None:
+            # Hyperliquid 래퍼는 order_id 키, 나머지는 id 키를 사용
+            target = {"id": order["id"], "order_id": order["id"], "symbol": self.symbol}
+            try:
+                result = await self.ex.cancel_orders(self.symbol, [target])
+            except Exception as e:
+                result = None
+                logger.warning(f"[order] cancel 실패 ({order['id']}): {e}")
+            if cancel_confirmed(result):
+                self.order = None
+                return True
+            logger.warning(f"[order] cancel 미확인 ({order['id']}): {result} -> 심볼 전체 취소로 확인")
+        if await self._cancel_symbol():
+            self.order = None
+            return True
+        logger.error(f"[order] 주문 취소 확인 실패 - 기존 주문 추적 유지 ({order['id']})")
+        return False
+
+    async def cancel_all(self) -> bool:
+        """심볼 전체 취소 + 남은 주문 없음 확인 (단계 전환 시 정리용). 확인되면 True"""
+        self.cancels += 1
+        if await self._cancel_symbol():
+            self.order = None
+            return True
+        return False
+
+    async def _cancel_symbol(self) -> bool:
+        try:
+            await self.ex.cancel_orders(self.symbol)
+            remaining = await self.ex.get_open_orders(self.symbol)
+        except Exception as e:
+            logger.warning(f"[order] 심볼 전체 취소 실패 ({self.symbol}): {e}")
+            return False
+        if remaining:
+            logger.warning(f"[order] 취소 후에도 남은 주문 {len(remaining)}건 ({self.symbol})")
+            return False
+        return True
+
+    # ---------------------- 체결 ----------------------
+    def on_fill(self, fill: Dict[str, Any]) -> None:
+        """MultiPerpDex.fills() 이벤트 -> 잔량 갱신, 전량 체결 시 추적 해제"""
+        order = self.order
+        if order is None or order["id"] is None or str(fill.get("order_id")) != str(order["id"]):
+            return
+        order["size"] = round(order["size"] - float(fill.get("size") or 0), 12)
+        if order["size"] <= 0:
+            self.order = None
+
+    def stats(self) -> Dict[str, int]:
+        return {"creates": self.creates, "modifies": self.modifies, "cancels": self.cancels, "skipped": self.skipped}
@@ -0,0 +1,131 @@
+"""
+Order-book-aware post-only quoting
+==================================
+로컬 오더북(get_orderbook, Backpack/Pacifica WS 캐시)의 best bid/ask 기준으로 post-only 지정가를 정한다.
+- buy : best bid + improve_ticks * tick (best ask - 1 tick 상한 -> 스프레드가 1 tick이면 best bid에 join)
+- sell: best ask - improve_ticks * tick (best bid + 1 tick 하한)
+- 자기 주문이 이미 최우선 호가면 자기 수량을 빼고 판단:
+    다른 주문과 같은 가격에 있으면 그대로 유지 (queue priority 보존),
+    혼자 앞서 있으면 다음 레벨 + tick 으로 (다음 레벨이 멀어졌을 때만 가격이 바뀜)
+- 자기 주문 가격이 오더북 최우선 호가보다 좋은데 오더북에 없으면 (체결/post-only 거절) 재주문
+- 그 외 목표가가 현재 resting 가격과 같으면 유지 -> 호출 측은 keep=False 일 때만 cancel/replace
+
+오더북이 없는 거래소(get_orderbook 미지원/타임아웃/교차 호가)는 mark price + offset (기존 방식)으로 fallback.
+
+사용:
+    engine = QuoteEngine(ex, symbol, buy_offset=-0.5, sell_offset=0.5)
+    await engine.init()
+    price, keep = await engine.quote("buy", resting_price=order_price, resting_size=remaining)
+    if not keep: ... (price로 재주문)
+"""
+import logging
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 자기 주문 수량 비교 허용 오차 (레벨 수량 <= 자기 수량 * (1 + EPS) 이면 그 레벨은 자기 주문뿐)
+SIZE_EPS = 1e-9
+
+
+class QuoteEngine:
+    def __init__(self, ex, symbol, *, improve_ticks: int = 1, buy_offset: float = 0.0, sell_offset: float = 0.0):
+        self.ex = ex
+        self.symbol = symbol
+        self.improve_ticks = improve_ticks
+        self.buy_offset = buy_offset    # fallback: mark + buy_offset
+        self.sell_offset = sell_offset  # fallback: mark + sell_offset
+        self.tick: Optional[Decimal] = None
+        self.use_book = hasattr(ex, "get_orderbook")
+
+        # 통계 (사이클 로그용)
+        self.book_quotes = 0
+        self.mark_quotes = 0
+
+    async def init(self) -> "QuoteEngine":
+        try:
+            self.tick = Decimal(str(await self.ex.get_tick_size(self.symbol)))
+        except NotImplementedError:
+            self.tick = None
+        except Exception as e:
+            logger.warning(f"[quote] tick size 조회 실패 ({self.symbol}): {e}")
+            self.tick = None
+        if self.tick is not None and self.tick <= 0:
+            self.tick = None
+        if self.tick is None:
+            self.use_book = False
+        logger.info(f"[quote] {self.symbol} mode={'book' if self.use_book else 'mark'} tick={self.tick}")
+        return self
+
+    def _round(self, price: Decimal) -> float:
+        return float((price / self.tick).to_integral_value(rounding=ROUND_HALF_UP) * self.tick)
+
+    async def _levels(self) -> Optional[Tuple[list, list]]:
+        try:
+            book = await self.ex.get_orderbook(self.symbol)
+        except Exception as e:
+            logger.warning(f"[quote] orderbook 조회 실패 ({self.symbol}): {e}")
+            return None
+        if not book:
+            return None
+        bids, asks = book.get("bids") or [], book.get("asks") or []
+        if not bids or not asks or float(bids[0][0]) >= float(asks[0][0]):
+            return None  # 한쪽이 비었거나 교차 (resync 중)
+        return bids, asks
+
+    async def quote(self, side: str, resting_price: Optional[float] = None,
+                    resting_size: float = 0.0) -> Tuple[Optional[float], bool]:
+        """
+        side 방향 post-only 목표가 -> (price, keep).
+        resting_price/resting_size: 현재 걸려 있는 자기 주문 (없으면 None).
+        keep=True 이면 resting 주문 유지 (price == resting_price). 가격을 못 구하면 (None, False).
+        """
+        price = None
+        if self.use_book:
+            levels = await self._levels()
+            if levels is not None:
+                self.book_quotes += 1
+                price, missing = self._quote_from_book(side, *levels, resting_price, resting_size)
+                if missing:
+                    return price, False
+        if price is None:
+            self.mark_quotes += 1
+            price = await self._quote_from_mark(side)
+        keep = price is not None and resting_price is not None and price == resting_price
+        return price, keep
+
+    def _quote_from_book(self, side, bids, asks, resting_price, resting_size) -> Tuple[float, bool]:
+        """(목표가, resting 주문이 오더북에 없음)"""
+        tick = self.tick
+        same, opposite = (bids, asks) if side == "buy" else (asks, bids)
+        sign = 1 if side == "buy" else -1
+
+        ref = Decimal(str(same[0][0]))
+        missing = False
+        if resting_price is not None:
+            diff = (Decimal(str(resting_price)) - ref) * sign
+            if diff > tick / 2:
+                missing = True  # 최우선 호가보다 좋은 가격인데 오더북에 없음 (체결 or 거절)
+            elif abs(diff) < tick / 2:
+                if float(same[0][1]) > resting_size * (1 + SIZE_EPS):
+                    return resting_price, False  # 다른 주문과 같은 최우선 가격 -> 유지
+                # 최우선 레벨이 자기 주문뿐 -> 다음 레벨 기준 (없으면 현재 가격 유지)
+                if len(same) < 2:
+                    return resting_price, False
+                ref = Decimal(str(same[1][0]))
+
+        target = ref + sign * self.improve_ticks * tick
+        limit = Decimal(str(opposite[0][0])) - sign * tick  # 반대편 최우선 호가와 교차하지 않는 한계
+        target = min(target, limit) if side == "buy" else max(target, limit)
+        # 스프레드가 1 tick이면 limit == ref 쪽으로 밀려 join
+        target = max(target, ref) if side == "buy" else min(target, ref)
+        return self._round(target), missing
+
+    async def _quote_from_mark(self, side: str) -> Optional[float]:
+        try:
+            mark = float(await self.ex.get_mark_price(self.symbol))
+        except Exception as e:
+            logger.error(f"[quote] mark price 조회 실패 ({self.symbol}): {e}")
+            return None
+        price = mark + (self.buy_offset if side == "buy" else self.sell_offset)
+        return self._round(Decimal(str(price))) if self.tick is not None else price
@@ -0,0 +1,104 @@
+import asyncio
+import os
+import ssl
+import sys
+import types
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# 네트워크 스택/키 없이 import: certifi 미설치면 대체 모듈, keys/ 는 로드하지 않음 (KEYS 비어 있음)
+try:
+    import certifi  # noqa: F401
+except ImportError:
+    certifi = types.ModuleType("certifi")
+    certifi.where = lambda: ssl.get_default_verify_paths().cafile or ""
+    sys.modules["certifi"] = certifi
+for _key_module in ("keys.pk_grvt", "keys.pk_backpack", "keys.pk_extended", "keys.pk_pacifica",
+                    "keys.pk_variational", "keys.pk_lighter"):
+    sys.modules.setdefault(_key_module, None)
+
+import multi_hedge_bot
+from multi_hedge_bot import MultiHedgeBot
+
+
+class FakeHedgeExchange:
+    def __init__(self, fail=False):
+        self.orders = []
+        self.fail = fail
+
+    async def create_order(self, symbol, side, amount, price=None, order_type="market"):
+        if self.fail:
+            raise RuntimeError("rejected")
+        self.orders.append((symbol, side, amount, order_type))
+
+
+def _bot(hedge_ex, last_positions):
+    bot = MultiHedgeBot(monitor_names=["a", "b", "c"], hedge_name="h", coin="BTC")
+    bot.hedge_ex = hedge_ex
+    bot.hedge_symbol = "BTC"
+    bot.last_positions = {name: Decimal(str(v)) for name, v in last_positions.items()}
+    return bot
+
+
+def test_offsetting_deltas_skip_order():
+    async def run():
+        ex = FakeHedgeExchange()
+        bot = _bot(ex, {"a": 0, "b": 0})
+        await bot.hedge_net({"a": Decimal("0.01"), "b": Decimal("-0.01")}, {})
+        assert ex.orders == []
+        assert bot.last_positions == {"a": Decimal("0.01"), "b": Decimal("-0.01")}
+
+    asyncio.run(run())
+
+
+def test_net_delta_single_order():
+    async def run():
+        ex = FakeHedgeExchange()
+        bot = _bot(ex, {"a": "0.01", "b": 0, "c": "-0.02"})
+        # a +0.02, b +0.01, c +0.01 -> 순변화 +0.04 -> sell 0.04 한 건
+        await bot.hedge_net({"a": Decimal("0.03"), "b": Decimal("0.01"), "c": Decimal("-0.01")}, {})
+        assert ex.orders == [("BTC", "sell", 0.04, "market")]
+        assert bot.last_positions["a"] == Decimal("0.03")
+
+        await bot.hedge_net({"a": Decimal("0.01")}, {})
+        assert ex.orders[-1] == ("BTC", "buy", 0.02, "market")
+
+    asyncio.run(run())
+
+
+def test_hedge_ratio_applied():
+    async def run():
+        ex = FakeHedgeExchange()
+        bot = _bot(ex, {"a": 0})
+        await bot.hedge_net({"a": Decimal("-0.02")}, {})
+        assert ex.orders == [("BTC", "buy", 0.01, "market")]
+
+    ratio = multi_hedge_bot.HEDGE_RATIO
+    multi_hedge_bot.HEDGE_RATIO = 0.5
+    try:
+        asyncio.run(run())
+    finally:
+        multi_hedge_bot.HEDGE_RATIO = ratio
+
+
+def test_failed_order_keeps_baseline():
+    async def run():
+        ex = FakeHedgeExchange(fail=True)
+        bot = _bot(ex, {"a": 0, "b": 0})
+        await bot.hedge_net({"a": Decimal("0.01")}, {})
+        # 실패하면 기준점 유지 -> 다음 주기에 같은 변화량으로 재시도
+        assert bot.last_positions == {"a": Decimal(0), "b": Decimal(0)}
+
+    asyncio.run(run())
+
+
+def test_latency_recorded_from_first_event():
+    async def run():
+        ex = FakeHedgeExchange()
+        bot = _bot(ex, {"a": 0})
+        await bot.hedge_net({"a": Decimal("0.01")}, {"a": 0.0})
+        assert len(bot.hedge_latencies) == 1
+
+    asyncio.run(run())
+
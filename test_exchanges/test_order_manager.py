@@ -0,0 +1,181 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from order_manager import OrderManager, cancel_confirmed, extract_order_id
+
+
+class FakeExchange:
+    """Backpack 형태: create_order(post_only, client_id) -> [{"id"}], by-id 취소 성공 시 주문 목록"""
+
+    def __init__(self):
+        self.calls = []
+        self.open = {}          # id -> order
+        self.next_id = 1
+        self.cancel_ok = True   # False: by-id 취소가 에러 (빈 목록)
+        self.stuck = False      # True: 심볼 전체 취소 후에도 주문이 남음
+
+    def new_client_id(self):
+        return f"c{self.next_id}"
+
+    async def create_order(self, symbol, side, amount, price=None, order_type="market", post_only=True, client_id=None):
+        self.calls.append(("create", side, price, post_only))
+        oid = str(self.next_id)
+        self.next_id += 1
+        self.open[oid] = {"id": oid, "side": side, "price": price, "size": amount}
+        return [{"id": oid}]
+
+    async def modify_order(self, symbol, order_id, side, amount, price):
+        raise NotImplementedError
+
+    async def cancel_orders(self, symbol, open_orders=None):
+        if open_orders is None:
+            self.calls.append(("cancel_all",))
+            if not self.stuck:
+                self.open.clear()
+            return []
+        self.calls.append(("cancel", open_orders[0]["id"]))
+        if not self.cancel_ok:
+            return []
+        return [self.open.pop(o["id"]) for o in open_orders if o["id"] in self.open]
+
+    async def get_open_orders(self, symbol):
+        return list(self.open.values())
+
+
+class FakeModifyExchange(FakeExchange):
+    """Hyperliquid 형태: create_order(tif), modify_order(tif)로 새 oid 반환"""
+
+    async def create_order(self, symbol, side, amount, price=None, order_type="market", *, tif=None, client_id=None):
+        self.calls.append(("create", side, price, tif))
+        oid = str(self.next_id)
+        self.next_id += 1
+        self.open[oid] = {"id": oid, "side": side, "price": price, "size": amount}
+        return oid
+
+    async def modify_order(self, symbol, order_id, side, amount, price, *, tif=None):
+        self.calls.append(("modify", order_id, price, tif))
+        order = self.open.pop(order_id)
+        oid = str(self.next_id)
+        self.next_id += 1
+        self.open[oid] = dict(order, id=oid, price=price, size=amount)
+        return oid
+
+
+class NoPostOnlyExchange(FakeExchange):
+    async def create_order(self, symbol, side, amount, price=None, order_type="market"):
+        return await super().create_order(symbol, side, amount, price, order_type)
+
+
+def test_requote_same_price_is_noop():
+    async def run():
+        ex = FakeExchange()
+        om = OrderManager(ex, "BTC")
+        await om.requote("buy", 100.0, 1.0)
+        await om.requote("buy", 100.0, 1.0)
+        assert ex.calls == [("create", "buy", 100.0, True)]
+        assert om.stats() == {"creates": 1, "modifies": 0, "cancels": 0, "skipped": 1}
+
+    asyncio.run(run())
+
+
+def test_requote_native_modify():
+    async def run():
+        ex = FakeModifyExchange()
+        om = OrderManager(ex, "BTC")
+        await om.requote("buy", 100.0, 1.0)
+        order = await om.requote("buy", 100.1, 1.0)
+        assert ex.calls == [("create", "buy", 100.0, "Alo"), ("modify", "1", 100.1, "Alo")]
+        assert order["id"] == "2" and order["price"] == 100.1
+        assert om.modifies == 1 and om.cancels == 0
+
+    asyncio.run(run())
+
+
+def test_requote_cancel_by_id_when_modify_unsupported():
+    async def run():
+        ex = FakeExchange()
+        om = OrderManager(ex, "BTC")
+        await om.requote("buy", 100.0, 1.0)
+        order = await om.requote("buy", 100.1, 1.0)
+        assert ex.calls[1:] == [("cancel", "1"), ("create", "buy", 100.1, True)]
+        assert not om.native_modify
+        assert order["id"] == "2" and list(ex.open) == ["2"]
+
+    asyncio.run(run())
+
+
+def test_requote_falls_back_to_symbol_cancel():
+    async def run():
+        ex = FakeExchange()
+        om = OrderManager(ex, "BTC")
+        await om.requote("buy", 100.0, 1.0)
+        ex.cancel_ok = False
+        order = await om.requote("buy", 100.1, 1.0)
+        # by-id 취소 미확인 -> 심볼 전체 취소 + open orders 확인 후 신규 주문
+        assert ex.calls[1:] == [("cancel", "1"), ("cancel_all",), ("create", "buy", 100.1, True)]
+        assert order["id"] == "2" and list(ex.open) == ["2"]
+
+    asyncio.run(run())
+
+
+def test_requote_keeps_tracking_when_cancel_unconfirmed():
+    async def run():
+        ex = FakeExchange()
+        om = OrderManager(ex, "BTC")
+        first = dict(await om.requote("buy", 100.0, 1.0))
+        ex.cancel_ok, ex.stuck = False, True
+        assert await om.requote("buy", 100.1, 1.0) is None
+        assert await om.requote("sell", 101.0, 1.0, force=True) is None
+        # 신규 주문 없음, 기존 주문 계속 추적
+        assert [c for c in ex.calls if c[0] == "create"] == [("create", "buy", 100.0, True)]
+        assert om.order == first
+        assert not await om.cancel_all()
+        ex.stuck = False
+        assert await om.cancel_all() and om.order is None
+
+    asyncio.run(run())
+
+
+def test_fill_accounting():
+    async def run():
+        ex = FakeExchange()
+        om = OrderManager(ex, "BTC")
+        await om.requote("sell", 101.0, 1.0)
+        om.on_fill({"order_id": "999", "size": 0.5})   # 다른 주문 -> 무시
+        assert om.order["size"] == 1.0
+        om.on_fill({"order_id": 1, "size": "0.3"})
+        assert om.order["size"] == 0.7
+        om.on_fill({"order_id": "1", "size": 0.7})
+        assert om.order is None
+        assert om.resting_price("sell") is None
+
+    asyncio.run(run())
+
+
+def test_post_only_required():
+    try:
+        OrderManager(NoPostOnlyExchange(), "BTC", post_only=True)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("post-only를 전달할 수 없는 래퍼를 허용함")
+    OrderManager(NoPostOnlyExchange(), "BTC", post_only=False)
+
+
+def test_result_shapes():
+    assert extract_order_id([{"id": "7"}]) == "7"
+    assert extract_order_id({"data": {"orderId": 8}}) == 8
+    assert extract_order_id(9) == 9
+    assert extract_order_id("10") == "10"
+    assert extract_order_id(True) is None
+    assert cancel_confirmed([{"id": "1", "status": "Cancelled"}])
+    assert cancel_confirmed({"status": "OK"})
+    assert cancel_confirmed({"order_id": "1", "ok": True})
+    assert not cancel_confirmed({"order_id": "1", "ok": False})
+    assert not cancel_confirmed({"status": "error"})
+    assert not cancel_confirmed([])
+    assert not cancel_confirmed(None)
+
@@ -0,0 +1,117 @@
+import asyncio
+import os
+import sys
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from quoting import QuoteEngine
+
+
+class FakeBookExchange:
+    def __init__(self, bids, asks, mark=100.0, tick=0.1):
+        self.book = {"bids": bids, "asks": asks}
+        self.mark = mark
+        self.tick = tick
+
+    async def get_tick_size(self, symbol):
+        return self.tick
+
+    async def get_orderbook(self, symbol):
+        return self.book
+
+    async def get_mark_price(self, symbol):
+        return self.mark
+
+
+def _engine(improve_ticks=1):
+    engine = QuoteEngine(FakeBookExchange([], []), "BTC", improve_ticks=improve_ticks)
+    engine.tick = Decimal("0.1")
+    return engine
+
+
+def test_improve_inside_spread():
+    engine = _engine()
+    bids, asks = [[100.0, 1]], [[101.0, 1]]
+    assert engine._quote_from_book("buy", bids, asks, None, 0.0) == (100.1, False)
+    assert engine._quote_from_book("sell", bids, asks, None, 0.0) == (100.9, False)
+
+
+def test_join_when_spread_is_one_tick():
+    engine = _engine(improve_ticks=3)
+    bids, asks = [[100.0, 1]], [[100.1, 1]]
+    # 개선하면 반대편과 교차 -> 최우선 호가에 join
+    assert engine._quote_from_book("buy", bids, asks, None, 0.0) == (100.0, False)
+    assert engine._quote_from_book("sell", bids, asks, None, 0.0) == (100.1, False)
+
+
+def test_improve_clamped_below_opposite_side():
+    engine = _engine(improve_ticks=5)
+    bids, asks = [[100.0, 1]], [[100.3, 1]]
+    assert engine._quote_from_book("buy", bids, asks, None, 0.0) == (100.2, False)
+    assert engine._quote_from_book("sell", bids, asks, None, 0.0) == (100.1, False)
+
+
+def test_shared_best_level_is_kept():
+    engine = _engine()
+    # 최우선 100.1에 자기 주문(1) + 다른 주문(2) -> queue priority 유지
+    bids, asks = [[100.1, 3], [100.0, 5]], [[101.0, 1]]
+    assert engine._quote_from_book("buy", bids, asks, 100.1, 1.0) == (100.1, False)
+
+
+def test_own_size_excluded_from_best_level():
+    engine = _engine()
+    # 최우선 레벨이 자기 주문뿐 -> 다음 레벨(100.0) + 1 tick = 현재 가격 유지
+    bids, asks = [[100.1, 1], [100.0, 5]], [[101.0, 1]]
+    assert engine._quote_from_book("buy", bids, asks, 100.1, 1.0) == (100.1, False)
+    # 다음 레벨이 멀어지면 그 레벨 + 1 tick으로 물러남
+    bids = [[100.1, 1], [99.5, 5]]
+    assert engine._quote_from_book("buy", bids, asks, 100.1, 1.0) == (99.6, False)
+    # sell 방향도 동일
+    bids, asks = [[99.0, 1]], [[100.0, 2], [100.5, 5]]
+    assert engine._quote_from_book("sell", bids, asks, 100.0, 2.0) == (100.4, False)
+
+
+def test_own_only_level_without_next_level_keeps_price():
+    engine = _engine()
+    bids, asks = [[100.1, 1]], [[101.0, 1]]
+    assert engine._quote_from_book("buy", bids, asks, 100.1, 1.0) == (100.1, False)
+
+
+def test_missing_resting_order_detected():
+    engine = _engine()
+    # resting buy 100.3이 최우선 bid(100.1)보다 좋은데 오더북에 없음 -> 체결/거절
+    bids, asks = [[100.1, 1]], [[101.0, 1]]
+    price, missing = engine._quote_from_book("buy", bids, asks, 100.3, 1.0)
+    assert missing and price == 100.2
+    price, missing = engine._quote_from_book("sell", [[99.0, 1]], [[100.0, 1]], 99.8, 1.0)
+    assert missing and price == 99.9
+    # 최우선보다 뒤에 있는 주문은 missing 아님 -> 개선 가격으로 재호가
+    assert engine._quote_from_book("buy", bids, asks, 99.8, 1.0) == (100.2, False)
+
+
+def test_quote_keep_and_missing():
+    async def run():
+        ex = FakeBookExchange([[100.1, 3], [100.0, 5]], [[101.0, 1]])
+        engine = await QuoteEngine(ex, "BTC").init()
+        assert engine.use_book
+        assert await engine.quote("buy", 100.1, 1.0) == (100.1, True)
+        assert await engine.quote("buy") == (100.2, False)
+        # 오더북에 없는 resting 주문 -> 같은 가격이어도 keep=False
+        ex.book = {"bids": [[100.0, 5]], "asks": [[101.0, 1]]}
+        assert await engine.quote("buy", 100.1, 1.0) == (100.1, False)
+
+    asyncio.run(run())
+
+
+def test_crossed_book_falls_back_to_mark():
+    async def run():
+        ex = FakeBookExchange([[101.0, 1]], [[100.0, 1]], mark=100.04)
+        engine = QuoteEngine(ex, "BTC", buy_offset=-0.5, sell_offset=0.5)
+        await engine.init()
+        assert await engine.quote("buy") == (99.5, False)
+        assert await engine.quote("sell") == (100.5, False)
+        assert engine.mark_quotes == 2
+
+    asyncio.run(run())
+
@@ -11,7 +11,9 @@ from decimal import Decimal
 os.environ['SSL_CERT_FILE'] = certifi.where()
 os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
 
-from exchange_factory import create_exchange, symbol_create
+from exchange_factory import create_exchanges, symbol_create
+from order_manager import OrderManager
+from quoting import QuoteEngine
 from keys.pk_backpack import BACKPACK_KEY
 from keys.pk_pacifica import PACIFICA_KEY
 from keys.pk_extended import EDGEX_KEY as EXTENDED_KEY
@@ -31,8 +33,10 @@ logger.addHandler(ch)
 TARGET_EXCHANGE = "backpack"  # 대상 거래소: backpack, pacifica, extended
 COIN = "BTC"                  # 거래 대상 코인
 AMOUNT = 0.005                # 거래 수량 (BTC 단위)
-BUY_OFFSET = -0.5             # 매수 시 마크 프라이스 대비 가격
+BUY_OFFSET = -0.5             # 매수 시 마크 프라이스 대비 가격 (QUOTE_MODE="mark" 또는 오더북 미지원 거래소)
 SELL_OFFSET = 0.5             # 매도 시 마크 프라이스 대비 가격
+QUOTE_MODE = "book"           # "book": 오더북 최우선 호가 join/개선, "mark": 마크 프라이스 + OFFSET
+IMPROVE_TICKS = 1             # book 모드: 최우선 호가 대비 개선 tick 수 (0 = join)
 
 HEDGE_WAIT_TIME = 120         # 사이클 중간 대기 시간 (초) - 신규 요구사항: 2분
 COOLDOWN_TIME = 5           # 사이클 종료 후 대기 시간 (초)
@@ -71,10 +75,29 @@ class VolumeBot:
         # 실시간 변화 추적용
         self.last_pos_for_hedge = Decimal(0)
 
+        # 체결 스트림 (fills) - 마지막 헷징 이후 체결 누적 (로그 체결가 = VWAP)
+        self._fill_notional = Decimal(0)
+        self._fill_size = Decimal(0)
+        self._fill_task = None
+
+        self.quote_engine = None
+        self.orders = None            # 자기 resting 주문 추적 (OrderManager)
+        self.cycle_orders = 0         # 사이클당 재호가 수 (modify 또는 cancel/create)
+        self.cycle_kept = 0           # 가격 유지로 재주문을 건너뛴 횟수
+
     async def init_exchanges(self):
         logger.info(f"Initializing exchanges: {self.target_name} and {HEDGE_EXCHANGE_NAME}")
-        self.target_ex = await create_exchange(self.target_name, EXCHANGES_CONFIG[self.target_name])
-        self.hedge_ex = await create_exchange(HEDGE_EXCHANGE_NAME, HEDGE_CONFIG)
+        instances, errors = await create_exchanges({
+            self.target_name: EXCHANGES_CONFIG[self.target_name],
+            HEDGE_EXCHANGE_NAME: HEDGE_CONFIG,
+        })
+        if errors:
+            # 대상/헤징 거래소 모두 필요 -> 하나라도 실패하면 정리 후 중단
+            for ex in instances.values():
+                await ex.close()
+            raise RuntimeError(f"Exchange init failed: {errors}")
+        self.target_ex = instances[self.target_name]
+        self.hedge_ex = instances[HEDGE_EXCHANGE_NAME]
         self.symbol = symbol_create(self.target_name, COIN)
         self.hedge_symbol = symbol_create(HEDGE_EXCHANGE_NAME, COIN)
         
@@ -88,6 +111,45 @@ class VolumeBot:
         logger.info(f"Initial Seed: {self.daily_start_seed}")
         logger.info(f"Initial Position: {self.last_pos_for_hedge}")
 
+        self.quote_engine = QuoteEngine(
+            self.target_ex, self.symbol,
+            improve_ticks=IMPROVE_TICKS, buy_offset=BUY_OFFSET, sell_offset=SELL_OFFSET,
+        )
+        await self.quote_engine.init()
+        if QUOTE_MODE != "book":
+            self.quote_engine.use_book = False
+        self.orders = OrderManager(self.target_ex, self.symbol, post_only=POST_ONLY)
+
+        self._fill_task = asyncio.create_task(self._watch_fills())
+
+    async def _watch_fills(self):
+        """대상 거래소 체결 스트림 -> 체결별 로그 + 헷징 로그용 체결가 누적 (mark price 재조회 대신 사용)"""
+        try:
+            async for fill in self.target_ex.fills(self.symbol, poll_interval=CHECK_INTERVAL):
+                if fill.get("price") is None:
+                    # 체결 스트림/이력 없는 거래소 (포지션 diff 폴링) -> sync_hedge와 중복이므로 중단
+                    logger.info(f"[체결] {self.target_name} 체결 스트림 없음 - 포지션 변화로만 추적")
+                    return
+                self.orders.on_fill(fill)
+                size = Decimal(str(fill["size"]))
+                self._fill_notional += size * Decimal(str(fill["price"]))
+                self._fill_size += size
+                maker = "maker" if fill.get("is_maker") else "taker" if fill.get("is_maker") is not None else "-"
+                logger.info(f"[체결] {self.target_name} {fill['side']} {fill['size']} @ {fill['price']} ({maker})")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"[체결] 체결 스트림 에러: {e}")
+
+    def _take_fill_price(self):
+        """마지막 헷징 이후 체결 VWAP (체결 이벤트가 없으면 None)"""
+        if not self._fill_size:
+            return None
+        price = self._fill_notional / self._fill_size
+        self._fill_notional = Decimal(0)
+        self._fill_size = Decimal(0)
+        return float(price)
+
     async def log_trade(self, last_price, trade_amount):
         if not last_price: return
         now = datetime.now()
@@ -156,7 +218,7 @@ class VolumeBot:
                 try:
                     await self.hedge_ex.create_order(self.hedge_symbol, side, float(amount), None, "market")
                     self.trades_count += 1
-                    price = await self.get_target_price()
+                    price = self._take_fill_price() or await self.get_target_price()
                     await self.log_trade(price, amount)
                 except Exception as e:
                     logger.error(f"[에러] Variational 헷징 주문 실패: {e}")
@@ -166,6 +228,14 @@ class VolumeBot:
         
         return curr_signed
 
+    async def _clear_orders(self, retries=5):
+        """심볼 전체 취소 + 남은 주문 없음 확인. 끝내 확인되지 않으면 예외 -> 메인 루프에서 사이클 재시작"""
+        for _ in range(retries):
+            if await self.orders.cancel_all():
+                return
+            await asyncio.sleep(CHECK_INTERVAL)
+        raise RuntimeError(f"{self.target_name} 주문 정리 실패 ({retries}회)")
+
     async def run_cycle(self):
         logger.info("--- 사이클 가동 ---")
         
@@ -174,8 +244,13 @@ class VolumeBot:
         base_pos = curr_signed
         target_buy = base_pos + self.amount_dec
         
+        self.cycle_orders = 0
+        self.cycle_kept = 0
+        cycle_start = time.time()
+
         # 1. 매수 단계 (Phase 1)
         logger.info(f"[매수] 시작 -> 목표: {target_buy}")
+        await self._clear_orders()  # 이전 사이클/수동 주문 정리
         while True:
             curr_signed = await self.sync_hedge()
             
@@ -183,25 +258,28 @@ class VolumeBot:
                 logger.info("[매수] 목표 달성 완료")
                 break
                 
-            # 기존 주문 취소 후 새로 주문
-            await self.target_ex.cancel_orders(self.symbol)
-            price = await self.get_target_price()
-            if not price:
+            remaining = float(target_buy - curr_signed)
+            resting = self.orders.resting_price("buy")
+            buy_price, keep = await self.quote_engine.quote("buy", resting, remaining)
+            if keep:
+                # 오더북이 주문에서 벗어나지 않음 -> 유지 (queue priority, rate budget 보존)
+                self.cycle_kept += 1
+                await asyncio.sleep(CHECK_INTERVAL)
+                continue
+            if not buy_price:
                 await asyncio.sleep(2)
                 continue
-                
-            buy_price = price + BUY_OFFSET
-            remaining = float(target_buy - curr_signed)
-            
+
+            # 정정 (native modify 또는 알고 있는 order id만 취소 후 신규). 가격이 같은데 keep=False면 주문이 사라진 것
             logger.info(f"[{self.target_name}] 매수 주문 (Post-Only): {buy_price}, 남은수량: {remaining}")
             try:
-                await self.target_ex.create_order(
-                    self.symbol, "buy", remaining, buy_price, "limit", post_only=POST_ONLY
-                )
+                if await self.orders.requote("buy", buy_price, remaining, force=buy_price == resting) is not None:
+                    self.cycle_orders += 1
                 await asyncio.sleep(CHECK_INTERVAL)
             except Exception as e:
                 logger.error(f"주문 에러: {e}")
                 await asyncio.sleep(1)
+        await self._clear_orders()  # 단계 전환: 남은/추적에서 빠진 매수 주문이 유지/매도 단계까지 걸려 있지 않도록
 
         # 2. 유지 단계 (Phase 2)
         logger.info(f"[유지] {HEDGE_WAIT_TIME}초 동안 실시간 감시 시작...")
@@ -230,37 +308,59 @@ class VolumeBot:
                     logger.info("[매도] 기준점 복귀 완료")
                     break
                     
-                await self.target_ex.cancel_orders(self.symbol)
-                price = await self.get_target_price()
-                if not price:
+                excess = float(curr_signed - base_pos)
+                resting = self.orders.resting_price("sell")
+                sell_price, keep = await self.quote_engine.quote("sell", resting, excess)
+                if keep:
+                    self.cycle_kept += 1
+                    await asyncio.sleep(CHECK_INTERVAL)
+                    continue
+                if not sell_price:
                     await asyncio.sleep(2)
                     continue
-                    
-                sell_price = price + SELL_OFFSET
-                excess = float(curr_signed - base_pos)
-                
+
                 logger.info(f"[{self.target_name}] 매도 주문 (Post-Only): {sell_price}, 남은수량: {excess}")
                 try:
-                    await self.target_ex.create_order(
-                        self.symbol, "sell", excess, sell_price, "limit", post_only=POST_ONLY
-                    )
+                    if await self.orders.requote("sell", sell_price, excess, force=sell_price == resting) is not None:
+                        self.cycle_orders += 1
                     await asyncio.sleep(CHECK_INTERVAL)
                 except Exception as e:
                     logger.error(f"주문 에러: {e}")
                     await asyncio.sleep(1)
 
+        await self._clear_orders()
         await self.sync_hedge()
+        logger.info(
+            f"[통계] 재호가 {self.cycle_orders}건, 유지 {self.cycle_kept}회, 사이클 소요 {time.time() - cycle_start:.0f}초, "
+            f"누적 {self.orders.stats()}"
+        )
         logger.info(f"사이클 종료. {COOLDOWN_TIME}초 대기...")
         await asyncio.sleep(COOLDOWN_TIME)
 
-    async def start(self):
-        await self.init_exchanges()
-        while True:
+    async def close(self):
+        """체결 스트림 task 정리 (리스너/폴러 해제) 후 거래소 연결 종료"""
+        if self._fill_task is not None:
+            self._fill_task.cancel()
             try:
-                await self.run_cycle()
-            except Exception as e:
-                logger.error(f"Main Loop Error: {e}", exc_info=True)
-                await asyncio.sleep(10)
+                await self._fill_task
+            except asyncio.CancelledError:
+                pass
+            self._fill_task = None
+        for ex in (self.target_ex, self.hedge_ex):
+            if ex is not None:
+                await ex.close()
+
+    async def start(self):
+        try:
+            await self.init_exchanges()
+            while True:
+                try:
+                    await self.run_cycle()
+                except Exception as e:
+                    logger.error(f"Main Loop Error: {e}", exc_info=True)
+                    await asyncio.sleep(10)
+        finally:
+            await self.close()
 
 if __name__ == "__main__":
     bot = VolumeBot(TARGET_EXCHANGE, AMOUNT)
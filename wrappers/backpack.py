@@ -1,26 +1,37 @@
-import base64
+import asyncio
 import time
 import uuid
-import nacl.signing
 import aiohttp
 import logging
 from multi_perp_dex import MultiPerpDex, MultiPerpDexMixin
 from decimal import Decimal, ROUND_DOWN
 from typing import Optional, Dict, Any
 
+from wrappers.backpack_signer import get_signer, sorted_params
 from wrappers.backpack_ws_client import WS_POOL, BackpackWSClient
+from wrappers.http_pool import HTTP_POOL
+from wrappers.meta_cache import META_CACHE
 
 logger = logging.getLogger(__name__)
 
+# 마켓 필터(tickSize/stepSize) 주기적 재조회 간격 (초)
+MARKET_REFRESH_INTERVAL = 3600.0
+
 class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
-    def __init__(self,api_key,secret_key):
+    def __init__(self,api_key,secret_key,*,http_session: Optional[aiohttp.ClientSession] = None):
         super().__init__()
         self.has_spot = True
         self.API_KEY = api_key #API_KEY_TRADING
         self.PRIVATE_KEY = secret_key #SECRET_TRADING
+        self._signer = get_signer(secret_key)  # SigningKey는 1회만 생성해서 재사용
         self.BASE_URL = "https://api.backpack.exchange/api/v1"
         self.COLLATERAL_SYMBOL = 'USDC'
         self._ws_client: Optional[BackpackWSClient] = None
+        # 공유 keep-alive 세션 (exchange_factory에서 주입, 없으면 HTTP_POOL에서 획득)
+        self._http: Optional[aiohttp.ClientSession] = http_session
+        # symbol -> {"tickSize": str, "stepSize": str} (create_order에서 REST 조회 없이 사용)
+        self._market_filters: Dict[str, Dict[str, str]] = {}
+        self._market_refresh_task: Optional[asyncio.Task] = None
         # WS support flags
         self.ws_supported = {
             "get_mark_price": True,
@@ -43,36 +54,81 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
         # Subscribe to position and order updates
         await self._ws_client.subscribe_position()
         await self._ws_client.subscribe_orders()
+        if self._market_refresh_task is None:
+            self._market_refresh_task = asyncio.create_task(self._market_refresh_loop())
         return self
 
+    def _session(self) -> aiohttp.ClientSession:
+        if self._http is None or self._http.closed:
+            self._http = HTTP_POOL.acquire()
+        return self._http
+
     async def update_avaiable_symbols(self):
+        # 디스크 메타 캐시로 즉시 기동, TTL 지나면 백그라운드 재조회
+        result, _ = await META_CACHE.get(
+            f"backpack:{self.BASE_URL}/markets",
+            self._fetch_markets,
+            on_refresh=self._apply_markets,
+            validate=lambda r: isinstance(r, list) and len(r) > 0,
+        )
+        self._apply_markets(result)
+
+    async def _fetch_markets(self):
+        session = self._session()
+        async with session.get(f"{self.BASE_URL}/markets") as resp:
+            resp.raise_for_status()
+            return await resp.json()
+
+    async def _market_refresh_loop(self):
+        """마켓 필터 주기적 갱신 (tickSize/stepSize 변경 반영)"""
+        while True:
+            await asyncio.sleep(MARKET_REFRESH_INTERVAL)
+            try:
+                result = await self._fetch_markets()
+            except Exception as e:
+                logger.warning(f"[backpack] market refresh failed: {e}")
+                continue
+            if isinstance(result, list) and result:
+                META_CACHE.save(f"backpack:{self.BASE_URL}/markets", result)
+                self._apply_markets(result)
+
+    def _apply_markets(self, result):
         self.available_symbols['perp'] = []
         self.available_symbols['spot'] = []
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.BASE_URL}/markets") as resp:
-                result = await resp.json()
-                for v in result:
-                    symbol = v.get("symbol")
-                    base_symbol = v.get("baseSymbol")
-                    quote = v.get("quoteSymbol")
-                    market_type = v.get("marketType")
-                    if market_type == 'PERP':
-                        composite_symbol = f"{base_symbol}-{quote}"
-                        self.available_symbols['perp'].append(composite_symbol)
-                    else:
-                        composite_symbol = f"{base_symbol}/{quote}"
-                        self.available_symbols['spot'].append(composite_symbol)
-                        #print(v)
-                        #break
-                    #print(market_type,base_symbol,quote,symbol)
-        
+        for v in result or []:
+            self._store_market_filters(v)
+            base_symbol = v.get("baseSymbol")
+            quote = v.get("quoteSymbol")
+            market_type = v.get("marketType")
+            if market_type == 'PERP':
+                composite_symbol = f"{base_symbol}-{quote}"
+                self.available_symbols['perp'].append(composite_symbol)
+            else:
+                composite_symbol = f"{base_symbol}/{quote}"
+                self.available_symbols['spot'].append(composite_symbol)
+
+    def _store_market_filters(self, market):
+        symbol = market.get("symbol")
+        filters = market.get("filters") or {}
+        try:
+            self._market_filters[symbol] = {
+                "tickSize": filters["price"]["tickSize"],
+                "stepSize": filters["quantity"]["stepSize"],
+            }
+        except (KeyError, TypeError):
+            pass
+
+    async def _get_market_filters(self, symbol):
+        """(tick_size, step_size) - 메모리 테이블 우선, 없으면 REST /market 1회 조회 후 저장"""
+        filters = self._market_filters.get(symbol)
+        if filters is None:
+            market_info = await self._get_market_info(self._session(), symbol)
+            self._store_market_filters(market_info)
+            filters = self._market_filters[symbol]
+        return float(filters["tickSize"]), float(filters["stepSize"])
 
     def _generate_signature(self, instruction):
-        private_key_bytes = base64.b64decode(self.PRIVATE_KEY)
-        signing_key = nacl.signing.SigningKey(private_key_bytes)
-        signature = signing_key.sign(instruction.encode())
-        return base64.b64encode(signature.signature).decode()
+        return self._signer.sign(instruction)
 
     @staticmethod
     def _to_decimal(v) -> Decimal:
@@ -114,11 +170,7 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
         Serialize and sort data for signature generation.
         Booleans are converted to 'true'/'false' strings.
         """
-        def val_to_str(v):
-            if isinstance(v, bool):
-                return str(v).lower()
-            return str(v)
-        return "&".join(f"{k}={val_to_str(v)}" for k, v in sorted(data.items()))
+        return sorted_params(data)
     
     def get_perp_quote(self, symbol, *, is_basic_coll=False):
         return 'USDC'
@@ -157,18 +209,18 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
             "X-WINDOW": window,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.BASE_URL}/capital", headers=headers) as resp:
-                # 에러 응답 처리
-                if resp.status >= 400:
-                    ct = (resp.headers.get("content-type") or "").lower()
-                    if "application/json" in ct:
-                        body = await resp.json()
-                    else:
-                        body = await resp.text()
-                    raise RuntimeError(f"get_spot_balance failed: {resp.status} {body}")
+        session = self._session()
+        async with session.get(f"{self.BASE_URL}/capital", headers=headers) as resp:
+            # 에러 응답 처리
+            if resp.status >= 400:
+                ct = (resp.headers.get("content-type") or "").lower()
+                if "application/json" in ct:
+                    body = await resp.json()
+                else:
+                    body = await resp.text()
+                raise RuntimeError(f"get_spot_balance failed: {resp.status} {body}")
 
-                data = await resp.json()
+            data = await resp.json()
 
         # data: { "COIN": { "available": str, "locked": str, "staked": str }, ... }
         if not isinstance(data, dict):
@@ -247,77 +299,79 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
 
     async def get_mark_price_rest(self, symbol):
         """Get mark price via REST API"""
-        async with aiohttp.ClientSession() as session:
-            res = await self._get_mark_prices(session, symbol)
-            if isinstance(res, list):
-                # perp
-                price = res[0]['markPrice']
-            else:
-                # spot
-                price = res['lastPrice']
-            return price
+        res = await self._get_mark_prices(self._session(), symbol)
+        if isinstance(res, list):
+            # perp
+            price = res[0]['markPrice']
+        else:
+            # spot
+            price = res['lastPrice']
+        return price
 
-    async def create_order(self, symbol, side, amount, price=None, order_type='market', post_only=True):
+    def new_client_id(self):
+        """Backpack clientId: uint32"""
+        return uuid.uuid4().int % (2**32)
+
+    async def create_order(self, symbol, side, amount, price=None, order_type='market', post_only=True, client_id=None):
         if price != None:
             order_type = 'limit'
         
-        client_id = uuid.uuid4().int % (2**32)
+        if client_id is None:
+            client_id = uuid.uuid4().int % (2**32)
         
         order_type = 'Market' if order_type.lower() == 'market' else 'Limit'
         
         side = 'Bid' if side.lower() == 'buy' else 'Ask'
 
-        async with aiohttp.ClientSession() as session:
-            market_info = await self._get_market_info(session, symbol)
-            tick_size = float(market_info['filters']['price']['tickSize'])
-            step_size = float(market_info['filters']['quantity']['stepSize'])
+        session = self._session()
+        tick_size, step_size = await self._get_market_filters(symbol)
                        
-            step_d = self._to_decimal(step_size)
-            amount_d = self._to_decimal(amount)
-            quantity_d = (amount_d / step_d).to_integral_value(rounding=ROUND_DOWN) * step_d
-            quantity_str = self._format_number(quantity_d, step_size)
-
-            price_str = None
-            if order_type == "Limit":
-                tick_d = self._to_decimal(tick_size)
-                price_d = self._to_decimal(price)
-                price_d = (price_d / tick_d).to_integral_value(rounding=ROUND_DOWN) * tick_d
-                price_str = self._format_number(price_d, tick_size)
-
-            timestamp = str(int(time.time() * 1000))
-            window = "5000"
-            instruction_type = "orderExecute"
+        step_d = self._to_decimal(step_size)
+        amount_d = self._to_decimal(amount)
+        quantity_d = (amount_d / step_d).to_integral_value(rounding=ROUND_DOWN) * step_d
+        quantity_str = self._format_number(quantity_d, step_size)
+
+        price_str = None
+        if order_type == "Limit":
+            tick_d = self._to_decimal(tick_size)
+            price_d = self._to_decimal(price)
+            price_d = (price_d / tick_d).to_integral_value(rounding=ROUND_DOWN) * tick_d
+            price_str = self._format_number(price_d, tick_size)
+
+        timestamp = str(int(time.time() * 1000))
+        window = "5000"
+        instruction_type = "orderExecute"
             
-            order_data = {
-                "clientId": client_id,
-                "orderType": order_type,
-                "quantity": quantity_str,
-                "side": side,
-                "symbol": symbol
-            }
-            if order_type == "Limit":
-                order_data["price"] = price_str
-                if post_only:
-                    order_data["postOnly"] = True
-
-            sorted_data = self._get_sorted_data(order_data)
-            signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
-            signature = self._generate_signature(signing_string)
-
-            headers = {
-                "X-API-KEY": self.API_KEY,
-                "X-SIGNATURE": signature,
-                "X-TIMESTAMP": timestamp,
-                "X-WINDOW": window,
-                "Content-Type": "application/json; charset=utf-8"
-            }
+        order_data = {
+            "clientId": client_id,
+            "orderType": order_type,
+            "quantity": quantity_str,
+            "side": side,
+            "symbol": symbol
+        }
+        if order_type == "Limit":
+            order_data["price"] = price_str
+            if post_only:
+                order_data["postOnly"] = True
+
+        sorted_data = self._get_sorted_data(order_data)
+        signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
+        signature = self._generate_signature(signing_string)
+
+        headers = {
+            "X-API-KEY": self.API_KEY,
+            "X-SIGNATURE": signature,
+            "X-TIMESTAMP": timestamp,
+            "X-WINDOW": window,
+            "Content-Type": "application/json; charset=utf-8"
+        }
 
-            async with session.post(f"{self.BASE_URL}/order", json=order_data, headers=headers) as resp:
-                if resp.status >= 400:
-                    error_text = await resp.text()
-                    logger.error(f"Backpack create_order failed: {resp.status} {error_text}")
-                    return []
-                return self.parse_orders(await resp.json())
+        async with session.post(f"{self.BASE_URL}/order", json=order_data, headers=headers) as resp:
+            if resp.status >= 400:
+                error_text = await resp.text()
+                logger.error(f"Backpack create_order failed: {resp.status} {error_text}")
+                return []
+            return self.parse_orders(await resp.json())
 
     async def get_position(self, symbol):
         """Get position via WS (preferred) or REST fallback"""
@@ -345,13 +399,13 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
             "X-WINDOW": window
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.BASE_URL}/position", headers=headers) as resp:
-                positions = await resp.json()
-                for pos in positions:
-                    if pos["symbol"] == symbol:
-                        return self.parse_position(pos)
-                return None
+        session = self._session()
+        async with session.get(f"{self.BASE_URL}/position", headers=headers) as resp:
+            positions = await resp.json()
+            for pos in positions:
+                if pos["symbol"] == symbol:
+                    return self.parse_position(pos)
+            return None
             
     def parse_position(self,position):
         if not position:
@@ -388,9 +442,9 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
             "X-WINDOW": window
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.BASE_URL}/capital/collateral", headers=headers) as resp:
-                return self.parse_collateral(await resp.json())
+        session = self._session()
+        async with session.get(f"{self.BASE_URL}/capital/collateral", headers=headers) as resp:
+            return self.parse_collateral(await resp.json())
                 
     def parse_collateral(self,collateral):
         coll_return = {
@@ -420,6 +474,10 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
     async def close_position(self, symbol, position):
         return await super().close_position(symbol, position)
 
+    async def get_tick_size(self, symbol):
+        tick_size, _ = await self._get_market_filters(symbol)
+        return tick_size
+
     async def get_orderbook(self, symbol) -> Optional[Dict[str, Any]]:
         """Get orderbook via WS"""
         if not self._ws_client:
@@ -442,10 +500,38 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
         if self._ws_client:
             await self._ws_client.unsubscribe_orderbook(symbol)
 
+    def add_position_listener(self, callback):
+        """Register callback(symbol) on positionUpdate pushes"""
+        if not self._ws_client:
+            return False
+        self._ws_client.add_listener("position", callback)
+        return True
+
+    def remove_position_listener(self, callback):
+        if self._ws_client:
+            self._ws_client.remove_listener("position", callback)
+
+    def add_fill_listener(self, callback):
+        """Register callback(fill) on orderUpdate orderFill pushes"""
+        if not self._ws_client:
+            return False
+        self._ws_client.add_listener("fill", callback)
+        return True
+
+    def remove_fill_listener(self, callback):
+        if self._ws_client:
+            self._ws_client.remove_listener("fill", callback)
+
     async def close(self):
         """Close the exchange connection"""
         # WS pool manages lifecycle, we just release our reference
         self._ws_client = None
+        if self._market_refresh_task is not None:
+            self._market_refresh_task.cancel()
+            self._market_refresh_task = None
+        if self._http is not None:
+            await HTTP_POOL.release(self._http)
+            self._http = None
     
     async def cancel_orders(self, symbol, open_orders=None):
         if open_orders is not None and not isinstance(open_orders, list):
@@ -453,58 +539,58 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
 
         if open_orders is not None:
             # Cancel specific orders by ID
-            async with aiohttp.ClientSession() as session:
-                results = []
-                for open_order in open_orders:
-                    timestamp = str(int(time.time() * 1000))
-                    window = "5000"
-                    instruction_type = "orderCancel"
-                    oid = open_order.get("id")
-                    current_symbol = open_order.get("symbol") or symbol
-                    # Backpack PERP might sometimes expect string for orderId in some environments
-                    order_data = {"orderId": str(oid), "symbol": current_symbol}
-                    sorted_data = self._get_sorted_data(order_data)
-                    signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
-                    signature = self._generate_signature(signing_string)
-                    headers = {
-                        "X-API-KEY": self.API_KEY,
-                        "X-SIGNATURE": signature,
-                        "X-TIMESTAMP": timestamp,
-                        "X-WINDOW": window,
-                        "Content-Type": "application/json; charset=utf-8"
-                    }
-                    # Try sending as JSON body for DELETE /order
-                    async with session.delete(f"{self.BASE_URL}/order", headers=headers, json=order_data) as response:
-                        if response.status >= 400:
-                            error_text = await response.text()
-                            logger.error(f"Backpack cancel_order failed for {oid}: {response.status} {error_text}")
-                            continue
-                        results.append(self.parse_orders(await response.json()))
-                results = [d for sub in results for d in sub]
-                return results
+            session = self._session()
+            results = []
+            for open_order in open_orders:
+                timestamp = str(int(time.time() * 1000))
+                window = "5000"
+                instruction_type = "orderCancel"
+                oid = open_order.get("id")
+                current_symbol = open_order.get("symbol") or symbol
+                # Backpack PERP might sometimes expect string for orderId in some environments
+                order_data = {"orderId": str(oid), "symbol": current_symbol}
+                sorted_data = self._get_sorted_data(order_data)
+                signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
+                signature = self._generate_signature(signing_string)
+                headers = {
+                    "X-API-KEY": self.API_KEY,
+                    "X-SIGNATURE": signature,
+                    "X-TIMESTAMP": timestamp,
+                    "X-WINDOW": window,
+                    "Content-Type": "application/json; charset=utf-8"
+                }
+                # Try sending as JSON body for DELETE /order
+                async with session.delete(f"{self.BASE_URL}/order", headers=headers, json=order_data) as response:
+                    if response.status >= 400:
+                        error_text = await response.text()
+                        logger.error(f"Backpack cancel_order failed for {oid}: {response.status} {error_text}")
+                        continue
+                    results.append(self.parse_orders(await response.json()))
+            results = [d for sub in results for d in sub]
+            return results
         
         # Cancel all orders for the given symbol
-        async with aiohttp.ClientSession() as session:
-            timestamp = str(int(time.time() * 1000))
-            window = "5000"
-            instruction_type = "orderCancelAll"
-            order_data = {"symbol": symbol}
-            sorted_data = self._get_sorted_data(order_data)
-            signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
-            signature = self._generate_signature(signing_string)
-            headers = {
-                "X-API-KEY": self.API_KEY,
-                "X-SIGNATURE": signature,
-                "X-TIMESTAMP": timestamp,
-                "X-WINDOW": window,
-                "Content-Type": "application/json; charset=utf-8"
-            }
-            async with session.delete(f"{self.BASE_URL}/orders", headers=headers, json=order_data) as response:
-                if response.status >= 400:
-                    error_text = await response.text()
-                    logger.error(f"Backpack cancel_orders (all) failed: {response.status} {error_text}")
-                    return []
-                return self.parse_orders(await response.json())
+        session = self._session()
+        timestamp = str(int(time.time() * 1000))
+        window = "5000"
+        instruction_type = "orderCancelAll"
+        order_data = {"symbol": symbol}
+        sorted_data = self._get_sorted_data(order_data)
+        signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
+        signature = self._generate_signature(signing_string)
+        headers = {
+            "X-API-KEY": self.API_KEY,
+            "X-SIGNATURE": signature,
+            "X-TIMESTAMP": timestamp,
+            "X-WINDOW": window,
+            "Content-Type": "application/json; charset=utf-8"
+        }
+        async with session.delete(f"{self.BASE_URL}/orders", headers=headers, json=order_data) as response:
+            if response.status >= 400:
+                error_text = await response.text()
+                logger.error(f"Backpack cancel_orders (all) failed: {response.status} {error_text}")
+                return []
+            return self.parse_orders(await response.json())
     
     async def get_open_orders(self, symbol):
         """Get open orders via WS (preferred) or REST fallback"""
@@ -519,28 +605,28 @@ class BackpackExchange(MultiPerpDexMixin, MultiPerpDex):
 
     async def get_open_orders_rest(self, symbol):
         """Get open orders via REST API"""
-        async with aiohttp.ClientSession() as session:
-            timestamp = str(int(time.time() * 1000))
-            window = "5000"
-            instruction_type = "orderQueryAll"
-            market_type = "PERP"  # PERP 마켓 지정
-
-            params = {
-                "marketType": market_type,
-                "symbol": symbol
-            }
-            sorted_data = self._get_sorted_data(params)
-            signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
-            signature = self._generate_signature(signing_string)
-
-            headers = {
-                "X-API-KEY": self.API_KEY,
-                "X-SIGNATURE": signature,
-                "X-TIMESTAMP": timestamp,
-                "X-WINDOW": window
-            }
+        session = self._session()
+        timestamp = str(int(time.time() * 1000))
+        window = "5000"
+        instruction_type = "orderQueryAll"
+        market_type = "PERP"  # PERP 마켓 지정
+
+        params = {
+            "marketType": market_type,
+            "symbol": symbol
+        }
+        sorted_data = self._get_sorted_data(params)
+        signing_string = f"instruction={instruction_type}&{sorted_data}&timestamp={timestamp}&window={window}"
+        signature = self._generate_signature(signing_string)
 
-            url = f"{self.BASE_URL}/orders"
+        headers = {
+            "X-API-KEY": self.API_KEY,
+            "X-SIGNATURE": signature,
+            "X-TIMESTAMP": timestamp,
+            "X-WINDOW": window
+        }
 
-            async with session.get(url, headers=headers, params=params) as resp:
-                return self.parse_orders(await resp.json())
\ No newline at end of file
+        url = f"{self.BASE_URL}/orders"
+
+        async with session.get(url, headers=headers, params=params) as resp:
+            return self.parse_orders(await resp.json())
\ No newline at end of file
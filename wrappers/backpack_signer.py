@@ -0,0 +1,56 @@
+"""
+Backpack ED25519 Request Signer
+
+secret(base64) -> SigningKey / verifying key 를 1회만 만들어 재사용한다.
+REST 래퍼와 WS 클라이언트가 같은 secret이면 get_signer()로 같은 인스턴스를 공유.
+
+서명 문자열 형식:
+    instruction=<type>&<sorted params>&timestamp=<ts>&window=<w>
+
+사용법:
+    from wrappers.backpack_signer import get_signer
+
+    signer = get_signer(secret_key)
+    signature = signer.sign(signer.signing_string("orderExecute", order_data, timestamp, window))
+"""
+import base64
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import nacl.signing
+
+
+def sorted_params(data: Optional[Dict[str, Any]]) -> str:
+    """key 정렬 후 k=v&... (bool은 'true'/'false')"""
+    if not data:
+        return ""
+    def val_to_str(v):
+        if isinstance(v, bool):
+            return str(v).lower()
+        return str(v)
+    return "&".join(f"{k}={val_to_str(v)}" for k, v in sorted(data.items()))
+
+
+class BackpackSigner:
+    __slots__ = ("_signing_key", "verifying_key")
+
+    def __init__(self, secret_key: str):
+        self._signing_key = nacl.signing.SigningKey(base64.b64decode(secret_key))
+        # X-API-KEY / WS subscribe signature[0] 에 쓰는 base64 공개키
+        self.verifying_key = base64.b64encode(bytes(self._signing_key.verify_key)).decode()
+
+    def sign(self, message: str) -> str:
+        return base64.b64encode(self._signing_key.sign(message.encode()).signature).decode()
+
+    @staticmethod
+    def signing_string(instruction_type: str, params: Optional[Dict[str, Any]], timestamp: str, window: str) -> str:
+        data = sorted_params(params)
+        if data:
+            return f"instruction={instruction_type}&{data}&timestamp={timestamp}&window={window}"
+        return f"instruction={instruction_type}&timestamp={timestamp}&window={window}"
+
+
+@lru_cache(maxsize=None)
+def get_signer(secret_key: str) -> BackpackSigner:
+    """secret별 signer 공유 (key decode / SigningKey 생성은 프로세스당 1회)"""
+    return BackpackSigner(secret_key)
@@ -8,22 +8,25 @@ Provides real-time data:
 - account.orderUpdate (private, requires auth)
 """
 import asyncio
-import base64
 import logging
 import time
 from typing import Optional, Dict, Any, Set, List
 
 import aiohttp
-import nacl.signing
 
-from wrappers.base_ws_client import BaseWSClient, _json_dumps
+from wrappers.backpack_signer import get_signer
+from wrappers.base_ws_client import BaseWSClient
+from wrappers.http_pool import HTTP_POOL
+from wrappers.orderbook import OrderBook
+from wrappers.ws_records import BackpackMarkPrice, BackpackOrder, BackpackPosition
 
 logger = logging.getLogger(__name__)
 
 
 BACKPACK_WS_URL = "wss://ws.backpack.exchange"
 BACKPACK_REST_URL = "https://api.backpack.exchange/api/v1"
-ORDERBOOK_MAX_LEVELS = 50  # Limit orderbook depth (Backpack sends ~5000 levels)
+ORDERBOOK_MAX_LEVELS = 50  # get_orderbook 스냅샷 depth (Backpack sends ~5000 levels)
+ORDERBOOK_RESYNC_MIN_INTERVAL = 1.0  # 연속 resync 간 최소 간격 (스냅샷 실패 시 REST 폭주 방지)
 
 
 class BackpackWSClient(BaseWSClient):
@@ -33,6 +36,7 @@ class BackpackWSClient(BaseWSClient):
     """
 
     WS_URL = BACKPACK_WS_URL
+    RATE_LIMIT_VENUE = "backpack"
     PING_INTERVAL = None  # Server sends Ping every 60s, client must respond with Pong (handled by websockets lib)
     RECV_TIMEOUT = 90.0  # 90초간 메시지 없으면 재연결 (server ping 60s + margin)
     RECONNECT_MIN = 0.5
@@ -44,6 +48,7 @@ class BackpackWSClient(BaseWSClient):
         # Auth credentials (for private streams)
         self._api_key = api_key
         self._secret_key = secret_key
+        self._signer = get_signer(secret_key) if secret_key else None  # subscribe 때마다 key decode 하지 않도록
 
         # Subscriptions
         self._orderbook_subs: Set[str] = set()
@@ -52,14 +57,20 @@ class BackpackWSClient(BaseWSClient):
         self._order_subscribed: bool = False
 
         # Cached data
-        self._orderbooks: Dict[str, Dict[str, Any]] = {}
-        self._prices: Dict[str, Dict[str, Any]] = {}
-        self._positions: Dict[str, Dict[str, Any]] = {}  # symbol -> position
-        self._open_orders: Dict[str, Dict[str, Any]] = {}  # order_id -> order
+        self._orderbooks: Dict[str, OrderBook] = {}  # 전체 레벨 유지, 조회 시 top-N 스냅샷
+        self._prices: Dict[str, BackpackMarkPrice] = {}
+        self._positions: Dict[str, BackpackPosition] = {}  # symbol -> position
+        self._open_orders: Dict[str, BackpackOrder] = {}  # order_id -> order
 
         # Track update IDs for delta validation
         self._orderbook_last_u: Dict[str, int] = {}
 
+        # Sequence-gap resync: 스냅샷 조회 중 도착한 delta를 버퍼링 후 재생
+        self._depth_buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._last_resync: Dict[str, float] = {}
+        self.resync_count: Dict[str, int] = {}  # symbol -> gap으로 인한 resync 횟수 (metric)
+
         # Events for waiting
         self._orderbook_events: Dict[str, asyncio.Event] = {}
         self._price_events: Dict[str, asyncio.Event] = {}
@@ -70,7 +81,7 @@ class BackpackWSClient(BaseWSClient):
         self._reconnect_event: asyncio.Event = asyncio.Event()
         self._reconnect_event.set()
 
-        # HTTP session for REST calls
+        # HTTP session for REST calls (shared keep-alive pool)
         self._http_session: Optional[aiohttp.ClientSession] = None
 
     # ==================== Abstract Method Implementations ====================
@@ -106,44 +117,109 @@ class BackpackWSClient(BaseWSClient):
         Backpack sends incremental updates.
         Format: {"e": "depth", "s": "SOL_USDC", "a": [...], "b": [...], "U": firstId, "u": lastId}
         """
-        first_update_id = data.get("U", 0)
-        last_update_id = data.get("u", 0)
+        # Resync 진행 중 - 스냅샷 도착 후 재생하도록 버퍼링
+        if symbol in self._depth_buffers:
+            self._depth_buffers[symbol].append(data)
+            return
 
         if symbol not in self._orderbooks:
-            # First update - need to fetch snapshot
-            await self._fetch_orderbook_snapshot(symbol)
-            if symbol not in self._orderbooks:
-                return
+            # 스냅샷 없음 (첫 업데이트 또는 이전 스냅샷 실패) - 백그라운드 조회
+            self._start_resync(symbol, data)
+            return
+
+        if not self._apply_sequenced_delta(symbol, data):
+            # Gap detected - 책을 버리고 스냅샷 + 버퍼 재생으로 복구
+            self.resync_count[symbol] = self.resync_count.get(symbol, 0) + 1
+            logger.warning(
+                f"[BackpackWS] orderbook gap detected for {symbol}: expected {self._orderbook_last_u.get(symbol, 0) + 1}, "
+                f"got {data.get('U')} (resync #{self.resync_count[symbol]})"
+            )
+            self._start_resync(symbol, data)
+            return
+
+        # Signal data ready
+        if symbol in self._orderbook_events:
+            self._orderbook_events[symbol].set()
+
+    def _apply_sequenced_delta(self, symbol: str, data: Dict[str, Any]) -> bool:
+        """
+        Apply delta if it continues the update-id sequence.
+        Deltas already covered by the snapshot (u <= lastUpdateId) are skipped.
+        Returns False on a sequence gap (book not modified).
+        """
+        first_update_id = data.get("U", 0)
+        last_update_id = data.get("u", 0)
 
-        # Check if update is sequential
         last_u = self._orderbook_last_u.get(symbol, 0)
-        if last_u > 0 and first_update_id != last_u + 1:
-            # Gap detected - refetch snapshot
-            logger.warning(f"[BackpackWS] orderbook gap detected for {symbol}: expected {last_u + 1}, got {first_update_id}")
-            await self._fetch_orderbook_snapshot(symbol)
-            if symbol not in self._orderbooks:
-                return
+        if last_u > 0:
+            if last_update_id <= last_u:
+                return True
+            if first_update_id > last_u + 1:
+                return False
 
-        # Apply delta updates
         self._apply_depth_delta(symbol, data)
         self._orderbook_last_u[symbol] = last_update_id
+        return True
+
+    def _start_resync(self, symbol: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """Drop the diverged book and rebuild it in the background (recv loop keeps buffering)"""
+        self._orderbooks.pop(symbol, None)
+        self._orderbook_last_u.pop(symbol, None)
+        if symbol in self._orderbook_events:
+            self._orderbook_events[symbol].clear()
+        self._depth_buffers[symbol] = [data] if data else []
+        self._resync_tasks[symbol] = asyncio.create_task(self._resync_orderbook(symbol))
+
+    async def _resync_orderbook(self, symbol: str) -> None:
+        """
+        Fetch REST snapshot, then replay buffered deltas whose u is after lastUpdateId.
+        Caller must have created self._depth_buffers[symbol] beforehand.
+        """
+        try:
+            delay = self._last_resync.get(symbol, 0.0) + ORDERBOOK_RESYNC_MIN_INTERVAL - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_resync[symbol] = time.monotonic()
+            await self._fetch_orderbook_snapshot(symbol)
+        finally:
+            buffered = self._depth_buffers.pop(symbol, [])
+            self._resync_tasks.pop(symbol, None)
+
+        if symbol not in self._orderbooks:
+            # 스냅샷 실패 - 다음 delta에서 재시도
+            return
+
+        for data in buffered:
+            if not self._apply_sequenced_delta(symbol, data):
+                self.resync_count[symbol] = self.resync_count.get(symbol, 0) + 1
+                logger.warning(f"[BackpackWS] gap in buffered deltas for {symbol}, resyncing again")
+                self._start_resync(symbol)
+                return
 
-        # Signal data ready
         if symbol in self._orderbook_events:
             self._orderbook_events[symbol].set()
 
+    def _cancel_resyncs(self, symbol: Optional[str] = None) -> None:
+        """Cancel in-flight resync tasks and drop their buffers"""
+        symbols = [symbol] if symbol is not None else set(self._resync_tasks) | set(self._depth_buffers)
+        for sym in symbols:
+            task = self._resync_tasks.pop(sym, None)
+            if task and not task.done():
+                task.cancel()
+            self._depth_buffers.pop(sym, None)
+
     def _handle_mark_price_update(self, symbol: str, data: Dict[str, Any]) -> None:
         """
         Handle mark price update.
         Format: {"e": "markPrice", "s": "SOL_USDC", "p": "18.70", "f": "1.70", "i": "19.70", "n": 1694687965941, "T": ...}
         """
-        self._prices[symbol] = {
-            "mark_price": data.get("p"),
-            "index_price": data.get("i"),
-            "funding_rate": data.get("f"),
-            "next_funding_time": data.get("n"),
-            "time": int(time.time() * 1000),
-        }
+        self._prices[symbol] = BackpackMarkPrice(
+            mark_price=data.get("p"),
+            index_price=data.get("i"),
+            funding_rate=data.get("f"),
+            next_funding_time=data.get("n"),
+            time=int(time.time() * 1000),
+        )
 
         # Signal data ready
         if symbol in self._price_events:
@@ -172,19 +248,20 @@ class BackpackWSClient(BaseWSClient):
             except (ValueError, TypeError):
                 net_qty = 0
 
-            self._positions[symbol] = {
-                "symbol": symbol,
-                "side": "long" if net_qty > 0 else "short" if net_qty < 0 else None,
-                "size": str(abs(net_qty)),
-                "entry_price": data.get("B"),  # Entry price
-                "mark_price": data.get("M"),
-                "unrealized_pnl": data.get("P"),  # PnL unrealized
-                "realized_pnl": data.get("p"),  # PnL realized
-                "position_id": data.get("i"),
-                "time": int(time.time() * 1000),
-            }
+            self._positions[symbol] = BackpackPosition(
+                symbol=symbol,
+                side="long" if net_qty > 0 else "short" if net_qty < 0 else None,
+                size=str(abs(net_qty)),
+                entry_price=data.get("B"),  # Entry price
+                mark_price=data.get("M"),
+                unrealized_pnl=data.get("P"),  # PnL unrealized
+                realized_pnl=data.get("p"),  # PnL realized
+                position_id=data.get("i"),
+                time=int(time.time() * 1000),
+            )
 
         self._position_event.set()
+        self._notify("position", symbol)
 
     def _handle_order_update(self, data: Dict[str, Any]) -> None:
         """
@@ -200,6 +277,7 @@ class BackpackWSClient(BaseWSClient):
         if event_type in ("orderCancelled", "orderExpired"):
             self._open_orders.pop(order_id, None)
         elif event_type == "orderFill":
+            self._notify_fill(order_id, data)
             # Check if fully filled
             executed_qty = data.get("z", "0")
             quantity = data.get("q", "0")
@@ -217,106 +295,83 @@ class BackpackWSClient(BaseWSClient):
 
         self._order_event.set()
 
+    def _notify_fill(self, order_id: str, data: Dict[str, Any]) -> None:
+        """
+        orderFill 이벤트 -> fill 리스너 통지.
+        Format: {"e": "orderFill", "s": "SOL_USDC_PERP", "S": "Bid", "l": "0.5", "L": "20.1", "t": 123, "m": true, "n": "0.01", "T": 1694687692980000, ...}
+        (l: 이번 체결 수량, L: 이번 체결 가격, t: trade id, m: maker 여부, n: 수수료, T: 체결 시각 us)
+        """
+        try:
+            size = float(data.get("l") or 0)
+        except (ValueError, TypeError):
+            return
+        if size <= 0:
+            return
+        side_raw = data.get("S", "")
+        try:
+            price = float(data["L"])
+        except (KeyError, ValueError, TypeError):
+            price = None
+        try:
+            fee = float(data["n"])
+        except (KeyError, ValueError, TypeError):
+            fee = None
+        ts = data.get("T") or data.get("E")
+        self._notify("fill", {
+            "symbol": data.get("s"),
+            "side": "buy" if side_raw == "Bid" else "sell" if side_raw == "Ask" else side_raw,
+            "size": size,
+            "price": price,
+            "order_id": order_id,
+            "fill_id": data.get("t"),
+            "fee": fee,
+            "is_maker": data.get("m"),
+            "time": int(ts) // 1000 if ts else int(time.time() * 1000),
+        })
+
     def _update_order(self, order_id: str, data: Dict[str, Any]) -> None:
         """Update or create order in cache"""
         side_raw = data.get("S", "")
         side = "buy" if side_raw == "Bid" else "sell" if side_raw == "Ask" else side_raw
 
-        self._open_orders[order_id] = {
-            "id": order_id,
-            "symbol": data.get("s"),
-            "side": side,
-            "size": data.get("q"),
-            "price": data.get("p"),
-            "order_type": data.get("o"),
-            "status": data.get("X"),
-            "executed_qty": data.get("z"),
-            "time": int(time.time() * 1000),
-        }
+        self._open_orders[order_id] = BackpackOrder(
+            id=order_id,
+            symbol=data.get("s"),
+            side=side,
+            size=data.get("q"),
+            price=data.get("p"),
+            order_type=data.get("o"),
+            status=data.get("X"),
+            executed_qty=data.get("z"),
+            time=int(time.time() * 1000),
+        )
 
     def _generate_signature(self, instruction: str) -> str:
         """Generate ED25519 signature for private stream subscription"""
         if not self._secret_key:
             raise ValueError("Secret key required for private streams")
 
-        private_key_bytes = base64.b64decode(self._secret_key)
-        signing_key = nacl.signing.SigningKey(private_key_bytes)
-        signature = signing_key.sign(instruction.encode())
-        return base64.b64encode(signature.signature).decode()
+        return self._signer.sign(instruction)
 
     def _get_verifying_key(self) -> str:
         """Get base64 encoded verifying (public) key from secret key"""
         if not self._secret_key:
             raise ValueError("Secret key required for private streams")
 
-        private_key_bytes = base64.b64decode(self._secret_key)
-        signing_key = nacl.signing.SigningKey(private_key_bytes)
-        verify_key = signing_key.verify_key
-        return base64.b64encode(bytes(verify_key)).decode()
+        return self._signer.verifying_key
 
     def _apply_depth_delta(self, symbol: str, data: Dict[str, Any]) -> None:
         """Apply incremental depth update to orderbook"""
-        if symbol not in self._orderbooks:
+        book = self._orderbooks.get(symbol)
+        if book is None:
             return
-
-        orderbook = self._orderbooks[symbol]
-
-        # Process asks
-        for item in data.get("a", []):
-            try:
-                price = float(item[0])
-                size = float(item[1])
-                if size == 0:
-                    # Remove level
-                    orderbook["asks"] = [lvl for lvl in orderbook["asks"] if lvl[0] != price]
-                else:
-                    # Update or insert
-                    updated = False
-                    for i, lvl in enumerate(orderbook["asks"]):
-                        if lvl[0] == price:
-                            orderbook["asks"][i] = [price, size]
-                            updated = True
-                            break
-                    if not updated:
-                        orderbook["asks"].append([price, size])
-            except (IndexError, ValueError, TypeError):
-                continue
-
-        # Process bids
-        for item in data.get("b", []):
-            try:
-                price = float(item[0])
-                size = float(item[1])
-                if size == 0:
-                    # Remove level
-                    orderbook["bids"] = [lvl for lvl in orderbook["bids"] if lvl[0] != price]
-                else:
-                    # Update or insert
-                    updated = False
-                    for i, lvl in enumerate(orderbook["bids"]):
-                        if lvl[0] == price:
-                            orderbook["bids"][i] = [price, size]
-                            updated = True
-                            break
-                    if not updated:
-                        orderbook["bids"].append([price, size])
-            except (IndexError, ValueError, TypeError):
-                continue
-
-        # Re-sort: asks ascending, bids descending
-        orderbook["asks"].sort(key=lambda x: x[0])
-        orderbook["bids"].sort(key=lambda x: x[0], reverse=True)
-
-        # Limit to max levels
-        orderbook["asks"] = orderbook["asks"][:ORDERBOOK_MAX_LEVELS]
-        orderbook["bids"] = orderbook["bids"][:ORDERBOOK_MAX_LEVELS]
-        orderbook["time"] = int(time.time() * 1000)
+        book.apply_delta(bids=data.get("b", []), asks=data.get("a", []))
 
     async def _fetch_orderbook_snapshot(self, symbol: str) -> None:
         """Fetch orderbook snapshot from REST API"""
         try:
             if not self._http_session or self._http_session.closed:
-                self._http_session = aiohttp.ClientSession()
+                self._http_session = HTTP_POOL.acquire()
 
             url = f"{BACKPACK_REST_URL}/depth"
             params = {"symbol": symbol}
@@ -330,33 +385,9 @@ class BackpackWSClient(BaseWSClient):
 
             # Parse snapshot
             # Format: {"lastUpdateId": "...", "asks": [["price", "size"], ...], "bids": [...]}
-            asks = []
-            for item in data.get("asks", []):
-                try:
-                    asks.append([float(item[0]), float(item[1])])
-                except (IndexError, ValueError, TypeError):
-                    continue
-
-            bids = []
-            for item in data.get("bids", []):
-                try:
-                    bids.append([float(item[0]), float(item[1])])
-                except (IndexError, ValueError, TypeError):
-                    continue
-
-            # Sort: asks ascending, bids descending
-            asks.sort(key=lambda x: x[0])
-            bids.sort(key=lambda x: x[0], reverse=True)
-
-            # Limit to max levels
-            asks = asks[:ORDERBOOK_MAX_LEVELS]
-            bids = bids[:ORDERBOOK_MAX_LEVELS]
-
-            self._orderbooks[symbol] = {
-                "asks": asks,
-                "bids": bids,
-                "time": int(time.time() * 1000),
-            }
+            book = OrderBook()
+            book.apply_snapshot(bids=data.get("bids", []), asks=data.get("asks", []))
+            self._orderbooks[symbol] = book
 
             # Update last update ID
             last_update_id = data.get("lastUpdateId")
@@ -372,6 +403,7 @@ class BackpackWSClient(BaseWSClient):
     async def _resubscribe(self) -> None:
         """Resubscribe to all channels after reconnect"""
         # Clear cached data (stale data 방지)
+        self._cancel_resyncs()
         self._orderbooks.clear()
         self._orderbook_last_u.clear()
         self._prices.clear()
@@ -389,14 +421,17 @@ class BackpackWSClient(BaseWSClient):
         # Resubscribe to orderbook channels
         for symbol in self._orderbook_subs:
             stream = f"depth.{symbol}"
-            await self._ws.send(_json_dumps({"method": "SUBSCRIBE", "params": [stream]}))
-            # Fetch snapshot after resubscribe
-            await self._fetch_orderbook_snapshot(symbol)
+            self._depth_buffers[symbol] = []
+            await self._throttle()
+            await self._ws.send(self._dumps({"method": "SUBSCRIBE", "params": [stream]}))
+            # Fetch snapshot after resubscribe (구독 이후 delta는 버퍼링 후 재생)
+            await self._resync_orderbook(symbol)
 
         # Resubscribe to mark price channels
         for symbol in self._price_subs:
             stream = f"markPrice.{symbol}"
-            await self._ws.send(_json_dumps({"method": "SUBSCRIBE", "params": [stream]}))
+            await self._throttle()
+            await self._ws.send(self._dumps({"method": "SUBSCRIBE", "params": [stream]}))
 
         # Resubscribe to private streams (if authenticated)
         if self._position_subscribed and self._secret_key:
@@ -418,14 +453,15 @@ class BackpackWSClient(BaseWSClient):
     async def close(self) -> None:
         """연결 종료 및 상태 초기화"""
         await super().close()
+        self._cancel_resyncs()
         self._orderbook_subs.clear()
         self._price_subs.clear()
         self._position_subscribed = False
         self._order_subscribed = False
 
-        # Close HTTP session
-        if self._http_session and not self._http_session.closed:
-            await self._http_session.close()
+        # Release HTTP session
+        if self._http_session is not None:
+            await HTTP_POOL.release(self._http_session)
             self._http_session = None
 
     async def _handle_disconnect(self) -> None:
@@ -444,16 +480,17 @@ class BackpackWSClient(BaseWSClient):
             except asyncio.TimeoutError:
                 raise RuntimeError("[backpack_ws] reconnect timeout")
 
+        await self._throttle()
         if not self._ws or not self._running:
             await self.connect()
         if self._ws:
             try:
-                await self._ws.send(_json_dumps(msg))
+                await self._ws.send(self._dumps(msg))
             except Exception:
                 if self._reconnecting:
                     await asyncio.wait_for(self._reconnect_event.wait(), timeout=60.0)
                     if self._ws:
-                        await self._ws.send(_json_dumps(msg))
+                        await self._ws.send(self._dumps(msg))
 
     async def subscribe_orderbook(self, symbol: str) -> None:
         """Subscribe to orderbook (depth) channel for symbol"""
@@ -462,14 +499,15 @@ class BackpackWSClient(BaseWSClient):
 
         print(f"[BackpackWS] Subscribe: orderbook/{symbol}")
         stream = f"depth.{symbol}"
+        self._depth_buffers[symbol] = []
         await self._send_msg({"method": "SUBSCRIBE", "params": [stream]})
         self._orderbook_subs.add(symbol)
 
         if symbol not in self._orderbook_events:
             self._orderbook_events[symbol] = asyncio.Event()
 
-        # Fetch initial snapshot
-        await self._fetch_orderbook_snapshot(symbol)
+        # Fetch initial snapshot (구독 직후 도착한 delta는 버퍼링 후 재생)
+        await self._resync_orderbook(symbol)
 
     async def unsubscribe_orderbook(self, symbol: str) -> None:
         """Unsubscribe from orderbook (depth) channel"""
@@ -482,6 +520,7 @@ class BackpackWSClient(BaseWSClient):
         self._orderbook_subs.discard(symbol)
 
         # Clean up cached data
+        self._cancel_resyncs(symbol)
         self._orderbooks.pop(symbol, None)
         self._orderbook_last_u.pop(symbol, None)
 
@@ -579,7 +618,20 @@ class BackpackWSClient(BaseWSClient):
     # ==================== Data Getters ====================
 
     def get_orderbook(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Get cached orderbook for symbol"""
+        """Get cached orderbook for symbol (top ORDERBOOK_MAX_LEVELS levels)"""
+        book = self._orderbooks.get(symbol)
+        if book is None:
+            return None
+        return book.snapshot(ORDERBOOK_MAX_LEVELS)
+
+    def get_resync_count(self, symbol: Optional[str] = None) -> int:
+        """Number of sequence-gap resyncs (per symbol, or total)"""
+        if symbol is not None:
+            return self.resync_count.get(symbol, 0)
+        return sum(self.resync_count.values())
+
+    def get_book(self, symbol: str) -> Optional[OrderBook]:
+        """Get live OrderBook for symbol (best_bid/best_ask O(1), no snapshot copy)"""
         return self._orderbooks.get(symbol)
 
     def get_mark_price(self, symbol: str) -> Optional[str]:
@@ -591,25 +643,27 @@ class BackpackWSClient(BaseWSClient):
 
     def get_price_data(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get full cached price data for symbol (mark_price, index_price, funding_rate, etc)"""
-        return self._prices.get(symbol)
+        price = self._prices.get(symbol)
+        return price.to_dict() if price is not None else None
 
     def get_position(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get cached position for symbol"""
-        return self._positions.get(symbol)
+        pos = self._positions.get(symbol)
+        return pos.to_dict() if pos is not None else None
 
     def get_all_positions(self) -> Dict[str, Dict[str, Any]]:
         """Get all cached positions"""
-        return self._positions.copy()
+        return {sym: pos.to_dict() for sym, pos in self._positions.items()}
 
     def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get cached open orders, optionally filtered by symbol"""
         if symbol is None:
-            return list(self._open_orders.values())
-        return [o for o in self._open_orders.values() if o.get("symbol") == symbol]
+            return [o.to_dict() for o in self._open_orders.values()]
+        return [o.to_dict() for o in self._open_orders.values() if o.symbol == symbol]
 
     def get_all_open_orders(self) -> Dict[str, Dict[str, Any]]:
         """Get all cached open orders by order_id"""
-        return self._open_orders.copy()
+        return {oid: o.to_dict() for oid, o in self._open_orders.items()}
 
     # ==================== Wait for data ====================
 
@@ -3,28 +3,39 @@ import time
 import aiohttp
 import uuid
 import hashlib
-from eth_hash.auto import keccak  # 꼭 이걸 써야 함
-from starkware.crypto.signature.fast_pedersen_hash import pedersen_hash
-from starkware.crypto.signature.signature import sign, ec_mult, verify, ALPHA, FIELD_PRIME, EC_GEN
+from mpdex.utils.common_stark import StarkSigningContext
+from mpdex.utils.sign_executor import SIGN_EXECUTOR
 from decimal import Decimal, ROUND_HALF_UP, ROUND_DOWN
 import asyncio
+from typing import Optional
+from wrappers.http_pool import HTTP_POOL
+from wrappers.meta_cache import META_CACHE
+from wrappers.rate_limiter import PRIORITY_HIGH
 import logging
 
 logger = logging.getLogger(__name__)
 
 class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
-    def __init__(self,account_id,private_key):
+    def __init__(self,account_id,private_key,*,http_session: Optional[aiohttp.ClientSession] = None):
         super().__init__()
         self.base_url = 'https://api.starknet.extended.exchange'
         self.base_url_spot = 'https://api.starknet.extended.exchange'
         self.account_id = account_id
         self.private_key_hex = private_key.replace("0x", "")
-                
-        self.K_MODULUS = int("0800000000000010ffffffffffffffffb781126dcae7b2321e66a241adc64d2f", 16)
+        # private key int / 공개키 y / 계약별 asset id를 1회만 계산해서 재사용
+        self.signer = StarkSigningContext(self.private_key_hex, account_id)
         self.market_info = {}  # symbol → metadata
         self.usdt_coin_id = '1000'
+        # 공유 keep-alive 세션 (exchange_factory에서 주입, 없으면 HTTP_POOL에서 획득)
+        self._http: Optional[aiohttp.ClientSession] = http_session
     
+    def _session(self) -> aiohttp.ClientSession:
+        if self._http is None or self._http.closed:
+            self._http = HTTP_POOL.acquire()
+        return self._http
+
     async def init(self):
+        SIGN_EXECUTOR.warmup("mpdex.utils.common_stark")
         await self.get_meta_data()
         await self.get_meta_data(is_spot=True)
         self.update_available_symbols()
@@ -63,75 +74,77 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
         else:
             url = f"{self.base_url}/api/v1/public/meta/getMetaData"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    logger.error(f"[get_meta_data] HTTP {resp.status}")
-                    return None
-                res = await resp.json()
-                
-                data = res.get("data", {})
-                meta = data
-                if is_spot:
-                    market_list = data.get("symbolList", [])
-                else:
-                    market_list = data.get("contractList", [])
-
-                for market in market_list:
-                    
-                    name = market["symbolName"] if is_spot else market["contractName"]
-                    
-                    if "TEMP" in name:
-                        continue
-
-                    if is_spot:
-                        self.market_info[name] = {
-                            "contract": market,
-                            "meta": meta,
-                            "symbolId": market["symbolId"],
-                            "tickSize": market["tickSize"],
-                            "stepSize": market["stepSize"],
-                            "minOrderSize": market["minOrderSize"],
-                            "maxOrderSize": market["maxOrderSize"],
-                            "defaultTakerFeeRate": market["takerFeeRate"],
-                        }
-                    else:
-                        self.market_info[name] = {
-                            "contract": market,
-                            "meta": meta,
-                            "contractId": market["contractId"],
-                            "tickSize": market["tickSize"],
-                            "stepSize": market["stepSize"],
-                            "minOrderSize": market["minOrderSize"],
-                            "maxOrderSize": market["maxOrderSize"],
-                            "defaultTakerFeeRate": market["defaultTakerFeeRate"],
-                        }
-
-                return market_list
+        # 디스크 메타 캐시로 즉시 기동, TTL 지나면 백그라운드 재조회
+        def on_refresh(data):
+            self._apply_meta_data(data, is_spot)
+            self.update_available_symbols()
+
+        try:
+            data, _ = await META_CACHE.get(
+                f"extended:{url}",
+                lambda: self._fetch_meta_data(url),
+                on_refresh=on_refresh,
+                validate=lambda d: bool(d),
+            )
+        except Exception as e:
+            logger.error(f"[get_meta_data] {e}")
+            return None
+        return self._apply_meta_data(data, is_spot)
+
+    async def _fetch_meta_data(self, url):
+        session = self._session()
+        async with session.get(url) as resp:
+            if resp.status != 200:
+                raise RuntimeError(f"HTTP {resp.status}")
+            res = await resp.json()
+        return res.get("data", {})
+
+    def _apply_meta_data(self, data, is_spot=False):
+        self.signer.clear_contracts()
+        meta = data
+        if is_spot:
+            market_list = data.get("symbolList", [])
+        else:
+            market_list = data.get("contractList", [])
+
+        for market in market_list:
+
+            name = market["symbolName"] if is_spot else market["contractName"]
+
+            if "TEMP" in name:
+                continue
+
+            if is_spot:
+                self.market_info[name] = {
+                    "contract": market,
+                    "meta": meta,
+                    "symbolId": market["symbolId"],
+                    "tickSize": market["tickSize"],
+                    "stepSize": market["stepSize"],
+                    "minOrderSize": market["minOrderSize"],
+                    "maxOrderSize": market["maxOrderSize"],
+                    "defaultTakerFeeRate": market["takerFeeRate"],
+                }
+            else:
+                self.market_info[name] = {
+                    "contract": market,
+                    "meta": meta,
+                    "contractId": market["contractId"],
+                    "tickSize": market["tickSize"],
+                    "stepSize": market["stepSize"],
+                    "minOrderSize": market["minOrderSize"],
+                    "maxOrderSize": market["maxOrderSize"],
+                    "defaultTakerFeeRate": market["defaultTakerFeeRate"],
+                }
+
+        return market_list
     
     def generate_signature(self, method, path, params, timestamp=None):
-        if not timestamp:
-            timestamp = str(int(time.time() * 1000))
-        
-        sorted_items = sorted(params.items())
-        param_str = "&".join(f"{k}={v}" for k, v in sorted_items)
-        
-        message = timestamp+method+path+param_str
-        msg_bytes = message.encode("utf-8")
-        
-        msg_hash = int.from_bytes(keccak(msg_bytes), "big")
-        msg_hash = msg_hash % self.K_MODULUS # FIELD_PRIME
-        
-        private_key_int = int(self.private_key_hex, 16)
-        
-        r, s = sign(msg_hash, private_key_int)
-        _, y =  ec_mult(private_key_int, EC_GEN, ALPHA, FIELD_PRIME)
-        
-        y_hex = y.to_bytes(32, "big").hex()
-        
-        stark_signature = r.to_bytes(32, "big").hex() + s.to_bytes(32, "big").hex() + y_hex
-        
-        return stark_signature, timestamp
+        return self.signer.sign_request(method, path, params, timestamp)
+
+    async def generate_signature_async(self, method, path, params, timestamp=None):
+        # 서명 연산은 SIGN_EXECUTOR에서 실행 (WS 수신 루프를 막지 않도록)
+        return await self.signer.sign_request_async(method, path, params, timestamp)
 
     async def get_mark_price(self, symbol):
         # spot has no restapi endpoint, have to use ws
@@ -145,14 +158,17 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
         params = {"contractId": market_id}
         oracle_url = f"{self.base_url}/api/v1/public/quote/getTicker"
             
-        async with aiohttp.ClientSession() as session:
-            async with session.get(oracle_url, params=params) as resp:
-                ticker_data = await resp.json()
-                #print(ticker_data)
-                last_price = Decimal(ticker_data["data"][0]["lastPrice"])
-                return last_price
-
-    async def create_order(self, symbol, side, amount, price=None, order_type='market'):
+        session = self._session()
+        async with session.get(oracle_url, params=params) as resp:
+            ticker_data = await resp.json()
+            #print(ticker_data)
+            last_price = Decimal(ticker_data["data"][0]["lastPrice"])
+            return last_price
+
+    async def get_tick_size(self, symbol):
+        return float(self.market_info[symbol]['tickSize'])
+
+    async def create_order(self, symbol, side, amount, price=None, order_type='market', client_id=None, post_only=True):
         is_spot = '/' in symbol
         if is_spot:
             logger.warning("spot is not supported yet")
@@ -160,7 +176,10 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
         if price != None:
             order_type = 'limit'
 
-        time_in_force = 'IMMEDIATE_OR_CANCEL' if order_type.upper() == 'MARKET' else 'POST_ONLY'
+        if order_type.upper() == 'MARKET':
+            time_in_force = 'IMMEDIATE_OR_CANCEL'
+        else:
+            time_in_force = 'POST_ONLY' if post_only else 'GOOD_TIL_CANCEL'
         
         contract_info = self.market_info[symbol]
         tick_size = Decimal(contract_info['tickSize'])
@@ -171,7 +190,7 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
         size = Decimal(amount)
         size = self.round_step_size(size, step_size)
 
-        client_order_id = str(uuid.uuid4())
+        client_order_id = str(client_id) if client_id else str(uuid.uuid4())
 
         if is_spot:
             symbol_id = contract_info['symbolId']
@@ -189,21 +208,22 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
             #print(body)
             
         else:
-            LIMIT_ORDER_WITH_FEES = 3
-            
             contract_id = contract_info['contractId']
             
-            resolution = Decimal(int(contract_info['contract']['starkExResolution'], 16))
-            fee_rate = Decimal(contract_info['defaultTakerFeeRate'])
+            stark_contract = self.signer.contract(contract_id, contract_info)
+            resolution = stark_contract.resolution
+            fee_rate = stark_contract.fee_rate
 
             # Price calculation
             if order_type.upper() == 'MARKET':
                 # Oracle price fetch
                 oracle_url = f"{self.base_url}/api/v1/public/quote/getTicker"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(oracle_url, params={"contractId": contract_id}) as resp:
-                        ticker_data = await resp.json()
-                        oracle_price = Decimal(ticker_data["data"][0]["oraclePrice"])
+                session = self._session()
+                # 주문 경로의 oracle price 조회 -> 시세 조회(LOW)가 아닌 주문 우선순위로
+                async with session.get(oracle_url, params={"contractId": contract_id},
+                                       trace_request_ctx={"priority": PRIORITY_HIGH}) as resp:
+                    ticker_data = await resp.json()
+                    oracle_price = Decimal(ticker_data["data"][0]["oraclePrice"])
                 if side.upper() == 'BUY':
                     price = oracle_price * Decimal("1.1")
                     price = price.quantize(tick_size, rounding=ROUND_HALF_UP)
@@ -227,30 +247,9 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
             amt_fee = int((value * fee_rate * Decimal("1e6")).to_integral_value())
             expire_ts = int(int(l2_expire_time) / (1000 * 60 * 60))
 
-            asset_id_synth = int(contract_info['contract']['starkExSyntheticAssetId'], 16)
-            asset_id_coll = int(contract_info['meta']['global']['starkExCollateralCoin']['starkExAssetId'], 16)
-
-            # L2 order hash
-            h = pedersen_hash(asset_id_coll if is_buy else asset_id_synth,
-                            asset_id_synth if is_buy else asset_id_coll)
-            h = pedersen_hash(h, asset_id_coll)
-            packed_0 = (amt_coll if is_buy else amt_synth)
-            packed_0 = (packed_0 << 64) + (amt_synth if is_buy else amt_coll)
-            packed_0 = (packed_0 << 64) + amt_fee
-            packed_0 = (packed_0 << 32) + l2_nonce
-            h = pedersen_hash(h, packed_0)
-            packed_1 = LIMIT_ORDER_WITH_FEES
-            pid = int(self.account_id)
-            packed_1 = (packed_1 << 64) + pid
-            packed_1 = (packed_1 << 64) + pid
-            packed_1 = (packed_1 << 64) + pid
-            packed_1 = (packed_1 << 32) + expire_ts
-            packed_1 = (packed_1 << 17)
-            h = pedersen_hash(h, packed_1)
-
-            private_key_int = int(self.private_key_hex, 16)
-            r, s = sign(h, private_key_int)
-            l2_signature = r.to_bytes(32, "big").hex() + s.to_bytes(32, "big").hex()
+            l2_signature = await self.signer.sign_order_async(
+                stark_contract, is_buy, amt_synth, amt_coll, amt_fee, l2_nonce, expire_ts
+            )
 
             body = {
                 "accountId": self.account_id,
@@ -273,7 +272,7 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
 
         method = "POST"
         path = "/api/v1/private/order/createOrder"
-        signature, ts = self.generate_signature(method, path, body)
+        signature, ts = await self.generate_signature_async(method, path, body)
         url = f"{self.base_url_spot}{path}" if is_spot else f"{self.base_url}{path}"
         headers = {
                     "Content-Type": "application/json",
@@ -282,13 +281,13 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
                     "X-EXTENDED-API-SIGNATURE": signature,
                     "X-EXTENDED-API-KEY": self.account_id,
                 }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url=url,
-                json=body,
-                headers=headers
-            ) as resp:
-                return await resp.json()
+        session = self._session()
+        async with session.post(
+            url=url,
+            json=body,
+            headers=headers
+        ) as resp:
+            return await resp.json()
 
     def parse_position(self, position_list,position_asset_list, symbol):
         contract_id = self.market_info[symbol]['contractId']
@@ -325,7 +324,7 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
             "accountId": self.account_id,
         }
 
-        signature, timestamp = self.generate_signature(method, path, params)
+        signature, timestamp = await self.generate_signature_async(method, path, params)
 
         headers = {
             "X-EXTENDED-API-TIMESTAMP": timestamp,
@@ -339,23 +338,25 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
         else:
             url = f"{self.base_url}{path}"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
-                    print(f"[get_position] HTTP {resp.status}")
-                    print(await resp.text())
-                    return None
-                data = await resp.json()
-                position_list = data['data']['positionList']
-                position_asset_list = data['data']['positionAssetList']
-                return self.parse_position(position_list,position_asset_list,symbol)
+        session = self._session()
+        async with session.get(url, headers=headers) as resp:
+            if resp.status != 200:
+                print(f"[get_position] HTTP {resp.status}")
+                print(await resp.text())
+                return None
+            data = await resp.json()
+            position_list = data['data']['positionList']
+            position_asset_list = data['data']['positionAssetList']
+            return self.parse_position(position_list,position_asset_list,symbol)
     
     async def close_position(self, symbol, position):
         return await super().close_position(symbol, position)
 
     async def close(self):
-        """No persistent session to close"""
-        pass
+        """Release the shared HTTP session"""
+        if self._http is not None:
+            await HTTP_POOL.release(self._http)
+            self._http = None
 
     async def get_collateral(self):
         method = "GET"
@@ -364,7 +365,7 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
             "accountId": self.account_id,
         }
 
-        signature, timestamp = self.generate_signature(method, path, params)
+        signature, timestamp = await self.generate_signature_async(method, path, params)
 
         headers = {
             "X-EXTENDED-API-TIMESTAMP": timestamp,
@@ -378,15 +379,15 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
         else:
             url = f"{self.base_url}{path}"
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
-                    print(f"[get_position] HTTP {resp.status}")
-                    print(await resp.text())
-                    return None
-                data = await resp.json()
-                collateral = data['data']['collateralAssetModelList']
-                return self.parse_collateral(collateral)
+        session = self._session()
+        async with session.get(url, headers=headers) as resp:
+            if resp.status != 200:
+                print(f"[get_position] HTTP {resp.status}")
+                print(await resp.text())
+                return None
+            data = await resp.json()
+            collateral = data['data']['collateralAssetModelList']
+            return self.parse_collateral(collateral)
             
     def parse_collateral(self,collateral):
         for col in collateral:
@@ -405,7 +406,7 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
             "filterContractIdList": contract_id,  # ✅ 특정 심볼의 주문만
         }
 
-        signature, timestamp = self.generate_signature(method, path, params)
+        signature, timestamp = await self.generate_signature_async(method, path, params)
 
         headers = {
             "X-EXTENDED-API-TIMESTAMP": timestamp,
@@ -416,16 +417,16 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
         query_str = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
         url = f"{self.base_url}{path}?{query_str}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
-                    #print(f"[get_open_orders] HTTP {resp.status}")
-                    #print(await resp.text())
-                    return []
+        session = self._session()
+        async with session.get(url, headers=headers) as resp:
+            if resp.status != 200:
+                #print(f"[get_open_orders] HTTP {resp.status}")
+                #print(await resp.text())
+                return []
 
-                res = await resp.json()
-                orders = res.get("data", {}).get("dataList", [])
-                return self.parse_open_orders(orders)
+            res = await resp.json()
+            orders = res.get("data", {}).get("dataList", [])
+            return self.parse_open_orders(orders)
             
     def parse_open_orders(self, orders):
         if not orders:
@@ -472,7 +473,7 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
             "orderIdList": order_id_str  # ⚠️ 문자열이어야 함
         }
 
-        signature, timestamp = self.generate_signature(method, path, params)
+        signature, timestamp = await self.generate_signature_async(method, path, params)
 
         headers = {
             "X-EXTENDED-API-TIMESTAMP": timestamp,
@@ -487,14 +488,14 @@ class ExtendedExchange(MultiPerpDexMixin, MultiPerpDex):
             "orderIdList": order_ids
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(f"{self.base_url}{path}", json=body, headers=headers) as resp:
-                if resp.status != 200:
-                    print(f"[cancel_orders] HTTP {resp.status}")
-                    print(await resp.text())
-                    return []
+        session = self._session()
+        async with session.post(f"{self.base_url}{path}", json=body, headers=headers) as resp:
+            if resp.status != 200:
+                print(f"[cancel_orders] HTTP {resp.status}")
+                print(await resp.text())
+                return []
 
-                res = await resp.json()
-                cancel_map = res.get("data", {}).get("cancelResultMap", {})
-                return [{"id": k, "status": v} for k, v in cancel_map.items()]
+            res = await resp.json()
+            cancel_map = res.get("data", {}).get("cancelResultMap", {})
+            return [{"id": k, "status": v} for k, v in cancel_map.items()]
 
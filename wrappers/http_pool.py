@@ -0,0 +1,118 @@
+"""
+Shared HTTP Session Pool
+========================
+프로세스 전체에서 하나의 keep-alive aiohttp 세션을 공유하는 풀.
+
+REST 래퍼(Backpack, Extended, EdgeX, Pacifica, Hyperliquid 계열)가 요청마다
+새 ClientSession을 열면 매 주문이 TCP 연결 + TLS 핸드셰이크 비용을 다시 낸다.
+이 풀은 host별 연결 수 제한과 DNS 캐시를 가진 TCPConnector 하나를 유지하고,
+래퍼 인스턴스들은 acquire()/release()로 참조만 주고받는다.
+
+사용법:
+    from wrappers.http_pool import HTTP_POOL
+
+    session = HTTP_POOL.acquire()       # exchange_factory.create_exchange에서 호출
+    async with session.get(url) as r:
+        ...
+    await HTTP_POOL.release(session)    # wrapper.close()에서 호출
+
+요청은 전송 전에 wrappers.rate_limiter의 venue별 token bucket을 거친다 (TraceConfig).
+우선순위를 직접 지정하려면: session.get(url, trace_request_ctx={"priority": PRIORITY_HIGH})
+"""
+import logging
+from typing import Optional
+
+import aiohttp
+from aiohttp import TCPConnector
+
+from wrappers.rate_limiter import RATE_LIMITER, request_cost, request_priority, venue_for_url
+
+logger = logging.getLogger(__name__)
+
+
+async def _on_request_start(session, trace_config_ctx, params) -> None:
+    venue = venue_for_url(params.url)
+    if venue is None:
+        return
+    path = params.url.path
+    ctx = trace_config_ctx.trace_request_ctx or {}
+    priority = ctx.get("priority") if isinstance(ctx, dict) else None
+    if priority is None:
+        priority = request_priority(params.method, path)
+    await RATE_LIMITER.acquire(venue, "rest", cost=request_cost(venue, params.method, path), priority=priority)
+
+
+def rate_limit_trace_config() -> aiohttp.TraceConfig:
+    """요청 전송 전 rate limiter 대기 (풀 밖에서 만드는 임시 세션에도 사용)"""
+    tc = aiohttp.TraceConfig()
+    tc.on_request_start.append(_on_request_start)
+    return tc
+
+
+class HTTPSessionPool:
+    """
+    Singleton pool for a shared, keep-alive aiohttp.ClientSession.
+    참조 카운트가 0이 되면 세션(및 커넥터의 소켓)을 닫는다.
+    """
+
+    LIMIT: int = 100  # 전체 동시 연결 수
+    LIMIT_PER_HOST: int = 16  # host별 동시 연결 수 (venue별 keep-alive 풀 크기)
+    DNS_TTL: int = 300  # DNS 캐시 유지 시간 (초)
+    KEEPALIVE_TIMEOUT: float = 30.0  # idle 연결 유지 시간 (초)
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._refs: int = 0
+
+    def _make_connector(self) -> TCPConnector:
+        return TCPConnector(
+            limit=self.LIMIT,
+            limit_per_host=self.LIMIT_PER_HOST,
+            use_dns_cache=True,
+            ttl_dns_cache=self.DNS_TTL,
+            keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True,  # 종료 중인 SSL 소켓 정리 보조
+        )
+
+    @property
+    def session(self) -> Optional[aiohttp.ClientSession]:
+        """현재 공유 세션 (없거나 닫혔으면 None)"""
+        if self._session is None or self._session.closed:
+            return None
+        return self._session
+
+    def acquire(self) -> aiohttp.ClientSession:
+        """
+        공유 세션 참조를 하나 얻는다. 세션이 없거나 닫혀 있으면 새로 만든다.
+        이벤트 루프 안에서 호출해야 한다 (ClientSession 생성 조건).
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=self._make_connector(),
+                trace_configs=[rate_limit_trace_config()],
+            )
+            self._refs = 0
+        self._refs += 1
+        return self._session
+
+    async def release(self, session: Optional[aiohttp.ClientSession]) -> None:
+        """참조 반환. 마지막 참조가 반환되면 세션을 닫는다."""
+        if session is None or session is not self._session:
+            return
+        self._refs = max(0, self._refs - 1)
+        if self._refs == 0:
+            await self.close_all()
+
+    async def close_all(self) -> None:
+        """참조 수와 관계없이 공유 세션 종료"""
+        session, self._session = self._session, None
+        self._refs = 0
+        if session is not None and not session.closed:
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning(f"[HTTPSessionPool] close failed: {e}")
+
+
+# Global singleton
+HTTP_POOL = HTTPSessionPool()
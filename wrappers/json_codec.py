@@ -0,0 +1,124 @@
+"""
+JSON Codec
+==========
+WS 수신/송신 경로용 JSON codec 선택.
+
+모든 WS 프레임(Pacifica prices 전체 심볼 브로드캐스트, Backpack depth delta,
+HL allMids 등)이 decode를 거치므로 설치되어 있으면 빠른 라이브러리를 사용한다.
+우선순위: orjson > msgspec > stdlib json (모두 같은 dict/list 결과를 반환)
+
+사용법:
+    from wrappers.json_codec import get_codec
+
+    codec = get_codec()            # 자동 선택
+    codec = get_codec("stdlib")    # 강제 지정 ("orjson" | "msgspec" | "stdlib")
+    data = codec.loads(frame)      # str / bytes 모두 허용
+    text = codec.dumps(obj)        # compact str (separators=(",", ":"), ensure_ascii=False)
+
+환경변수 MPDEX_JSON_CODEC 으로 기본 codec을 지정할 수 있다.
+"""
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+CODEC_PREFERENCE = ("orjson", "msgspec", "stdlib")
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+class JSONCodec:
+    """loads/dumps 한 쌍 (dumps는 항상 str 반환 - WS text frame 용)"""
+
+    __slots__ = ("name", "loads", "dumps")
+
+    def __init__(self, name: str, loads: Callable[[Union[str, bytes]], Any], dumps: Callable[[Any], str]):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f"JSONCodec({self.name})"
+
+
+def _make_stdlib() -> JSONCodec:
+    return JSONCodec("stdlib", json.loads, _stdlib_dumps)
+
+
+def _make_orjson() -> JSONCodec:
+    import orjson
+
+    opts = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=opts).decode()
+        except TypeError:
+            # Decimal 등 orjson 미지원 타입 -> stdlib (default 훅 사용하는 호출부 호환)
+            return _stdlib_dumps(obj)
+
+    return JSONCodec("orjson", orjson.loads, dumps)
+
+
+def _make_msgspec() -> JSONCodec:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def dumps(obj: Any) -> str:
+        try:
+            return encoder.encode(obj).decode()
+        except TypeError:
+            return _stdlib_dumps(obj)
+
+    return JSONCodec("msgspec", decoder.decode, dumps)
+
+
+_FACTORIES: Dict[str, Callable[[], JSONCodec]] = {
+    "orjson": _make_orjson,
+    "msgspec": _make_msgspec,
+    "stdlib": _make_stdlib,
+}
+_CACHE: Dict[str, JSONCodec] = {}
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    codec 반환 (생성 결과는 캐시).
+    name=None/"auto" 이면 MPDEX_JSON_CODEC 환경변수 -> CODEC_PREFERENCE 순으로 설치된 것 선택.
+    명시한 codec이 설치되어 있지 않으면 stdlib으로 fallback.
+    """
+    if not name or name == "auto":
+        name = os.environ.get("MPDEX_JSON_CODEC") or "auto"
+
+    if name in _CACHE:
+        return _CACHE[name]
+
+    if name == "auto":
+        candidates = CODEC_PREFERENCE
+    elif name in _FACTORIES:
+        candidates = (name, "stdlib")
+    else:
+        raise ValueError(f"unknown JSON codec: {name} (choose from {', '.join(_FACTORIES)})")
+
+    for candidate in candidates:
+        try:
+            codec = _FACTORIES[candidate]()
+        except ImportError:
+            if candidate == name:
+                logger.warning(f"[json_codec] {name} not installed, falling back")
+            continue
+        _CACHE[name] = codec
+        return codec
+
+    # stdlib은 항상 성공하므로 도달하지 않음
+    return _make_stdlib()
+
+
+# 기본 codec (import 시점에 결정)
+DEFAULT_CODEC = get_codec()
@@ -6,6 +6,7 @@ import aiohttp
 import websockets
 import time
 import os
+from wrappers.http_pool import rate_limit_trace_config
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +50,7 @@ class LighterExchange(MultiPerpDexMixin, MultiPerpDex):
 
     async def _get_session(self):
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(trace_configs=[rate_limit_trace_config()])
         return self.session
 
     async def _run_sync(self, func, *args, **kwargs):
@@ -0,0 +1,130 @@
+"""
+Market Metadata Disk Cache
+==========================
+거래소 메타데이터(마켓 목록, tick/lot size, HL spot/perp meta 등)를 디스크에 버전 관리하며 보관하는 캐시.
+
+프로세스 재시작(특히 크래시 직후, 헤지가 풀린 상태) 때 메타데이터를 다시 받느라 기동이 늦어지지 않도록
+- TTL 이내: 캐시를 그대로 사용 (네트워크 호출 없음)
+- TTL 초과 ~ MAX_STALE: 캐시로 즉시 기동하고 백그라운드에서 재조회 후 on_refresh 콜백으로 반영
+- MAX_STALE 초과 / 캐시 없음 / 버전 불일치: 동기 조회 후 저장
+
+저장 위치: $MPDEX_META_CACHE_DIR 또는 ./.cache/mpdex_meta/ (키별 JSON 파일)
+MPDEX_META_CACHE=0 이면 디스크 캐시를 쓰지 않고 항상 조회한다.
+
+사용법:
+    from wrappers.meta_cache import META_CACHE
+
+    data, age = await META_CACHE.get(
+        "backpack:https://api.backpack.exchange/api/v1/markets",
+        fetch=self._fetch_markets,          # async () -> JSON 직렬화 가능한 데이터
+        on_refresh=self._apply_markets,     # 백그라운드 재조회 결과 반영 (sync)
+    )
+    # age: 0.0 이면 방금 조회한 데이터, > 0 이면 디스크 캐시 (초)
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class MetaCache:
+    VERSION = 1  # 저장 형식이 바뀌면 올림 (이전 버전 파일은 무시)
+    DEFAULT_TTL = 6 * 3600.0  # 6시간
+    MAX_STALE = 7 * 86400.0  # 7일 넘은 캐시는 기동에 쓰지 않음
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = Path(directory or os.environ.get("MPDEX_META_CACHE_DIR") or Path.cwd() / ".cache" / "mpdex_meta")
+        self.enabled = os.environ.get("MPDEX_META_CACHE", "1") != "0"
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
+    def _path(self, key: str) -> Path:
+        # 사람이 읽을 수 있는 prefix + 충돌 방지 해시
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", key)[:60]
+        digest = hashlib.sha1(key.encode()).hexdigest()[:10]
+        return self.directory / f"{slug}-{digest}.json"
+
+    def load(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Returns (data, age_seconds) or None (없음/손상/버전 불일치)"""
+        if not self.enabled:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                blob = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(blob, dict) or blob.get("version") != self.VERSION or blob.get("key") != key:
+            return None
+        age = max(0.0, time.time() - float(blob.get("saved_at") or 0))
+        return blob.get("data"), age
+
+    def save(self, key: str, data: Any) -> None:
+        if not self.enabled:
+            return
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": self.VERSION, "key": key, "saved_at": time.time(), "data": data}, f, ensure_ascii=False)
+            os.replace(tmp, path)  # atomic (동시 기동한 프로세스가 반쯤 쓴 파일을 읽지 않도록)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"[meta_cache] save failed for {key}: {e}")
+
+    async def get(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        *,
+        ttl: Optional[float] = None,
+        on_refresh: Optional[Callable[[Any], None]] = None,
+        validate: Optional[Callable[[Any], bool]] = None,
+    ) -> Tuple[Any, float]:
+        """
+        캐시 우선 조회. Returns (data, age_seconds) - age 0.0 = 방금 조회.
+        validate(data)가 False인 조회 결과는 반환은 하되 저장하지 않는다 (빈 응답 등).
+        """
+        ttl = self.DEFAULT_TTL if ttl is None else ttl
+        cached = self.load(key)
+        if cached is not None:
+            data, age = cached
+            if age < ttl:
+                return data, age
+            if age < self.MAX_STALE:
+                self._schedule_refresh(key, fetch, on_refresh, validate)
+                return data, age
+
+        data = await fetch()
+        if validate is None or validate(data):
+            self.save(key, data)
+        return data, 0.0
+
+    def _schedule_refresh(self, key, fetch, on_refresh, validate) -> None:
+        task = self._refreshing.get(key)
+        if task is not None and not task.done():
+            return
+        self._refreshing[key] = asyncio.create_task(self._refresh(key, fetch, on_refresh, validate))
+
+    async def _refresh(self, key, fetch, on_refresh, validate) -> None:
+        try:
+            data = await fetch()
+            if validate is not None and not validate(data):
+                return
+            self.save(key, data)
+            if on_refresh is not None:
+                on_refresh(data)
+            logger.info(f"[meta_cache] revalidated {key}")
+        except Exception as e:
+            logger.warning(f"[meta_cache] background refresh failed for {key}: {e}")
+        finally:
+            self._refreshing.pop(key, None)
+
+
+# Global singleton
+META_CACHE = MetaCache()
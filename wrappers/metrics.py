@@ -0,0 +1,249 @@
+"""
+Latency Metrics
+===============
+MultiPerpDex 메서드 호출별 latency histogram (venue / method / path(ws|rest) / outcome(ok|error)).
+MultiPerpDex.__init_subclass__가 모든 래퍼의 공개 메서드(create_order, get_position, cancel_orders ...)를
+자동으로 감싸므로 래퍼 코드는 수정할 필요가 없다.
+
+path 판정:
+- 메서드 실행 중 같은 이름의 *_rest 메서드가 호출되면 "rest" (ws_supported였다면 WS->REST fallback 카운트)
+- 아니면 ws_supported[method]가 True면 "ws", 아니면 "rest"
+
+조회:
+    from wrappers.metrics import METRICS
+
+    METRICS.snapshot()            # {"backpack.create_order.rest.ok": {"count", "avg_ms", "p50_ms", "p99_ms", "max_ms"}, ...}
+    METRICS.fallbacks             # {("pacifica", "get_position"): 3, ...}
+    METRICS.render_prometheus()   # Prometheus text exposition format
+    await start_metrics_server(port=9464)   # GET /metrics (MPDEX_METRICS_PORT 환경변수로 봇에서 활성화)
+"""
+import asyncio
+import contextvars
+import functools
+import logging
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 계측 대상 메서드 (각 메서드의 *_rest 변형도 자동 계측)
+INSTRUMENTED_METHODS = (
+    "create_order",
+    "get_position",
+    "close_position",
+    "get_collateral",
+    "get_open_orders",
+    "cancel_orders",
+    "get_mark_price",
+    "get_orderbook",
+    "update_leverage",
+    "get_spot_balance",
+)
+
+# histogram bucket 상한 (ms)
+BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "sum_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)  # 마지막 = +Inf
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.sum_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def quantile(self, q: float) -> float:
+        """bucket 선형 보간 추정치 (ms)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for i, c in enumerate(self.counts):
+            upper = BUCKETS_MS[i] if i < len(BUCKETS_MS) else self.max_ms
+            if c and seen + c >= rank:
+                return min(self.max_ms, lower + (upper - lower) * (rank - seen) / c)
+            seen += c
+            lower = upper
+        return self.max_ms
+
+
+class _CallFrame:
+    __slots__ = ("owner", "method", "rest")
+
+    def __init__(self, owner, method):
+        self.owner = owner
+        self.method = method
+        self.rest = False
+
+
+_CURRENT: contextvars.ContextVar[Optional[_CallFrame]] = contextvars.ContextVar("mpdex_call_frame", default=None)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.enabled = True
+        self.histograms: Dict[Tuple[str, str, str, str], Histogram] = {}
+        self.fallbacks: Dict[Tuple[str, str], int] = {}
+
+    def observe(self, venue: str, method: str, path: str, outcome: str, ms: float) -> None:
+        key = (venue, method, path, outcome)
+        h = self.histograms.get(key)
+        if h is None:
+            h = self.histograms[key] = Histogram()
+        h.observe(ms)
+
+    def count_fallback(self, venue: str, method: str) -> None:
+        key = (venue, method)
+        self.fallbacks[key] = self.fallbacks.get(key, 0) + 1
+
+    def reset(self) -> None:
+        self.histograms.clear()
+        self.fallbacks.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        out = {}
+        for (venue, method, path, outcome), h in sorted(self.histograms.items()):
+            out[f"{venue}.{method}.{path}.{outcome}"] = {
+                "count": h.count,
+                "avg_ms": h.sum_ms / h.count if h.count else 0.0,
+                "p50_ms": h.quantile(0.5),
+                "p99_ms": h.quantile(0.99),
+                "max_ms": h.max_ms,
+            }
+        return out
+
+    def summary_lines(self) -> List[str]:
+        """로그용 한 줄 요약 (venue.method.path.outcome n avg p50 p99 max)"""
+        lines = []
+        for name, s in self.snapshot().items():
+            lines.append(
+                f"{name}: n={s['count']} avg={s['avg_ms']:.1f}ms p50={s['p50_ms']:.1f}ms "
+                f"p99={s['p99_ms']:.1f}ms max={s['max_ms']:.1f}ms"
+            )
+        for (venue, method), n in sorted(self.fallbacks.items()):
+            lines.append(f"{venue}.{method}: ws->rest fallback {n}")
+        return lines
+
+    def render_prometheus(self) -> str:
+        lines = [
+            "# HELP mpdex_call_latency_seconds MultiPerpDex method latency",
+            "# TYPE mpdex_call_latency_seconds histogram",
+        ]
+        for (venue, method, path, outcome), h in sorted(self.histograms.items()):
+            labels = f'venue="{venue}",method="{method}",path="{path}",outcome="{outcome}"'
+            cumulative = 0
+            for i, c in enumerate(h.counts):
+                cumulative += c
+                le = f"{BUCKETS_MS[i] / 1000:g}" if i < len(BUCKETS_MS) else "+Inf"
+                lines.append(f'mpdex_call_latency_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"mpdex_call_latency_seconds_sum{{{labels}}} {h.sum_ms / 1000:.6f}")
+            lines.append(f"mpdex_call_latency_seconds_count{{{labels}}} {h.count}")
+        lines += [
+            "# HELP mpdex_ws_rest_fallback_total WS path unavailable, served by REST",
+            "# TYPE mpdex_ws_rest_fallback_total counter",
+        ]
+        for (venue, method), n in sorted(self.fallbacks.items()):
+            lines.append(f'mpdex_ws_rest_fallback_total{{venue="{venue}",method="{method}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+
+# Global singleton
+METRICS = MetricsRegistry()
+
+
+def venue_name(obj) -> str:
+    """BackpackExchange -> backpack"""
+    name = type(obj).__name__
+    if name.endswith("Exchange"):
+        name = name[: -len("Exchange")]
+    return name.lower()
+
+
+def instrument(method: str, fn, *, rest_of: Optional[str] = None):
+    """
+    async 메서드를 latency 계측 래퍼로 감싼다.
+    rest_of: *_rest 변형이면 원래 메서드 이름 (호출 중인 상위 프레임을 rest 경로로 표시)
+    """
+    @functools.wraps(fn)
+    async def wrapper(self, *args, **kwargs):
+        if not METRICS.enabled:
+            return await fn(self, *args, **kwargs)
+        parent = _CURRENT.get()
+
+        if rest_of is not None and parent is not None and parent.owner is self and parent.method == rest_of:
+            # 상위 메서드 안에서의 REST 경로 -> 상위 프레임에 기록 (별도 histogram 없음)
+            if not parent.rest:
+                parent.rest = True
+                if getattr(self, "ws_supported", {}).get(rest_of):
+                    METRICS.count_fallback(venue_name(self), rest_of)
+            return await fn(self, *args, **kwargs)
+
+        name = rest_of or method
+        if parent is not None and parent.owner is self and parent.method == name:
+            # super() 호출 등 같은 메서드 중첩 -> 바깥 호출에서만 기록
+            return await fn(self, *args, **kwargs)
+
+        frame = _CallFrame(self, name)
+        frame.rest = rest_of is not None
+        token = _CURRENT.set(frame)
+        t0 = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await fn(self, *args, **kwargs)
+            outcome = "ok"
+            return result
+        finally:
+            _CURRENT.reset(token)
+            ms = (time.perf_counter() - t0) * 1000
+            path = "rest" if frame.rest or not getattr(self, "ws_supported", {}).get(name) else "ws"
+            METRICS.observe(venue_name(self), name, path, outcome, ms)
+
+    wrapper.__mpdex_instrumented__ = True
+    return wrapper
+
+
+def instrument_class(cls) -> None:
+    """cls의 계측 대상 메서드(상속 포함)를 감싼다. 이미 감싼 메서드는 건너뜀."""
+    for method in INSTRUMENTED_METHODS:
+        for name, rest_of in ((method, None), (f"{method}_rest", method)):
+            fn = getattr(cls, name, None)
+            if fn is None or getattr(fn, "__mpdex_instrumented__", False):
+                continue
+            if getattr(fn, "__isabstractmethod__", False) or not asyncio.iscoroutinefunction(fn):
+                continue
+            setattr(cls, name, instrument(name, fn, rest_of=rest_of))
+
+
+async def _serve_metrics(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        await reader.readuntil(b"\r\n\r\n")
+        body = METRICS.render_prometheus().encode()
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/plain; version=0.0.4\r\n"
+            + f"Content-Length: {len(body)}\r\n".encode()
+            + b"Connection: close\r\n\r\n"
+            + body
+        )
+        await writer.drain()
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(host: str = "127.0.0.1", port: int = 9464) -> asyncio.AbstractServer:
+    """Prometheus text endpoint (모든 경로에 같은 응답, 스크레이프 경로는 보통 /metrics)"""
+    server = await asyncio.start_server(_serve_metrics, host, port)
+    logger.info(f"[metrics] serving Prometheus text on http://{host}:{port}/metrics")
+    return server
@@ -0,0 +1,146 @@
+"""
+Sorted Order Book
+=================
+증분(delta) 업데이트를 받는 WS 오더북용 정렬 자료구조.
+
+한 side는 price -> size dict 와 bisect로 정렬 유지되는 price 배열로 구성된다.
+- 레벨 갱신/삭제: dict O(1) + bisect O(log n) (배열 insert/pop은 memmove)
+- top-of-book: O(1)
+- top-N 스냅샷: O(N)
+
+Backpack depth 스트림(~5000 레벨)이 첫 사용처이며, 거래소 독립적이라
+Pacifica / Hyperliquid WS 클라이언트에서도 그대로 사용할 수 있다.
+
+사용법:
+    from wrappers.orderbook import OrderBook
+
+    book = OrderBook()
+    book.apply_snapshot(bids=[["100.5", "1.2"], ...], asks=[["100.6", "0.8"], ...])
+    book.apply_delta(bids=[["100.5", "0"]], asks=[])   # size 0 = 레벨 삭제
+    book.best_bid()                                     # (price, size) or None
+    book.snapshot(depth=50)                             # {"asks": [[p, s], ...], "bids": [...], "time": ms}
+"""
+import time
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class BookSide:
+    """
+    오더북 한쪽(bids 또는 asks).
+    bids는 내림차순이 필요하므로 가격을 음수로 바꾼 key로 오름차순 배열을 유지한다.
+    """
+
+    __slots__ = ("descending", "_levels", "_keys")
+
+    def __init__(self, descending: bool = False):
+        self.descending = descending
+        self._levels: Dict[float, float] = {}  # price -> size
+        self._keys: List[float] = []  # 정렬된 key (bids: -price, asks: price)
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+    def _key(self, price: float) -> float:
+        return -price if self.descending else price
+
+    def clear(self) -> None:
+        self._levels.clear()
+        self._keys.clear()
+
+    def update(self, price: float, size: float) -> None:
+        """레벨 갱신 (size <= 0 이면 삭제)"""
+        if size <= 0:
+            if self._levels.pop(price, None) is not None:
+                key = self._key(price)
+                idx = bisect_left(self._keys, key)
+                if idx < len(self._keys) and self._keys[idx] == key:
+                    self._keys.pop(idx)
+            return
+
+        if price not in self._levels:
+            insort(self._keys, self._key(price))
+        self._levels[price] = size
+
+    def load(self, levels: Iterable[Tuple[float, float]]) -> None:
+        """스냅샷 적재 (기존 레벨 교체, 한 번에 정렬)"""
+        self._levels = {p: s for p, s in levels if s > 0}
+        self._keys = sorted(self._key(p) for p in self._levels)
+
+    def best(self) -> Optional[Tuple[float, float]]:
+        if not self._keys:
+            return None
+        price = self._key(self._keys[0])
+        return price, self._levels[price]
+
+    def top(self, n: Optional[int] = None) -> List[List[float]]:
+        """상위 n개 레벨 [[price, size], ...] (n=None이면 전체)"""
+        keys = self._keys if n is None else self._keys[:n]
+        levels = self._levels
+        if self.descending:
+            return [[-k, levels[-k]] for k in keys]
+        return [[k, levels[k]] for k in keys]
+
+
+def _parse_levels(items: Iterable[Any]) -> List[Tuple[float, float]]:
+    """[[price, size], ...] (문자열/숫자) -> [(float, float), ...], 잘못된 항목은 건너뜀"""
+    out: List[Tuple[float, float]] = []
+    for item in items or ():
+        try:
+            out.append((float(item[0]), float(item[1])))
+        except (IndexError, ValueError, TypeError):
+            continue
+    return out
+
+
+class OrderBook:
+    """
+    가격 정렬 오더북 (bids 내림차순, asks 오름차순).
+    스냅샷/증분 업데이트 모두 원본 [[price, size], ...] 형식을 받는다.
+    """
+
+    __slots__ = ("bids", "asks", "time")
+
+    def __init__(self):
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.time: int = 0  # 마지막 갱신 시각 (ms)
+
+    def clear(self) -> None:
+        self.bids.clear()
+        self.asks.clear()
+        self.time = 0
+
+    def apply_snapshot(self, bids: Iterable[Any], asks: Iterable[Any]) -> None:
+        """전체 스냅샷으로 교체"""
+        self.bids.load(_parse_levels(bids))
+        self.asks.load(_parse_levels(asks))
+        self.time = int(time.time() * 1000)
+
+    def apply_delta(self, bids: Iterable[Any], asks: Iterable[Any]) -> None:
+        """증분 업데이트 적용 (size 0 = 레벨 삭제)"""
+        for price, size in _parse_levels(bids):
+            self.bids.update(price, size)
+        for price, size in _parse_levels(asks):
+            self.asks.update(price, size)
+        self.time = int(time.time() * 1000)
+
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        return self.asks.best()
+
+    def mid(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def snapshot(self, depth: Optional[int] = None) -> Dict[str, Any]:
+        """기존 캐시 형식의 dict: {"asks": [[p, s], ...], "bids": [[p, s], ...], "time": ms}"""
+        return {
+            "asks": self.asks.top(depth),
+            "bids": self.bids.top(depth),
+            "time": self.time,
+        }
@@ -5,10 +5,11 @@ import uuid
 import requests
 from solders.keypair import Keypair
 import aiohttp
-from aiohttp import TCPConnector
 from typing import Optional, Dict, Any, List
 from decimal import Decimal, ROUND_HALF_UP, ROUND_DOWN, getcontext
 import json
+from wrappers.http_pool import HTTP_POOL
+from wrappers.meta_cache import META_CACHE
 
 BASE_URL = "https://api.pacifica.fi/api/v1"
 WS_URL = "wss://ws.pacifica.fi/ws"
@@ -36,7 +37,7 @@ def _get_signature_header_and_url(req_type:str):
 
 class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
     # no use of private key, but use agent wallets instead (api)
-    def __init__(self, public_key, agent_public_key, agent_private_key):
+    def __init__(self, public_key, agent_public_key, agent_private_key, *, http_session: Optional[aiohttp.ClientSession] = None):
         super().__init__()
         if not (public_key and agent_public_key and agent_private_key):
             raise ValueError("Pacifica required, pub key, agent pub key, and agent private key")
@@ -44,7 +45,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
         self.agent_public_key = agent_public_key    # required
         self.agent_private_key = agent_private_key  # required
         self.agent_keypair = Keypair.from_base58_string(agent_private_key)
-        self._http: Optional[aiohttp.ClientSession] = None
+        self._http: Optional[aiohttp.ClientSession] = http_session  # 공유 keep-alive 세션
 
         # { "BTC": {"tick_size": "1", "lot_size": "0.00001", "max_leverage": 50, ...}, ... }
         self._symbol_meta: Dict[str, Dict[str, Any]] = {}
@@ -72,22 +73,40 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
 
     def _session(self) -> aiohttp.ClientSession:
         if self._http is None or self._http.closed:
-            self._http = aiohttp.ClientSession(
-                connector=TCPConnector(
-                    force_close=True,             # 매 요청 후 소켓 닫기 → 종료 시 잔여 소켓 최소화
-                    enable_cleanup_closed=True,   # 종료 중인 SSL 소켓 정리 보조 (로그 억제)
-                )
-            )
+            self._http = HTTP_POOL.acquire()
         return self._http
     
     async def close(self):
-        if self._http and not self._http.closed:
-            await self._http.close()
+        if self._http is not None:
+            await HTTP_POOL.release(self._http)
+            self._http = None
         if self.ws_client:
             from .pacifica_ws_client import PACIFICA_WS_POOL
             await PACIFICA_WS_POOL.release(self.public_key)
             self.ws_client = None
     
+    def add_position_listener(self, callback):
+        """Register callback(symbol) on account_positions pushes"""
+        if not self.ws_client:
+            return False
+        self.ws_client.add_listener("position", callback)
+        return True
+
+    def remove_position_listener(self, callback):
+        if self.ws_client:
+            self.ws_client.remove_listener("position", callback)
+
+    def add_fill_listener(self, callback):
+        """Register callback(fill) on account_trades pushes"""
+        if not self.ws_client:
+            return False
+        self.ws_client.add_listener("fill", callback)
+        return True
+
+    def remove_fill_listener(self, callback):
+        if self.ws_client:
+            self.ws_client.remove_listener("fill", callback)
+
     def get_perp_quote(self, symbol, *, is_basic_coll=False):
         return 'USDC'
     
@@ -99,13 +118,33 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
             return self
 
         url = f"{BASE_URL}/info"
+        # 디스크 메타 캐시로 즉시 기동, TTL 지나면 백그라운드 재조회
+        items, _ = await META_CACHE.get(
+            f"pacifica:{url}",
+            self._fetch_info,
+            on_refresh=self._on_info_refresh,
+            validate=lambda d: isinstance(d, list) and len(d) > 0,
+        )
+        self._apply_info(items)
+        self._initialized = True
+
+        # Update available symbols
+        self.update_available_symbols()
+
+        # Initialize WebSocket
+        await self._create_ws_client()
+
+        return self
+
+    async def _fetch_info(self) -> List[Dict[str, Any]]:
         s = self._session()
-        async with s.get(url) as r:
+        async with s.get(f"{BASE_URL}/info") as r:
             r.raise_for_status()
             data = await r.json()
-
         # 기대 형태: {"success": true, "data": [ {symbol, tick_size, lot_size, ...}, ... ]}
-        items = data.get("data") or []
+        return data.get("data") or []
+
+    def _apply_info(self, items: List[Dict[str, Any]]) -> None:
         meta: Dict[str, Dict[str, Any]] = {}
         symbols: List[str] = []
         for it in items:
@@ -129,16 +168,11 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
 
         self._symbol_meta = meta
         self._symbol_list = sorted(set(symbols))
-        self._initialized = True
 
-        # Update available symbols
+    def _on_info_refresh(self, items: List[Dict[str, Any]]) -> None:
+        self._apply_info(items)
         self.update_available_symbols()
 
-        # Initialize WebSocket
-        await self._create_ws_client()
-
-        return self
-
     def update_available_symbols(self):
         """Update available_symbols dict from _symbol_list"""
         self.available_symbols['perp'] = []
@@ -288,9 +322,10 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
         async with s.post(url, json=payload, headers={"Content-Type": "application/json"}) as r:
             return await r.json()
 
-    async def create_order(self, symbol, side, amount, price=None, order_type='market', *, is_reduce_only=False, slippage = "0.1"):
+    async def create_order(self, symbol, side, amount, price=None, order_type='market', *, is_reduce_only=False, slippage = "0.1", client_id=None, post_only=False):
         """
         Create order (WS preferred, REST fallback)
+        post_only=True: 지정가 주문을 ALO(Add Liquidity Only)로 전송 (즉시 체결될 가격이면 거래소가 거절)
         """
         symbol = symbol.upper()
 
@@ -320,6 +355,8 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
                     price=price_adjusted,
                     is_reduce_only=is_reduce_only,
                     slippage=slippage,
+                    client_id=client_id,
+                    post_only=post_only,
                 )
             except Exception as e:
                 print(f"[pacifica] create_order WS failed, falling back to REST: {e}")
@@ -331,9 +368,11 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
             price=price_adjusted,
             is_reduce_only=is_reduce_only,
             slippage=slippage,
+            client_id=client_id,
+            post_only=post_only,
         )
 
-    async def create_order_ws(self, symbol, side, amount, price=None, *, is_reduce_only=False, slippage="0.1"):
+    async def create_order_ws(self, symbol, side, amount, price=None, *, is_reduce_only=False, slippage="0.1", client_id=None, post_only=False):
         """Create order via WebSocket"""
         if not self.ws_client:
             await self._create_ws_client()
@@ -345,6 +384,8 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
             price=price,
             reduce_only=is_reduce_only,
             slippage_percent=str(slippage),
+            client_order_id=client_id,
+            tif="ALO" if post_only else "GTC",
         )
 
         # Parse response
@@ -355,7 +396,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
         else:
             raise Exception(f"WS order failed: {result}")
 
-    async def create_order_rest(self, symbol, side, amount, price=None, *, is_reduce_only=False, slippage="0.1"):
+    async def create_order_rest(self, symbol, side, amount, price=None, *, is_reduce_only=False, slippage="0.1", client_id=None, post_only=False):
         """Create order via REST"""
         # common payload
         signature_payload = {
@@ -363,7 +404,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
                 "reduce_only": False,
                 "amount": amount,
                 "side": side,
-                "client_order_id": str(uuid.uuid4()),
+                "client_order_id": client_id or str(uuid.uuid4()),
         }
         if price is None:
             # market order
@@ -373,7 +414,7 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
         else:
             # limit order
             signature_payload["price"] = price
-            signature_payload["tif"] = "POST_ONLY"
+            signature_payload["tif"] = "ALO" if post_only else "GTC"
             signature_header, req_url = _get_signature_header_and_url("create_order")
 
         _, signature = sign_message(
@@ -588,6 +629,44 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
                 })
         return results
 
+    async def fetch_fills_rest(self, symbol, since_ms):
+        """
+        GET /trades/history (REST) - fills() 폴링 경로 (WS 미사용 시)
+        """
+        url = f"{BASE_URL}/trades/history"
+
+        s = self._session()
+        params = {"account": self.public_key, "start_time": int(since_ms)}
+        if symbol:
+            params["symbol"] = symbol
+
+        async with s.get(url, params=params) as r:
+            r.raise_for_status()
+            data = await r.json()
+
+        results = []
+        for t in data.get("data") or []:
+            try:
+                size = float(t.get("amount") or 0)
+            except (ValueError, TypeError):
+                continue
+            if size <= 0:
+                continue
+            price, fee = t.get("price"), t.get("fee")
+            results.append({
+                "symbol": t.get("symbol"),
+                "side": "buy" if t.get("side") in ("open_long", "close_short") else "sell",
+                "size": size,
+                "price": float(price) if price is not None else None,
+                "order_id": t.get("order_id"),
+                "fill_id": t.get("history_id"),
+                "fee": float(fee) if fee is not None else None,
+                "is_maker": t.get("event_type") == "fulfill_maker",
+                "time": int(t.get("created_at") or 0),
+            })
+        results.sort(key=lambda f: f["time"])
+        return results
+
     async def cancel_orders(self, symbol, open_orders = None):
         """
         Cancel orders (WS preferred, REST fallback)
@@ -804,6 +883,9 @@ class PacificaExchange(MultiPerpDexMixin, MultiPerpDex):
     # ----------------------------
     # Orderbook
     # ----------------------------
+    async def get_tick_size(self, symbol: str) -> float:
+        return float(self._get_meta(symbol)["tick_size"])
+
     async def get_orderbook(self, symbol: str, agg_level: int = 1, timeout: float = 5.0) -> Dict[str, Any]:
         """
         Get orderbook via WebSocket.
@@ -7,6 +7,7 @@ Provides real-time data fetching for:
 - account_info (user collateral/balance) - requires auth
 - account_positions (user positions) - requires auth
 - account_orders (user open orders) - requires auth
+- account_trades (user fills) - requires auth
 
 WS URL: wss://ws.pacifica.fi/ws
 Heartbeat: ping every 50s (timeout at 60s)
@@ -20,7 +21,31 @@ from typing import Optional, Dict, Any, Set, List
 from mpdex.utils.common_pacifica import sign_message
 from solders.keypair import Keypair
 
-from wrappers.base_ws_client import BaseWSClient, _json_dumps
+from wrappers.base_ws_client import BaseWSClient
+from wrappers.rate_limiter import PRIORITY_HIGH
+from wrappers.ws_records import (
+    HAS_MSGSPEC,
+    PacificaOrder,
+    PacificaOrdersFrame,
+    PacificaPosition,
+    PacificaPositionsFrame,
+    PacificaPriceTick,
+    PacificaPricesFrame,
+)
+
+if HAS_MSGSPEC:
+    import msgspec
+
+    # 고빈도 채널은 bytes/str에서 레코드 리스트로 바로 decode (중간 dict 생성 없음)
+    _TYPED_DECODERS = {
+        "prices": msgspec.json.Decoder(PacificaPricesFrame),
+        "account_positions": msgspec.json.Decoder(PacificaPositionsFrame),
+        "account_orders": msgspec.json.Decoder(PacificaOrdersFrame),
+    }
+else:
+    _TYPED_DECODERS = {}
+
+_CHANNEL_TAG = '"channel":"'
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +60,7 @@ class PacificaWSClient(BaseWSClient):
     """
 
     WS_URL = PACIFICA_WS_URL
+    RATE_LIMIT_VENUE = "pacifica"
     PING_INTERVAL = 50.0  # 50초마다 ping (서버 timeout 60초)
     RECV_TIMEOUT = 60.0  # 60초간 메시지 없으면 재연결
     RECONNECT_MIN = 1.0
@@ -59,13 +85,14 @@ class PacificaWSClient(BaseWSClient):
         self._account_info_subscribed: bool = False
         self._account_positions_subscribed: bool = False
         self._account_orders_subscribed: bool = False
+        self._account_trades_subscribed: bool = False
 
         # Cached data
-        self._prices: Dict[str, Dict[str, Any]] = {}
+        self._prices: Dict[str, PacificaPriceTick] = {}
         self._orderbooks: Dict[str, Dict[str, Any]] = {}
         self._account_info: Optional[Dict[str, Any]] = None
-        self._positions: Dict[str, Dict[str, Any]] = {}
-        self._orders: List[Dict[str, Any]] = []
+        self._positions: Dict[str, PacificaPosition] = {}
+        self._orders: List[PacificaOrder] = []
 
         # Events for waiting
         self._prices_event: asyncio.Event = asyncio.Event()
@@ -116,6 +143,11 @@ class PacificaWSClient(BaseWSClient):
             self._handle_orders(data.get("data", []))
             return
 
+        # Account trades (fills)
+        if channel == "account_trades":
+            self._handle_trades(data.get("data", []))
+            return
+
         # Trading responses (create_order, cancel_order, update_leverage, etc.)
         if channel in ("create_order", "create_market_order", "cancel_order", "cancel_all_orders", "update_leverage"):
             self._handle_trading_response(data)
@@ -126,6 +158,23 @@ class PacificaWSClient(BaseWSClient):
             self._handle_trading_response(data)
             return
 
+    def _decode_message(self, raw: Any) -> Any:
+        """prices / account_positions / account_orders 는 msgspec 설치 시 typed decode"""
+        if _TYPED_DECODERS:
+            head = raw[:48]
+            if isinstance(head, (bytes, bytearray)):
+                head = head.decode("utf-8", "ignore")
+            idx = head.find(_CHANNEL_TAG)
+            if idx >= 0:
+                start = idx + len(_CHANNEL_TAG)
+                decoder = _TYPED_DECODERS.get(head[start:head.find('"', start)])
+                if decoder is not None:
+                    try:
+                        return decoder.decode(raw)
+                    except msgspec.DecodeError:
+                        pass  # 스키마 불일치 (에러 응답 등) - 일반 decode
+        return self._codec.loads(raw)
+
     async def _resubscribe(self) -> None:
         """Resubscribe to all channels after reconnect"""
         # 구독 상태 플래그 저장
@@ -134,6 +183,7 @@ class PacificaWSClient(BaseWSClient):
         was_account_info = self._account_info_subscribed
         was_account_positions = self._account_positions_subscribed
         was_account_orders = self._account_orders_subscribed
+        was_account_trades = self._account_trades_subscribed
 
         # 구독 플래그 초기화 (재구독 허용)
         self._prices_subscribed = False
@@ -141,6 +191,7 @@ class PacificaWSClient(BaseWSClient):
         self._account_info_subscribed = False
         self._account_positions_subscribed = False
         self._account_orders_subscribed = False
+        self._account_trades_subscribed = False
 
         # 캐시된 데이터 초기화 (stale data 방지)
         self._prices.clear()
@@ -171,10 +222,12 @@ class PacificaWSClient(BaseWSClient):
                 await self.subscribe_account_positions(self.public_key)
             if was_account_orders:
                 await self.subscribe_account_orders(self.public_key)
+            if was_account_trades:
+                await self.subscribe_account_trades(self.public_key)
 
     def _build_ping_message(self) -> Optional[str]:
         """Build ping message for Pacifica"""
-        return _json_dumps({"method": "ping"})
+        return self._dumps({"method": "ping"})
 
     # ==================== Connection Management ====================
 
@@ -191,28 +244,24 @@ class PacificaWSClient(BaseWSClient):
         self._account_info_subscribed = False
         self._account_positions_subscribed = False
         self._account_orders_subscribed = False
+        self._account_trades_subscribed = False
 
     # ==================== Message Handlers ====================
 
-    def _handle_prices(self, items: List[Dict[str, Any]]) -> None:
-        """Handle prices channel data"""
+    def _handle_prices(self, items: List[Any]) -> None:
+        """Handle prices channel data (items: wire dicts or PacificaPriceTick)"""
+        now_ms = int(time.time() * 1000)
         for item in items:
-            if not isinstance(item, dict):
+            if isinstance(item, dict):
+                item = PacificaPriceTick.from_wire(item)
+            elif not isinstance(item, PacificaPriceTick):
                 continue
-            symbol = str(item.get("symbol", "")).upper()
+            symbol = str(item.symbol or "").upper()
             if not symbol:
                 continue
-            self._prices[symbol] = {
-                "mark": item.get("mark"),
-                "mid": item.get("mid"),
-                "oracle": item.get("oracle"),
-                "funding": item.get("funding"),
-                "next_funding": item.get("next_funding"),
-                "open_interest": item.get("open_interest"),
-                "volume_24h": item.get("volume_24h"),
-                "yesterday_price": item.get("yesterday_price"),
-                "timestamp": item.get("timestamp", int(time.time() * 1000)),
-            }
+            if item.timestamp is None:
+                item.timestamp = now_ms
+            self._prices[symbol] = item
         if not self._prices_event.is_set():
             self._prices_event.set()
 
@@ -273,71 +322,102 @@ class PacificaWSClient(BaseWSClient):
         if not self._account_info_event.is_set():
             self._account_info_event.set()
 
-    def _handle_positions(self, items: List[Dict[str, Any]]) -> None:
+    def _handle_positions(self, items: List[Any]) -> None:
         """
         Handle account_positions data.
-        Format: [{s, d, a, p, m, f, i, l, t}, ...]
+        Format: [{s, d, a, p, m, f, i, l, t}, ...] (wire dicts or PacificaPosition)
         """
         # Clear existing positions and rebuild from snapshot
+        prev = {sym: (p.side, p.amount) for sym, p in self._positions.items()}
         self._positions.clear()
 
+        now_ms = int(time.time() * 1000)
         for item in items:
-            if not isinstance(item, dict):
+            if isinstance(item, dict):
+                item = PacificaPosition.from_wire(item)
+            elif not isinstance(item, PacificaPosition):
                 continue
-            symbol = str(item.get("s", "")).upper()
+            symbol = str(item.symbol or "").upper()
             if not symbol:
                 continue
 
-            amount = item.get("a", "0")
             try:
-                if float(amount) == 0:
+                if float(item.amount) == 0:
                     continue
             except (ValueError, TypeError):
                 continue
 
-            self._positions[symbol] = {
-                "symbol": symbol,
-                "side": item.get("d"),  # bid or ask
-                "amount": amount,
-                "entry_price": item.get("p"),
-                "margin": item.get("m"),
-                "funding_fee": item.get("f"),
-                "is_isolated": item.get("i", False),
-                "liquidation_price": item.get("l"),
-                "timestamp": item.get("t", int(time.time() * 1000)),
-            }
+            item.symbol = symbol
+            if item.timestamp is None:
+                item.timestamp = now_ms
+            self._positions[symbol] = item
 
         if not self._positions_event.is_set():
             self._positions_event.set()
 
-    def _handle_orders(self, items: List[Dict[str, Any]]) -> None:
+        # 변경된 심볼만 리스너에 통지 (스냅샷 채널이므로 이전 상태와 비교)
+        for symbol in set(prev) | set(self._positions):
+            curr = self._positions.get(symbol)
+            if prev.get(symbol) != ((curr.side, curr.amount) if curr else None):
+                self._notify("position", symbol)
+
+    def _handle_orders(self, items: List[Any]) -> None:
         """
         Handle account_orders data.
-        Format: [{i, I, s, d, p, a, f, c, t, st, ot, sp, ro}, ...]
+        Format: [{i, I, s, d, p, a, f, c, t, st, ot, sp, ro}, ...] (wire dicts or PacificaOrder)
         """
         parsed = []
         for item in items:
-            if not isinstance(item, dict):
+            if isinstance(item, dict):
+                item = PacificaOrder.from_wire(item)
+            elif not isinstance(item, PacificaOrder):
                 continue
-            parsed.append({
-                "order_id": item.get("i"),
-                "client_order_id": item.get("I"),
-                "symbol": str(item.get("s", "")).upper(),
-                "side": item.get("d"),  # bid or ask
-                "price": item.get("p"),
-                "amount": item.get("a"),
-                "filled_amount": item.get("f"),
-                "cancelled_amount": item.get("c"),
-                "timestamp": item.get("t"),
-                "stop_type": item.get("st"),
-                "order_type": item.get("ot"),
-                "stop_price": item.get("sp"),
-                "reduce_only": item.get("ro", False),
-            })
+            item.symbol = str(item.symbol or "").upper()
+            parsed.append(item)
         self._orders = parsed
         if not self._orders_event.is_set():
             self._orders_event.set()
 
+    def _handle_trades(self, items: List[Any]) -> None:
+        """
+        Handle account_trades data (체결 1건당 1 항목, 스냅샷 아님) -> fill 리스너 통지.
+        Format: [{h, i, I, u, s, p, o, a, te, ts, tc, f, n, t}, ...]
+        (h: history id, i: order id, p: 체결가, a: 체결 수량, te: fulfill_maker/fulfill_taker,
+         ts: open_long/open_short/close_long/close_short, f: 수수료, t: 체결 시각 ms)
+        """
+        if isinstance(items, dict):
+            items = [items]
+        for item in items or []:
+            if not isinstance(item, dict):
+                continue
+            try:
+                size = float(item.get("a") or 0)
+            except (ValueError, TypeError):
+                continue
+            if size <= 0:
+                continue
+            trade_side = str(item.get("ts") or "")
+            try:
+                price = float(item["p"])
+            except (KeyError, ValueError, TypeError):
+                price = None
+            try:
+                fee = float(item["f"])
+            except (KeyError, ValueError, TypeError):
+                fee = None
+            maker = item.get("te")
+            self._notify("fill", {
+                "symbol": str(item.get("s") or "").upper(),
+                "side": "buy" if trade_side in ("open_long", "close_short") else "sell",
+                "size": size,
+                "price": price,
+                "order_id": item.get("i"),
+                "fill_id": item.get("h"),
+                "fee": fee,
+                "is_maker": maker == "fulfill_maker" if maker else None,
+                "time": int(item.get("t") or time.time() * 1000),
+            })
+
     def _handle_trading_response(self, data: Dict[str, Any]) -> None:
         """Handle trading response (create_order, cancel_order, etc.)"""
         req_id = data.get("id")
@@ -453,18 +533,34 @@ class PacificaWSClient(BaseWSClient):
         })
         self._account_orders_subscribed = True
 
+    async def subscribe_account_trades(self, account: str) -> None:
+        """Subscribe to account_trades channel (requires auth)"""
+        if self._account_trades_subscribed:
+            return
+        print("[PacificaWS] Subscribe: account_trades")
+        await self._send({
+            "method": "subscribe",
+            "params": {
+                "source": "account_trades",
+                "account": account,
+            }
+        })
+        self._account_trades_subscribed = True
+
     async def subscribe_all_private(self, account: str) -> None:
         """Subscribe to all private channels"""
         await self.subscribe_account_info(account)
         await self.subscribe_account_positions(account)
         await self.subscribe_account_orders(account)
+        await self.subscribe_account_trades(account)
 
     # ----------------------------
     # Data Getters
     # ----------------------------
     def get_price(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get cached price data for symbol"""
-        return self._prices.get(symbol.upper())
+        tick = self._prices.get(symbol.upper())
+        return tick.to_dict() if tick is not None else None
 
     def get_mark_price(self, symbol: str) -> Optional[float]:
         """Get mark price for symbol"""
@@ -490,7 +586,7 @@ class PacificaWSClient(BaseWSClient):
         """Get all mark prices {symbol: mark_price}"""
         result = {}
         for symbol, data in self._prices.items():
-            mark = data.get("mark")
+            mark = data.mark
             if mark is not None:
                 try:
                     result[symbol] = float(mark)
@@ -520,18 +616,19 @@ class PacificaWSClient(BaseWSClient):
 
     def get_position(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get cached position for symbol"""
-        return self._positions.get(symbol.upper())
+        pos = self._positions.get(symbol.upper())
+        return pos.to_dict() if pos is not None else None
 
     def get_all_positions(self) -> Dict[str, Dict[str, Any]]:
         """Get all cached positions"""
-        return dict(self._positions)
+        return {sym: pos.to_dict() for sym, pos in self._positions.items()}
 
     def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get cached open orders, optionally filtered by symbol"""
         if symbol is None:
-            return list(self._orders)
+            return [o.to_dict() for o in self._orders]
         symbol = symbol.upper()
-        return [o for o in self._orders if o.get("symbol") == symbol]
+        return [o.to_dict() for o in self._orders if o.symbol == symbol]
 
     # ----------------------------
     # Wait for data
@@ -653,7 +750,7 @@ class PacificaWSClient(BaseWSClient):
         self._pending_requests[req_id] = fut
 
         try:
-            await self._send(request)
+            await self._send(request, priority=PRIORITY_HIGH)  # 주문/취소는 구독 메시지보다 우선
             result = await asyncio.wait_for(fut, timeout=timeout)
             return result
         except asyncio.TimeoutError:
@@ -0,0 +1,167 @@
+"""
+Token-Bucket Rate Limiter
+=========================
+venue별 / endpoint class별 token bucket으로 요청을 보내기 "전에" 속도를 맞춘다.
+(기존 429 대응은 한도를 넘긴 뒤의 backoff 뿐이라 volume_bot 취소/재주문 루프나 main.py fan-out이 한도를 먼저 넘김)
+
+우선순위:
+- PRIORITY_HIGH   : 헤징 주문 / 취소 - 버킷을 끝까지 사용 가능
+- PRIORITY_NORMAL : 포지션/잔고 등 private 조회 - 용량의 RESERVE 비율만큼은 HIGH용으로 남김
+- PRIORITY_LOW    : 시세/메타데이터 등 정보성 조회 - 더 많이 남김
+버킷이 비어갈수록 낮은 우선순위부터 대기하므로, 정보성 조회가 몰려도 주문/취소는 바로 나간다.
+
+적용 경로:
+- REST (공유 HTTP_POOL 세션): http_pool의 TraceConfig on_request_start에서 host -> venue 매핑 후 대기
+- REST (Variational curl 세션): VariationalExchange._request
+- WS 송신: BaseWSClient._throttle / _send (RATE_LIMIT_VENUE 설정된 클라이언트)
+
+사용법:
+    from wrappers.rate_limiter import RATE_LIMITER, PRIORITY_HIGH
+
+    await RATE_LIMITER.acquire("backpack", "rest", priority=PRIORITY_HIGH)
+    RATE_LIMITER.configure("backpack", "rest", rate=5, capacity=10)   # 한도 조정
+"""
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+# 우선순위별로 남겨둬야 하는 버킷 용량 비율
+RESERVE = {PRIORITY_HIGH: 0.0, PRIORITY_NORMAL: 0.2, PRIORITY_LOW: 0.5}
+
+# venue -> class -> (초당 토큰, 버킷 용량)
+# 문서화된 한도:
+# - hyperliquid rest: 1200 weight/min per IP (info 요청 대부분 weight 20, exchange action weight 1)
+# (lighter ws 200 msgs/min 한도도 문서화되어 있지만 lighter 래퍼는 WS로 송신하지 않으므로 버킷을 두지 않음)
+VENUE_LIMITS: Dict[str, Dict[str, Tuple[float, float]]] = {
+    "hyperliquid": {"rest": (1200 / 60, 1200)},
+}
+# 임시값(placeholder): 거래소 한도가 아니라 한도를 모르는 venue에 쓰는 추정치.
+# 실제 한도를 확인하면 VENUE_LIMITS에 추가하거나 RATE_LIMITER.configure()로 조정할 것
+DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+    "rest": (10.0, 20),
+    "ws": (5.0, 10),
+}
+
+# REST host -> venue
+HOST_VENUES = {
+    "api.backpack.exchange": "backpack",
+    "api.pacifica.fi": "pacifica",
+    "api.starknet.extended.exchange": "extended",
+    "pro.edgex.exchange": "edgex",
+    "spot.edgex.exchange": "edgex",
+    "api.hyperliquid.xyz": "hyperliquid",
+    "omni.variational.io": "variational",
+    "api.lighter.xyz": "lighter",
+}
+
+# 정보성(시세/메타) 경로 - LOW priority
+_INFO_PATH_HINTS = ("markets", "market", "ticker", "markprices", "depth", "meta", "prices", "supported_assets", "kline")
+# 주문/취소 경로 - HIGH priority
+_ORDER_PATH_HINTS = ("order", "cancel", "exchange", "rfq")
+
+
+def venue_for_url(url) -> Optional[str]:
+    host = url.host if hasattr(url, "host") else urlparse(str(url)).hostname
+    return HOST_VENUES.get(host or "")
+
+
+def request_priority(method: str, path: str) -> int:
+    """HTTP method/path로 기본 우선순위 추정 (주문/취소 > private 조회 > 시세/메타)"""
+    p = path.lower()
+    if method.upper() != "GET" and any(h in p for h in _ORDER_PATH_HINTS):
+        return PRIORITY_HIGH
+    if method.upper() == "DELETE":
+        return PRIORITY_HIGH
+    if any(h in p for h in _INFO_PATH_HINTS):
+        return PRIORITY_LOW
+    return PRIORITY_NORMAL
+
+
+def request_cost(venue: str, method: str, path: str) -> float:
+    """요청 weight (hyperliquid만 weight 기반)"""
+    if venue == "hyperliquid":
+        return 1.0 if path.rstrip("/").endswith("/exchange") else 20.0
+    return 1.0
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        # 통계
+        self.throttled = 0  # 대기한 요청 수
+        self.waited = 0.0  # 누적 대기 시간 (초)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, cost: float = 1.0, priority: int = PRIORITY_NORMAL) -> bool:
+        self._refill()
+        need = min(self.capacity, cost + self.capacity * RESERVE.get(priority, 0.0))
+        if self._tokens >= need:
+            self._tokens -= cost
+            return True
+        return False
+
+    async def acquire(self, cost: float = 1.0, priority: int = PRIORITY_NORMAL) -> float:
+        """토큰 확보까지 대기. Returns 대기 시간(초)"""
+        t0 = None
+        while not self.try_acquire(cost, priority):
+            if t0 is None:
+                t0 = time.monotonic()
+            need = min(self.capacity, cost + self.capacity * RESERVE.get(priority, 0.0))
+            await asyncio.sleep(max(0.001, (need - self._tokens) / self.rate))
+        if t0 is None:
+            return 0.0
+        waited = time.monotonic() - t0
+        self.throttled += 1
+        self.waited += waited
+        return waited
+
+
+class RateLimiter:
+    def __init__(self):
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self.enabled = True
+
+    def configure(self, venue: str, klass: str, rate: float, capacity: float) -> None:
+        VENUE_LIMITS.setdefault(venue, {})[klass] = (rate, capacity)
+        self._buckets.pop((venue, klass), None)
+
+    def bucket(self, venue: str, klass: str = "rest") -> TokenBucket:
+        key = (venue, klass)
+        b = self._buckets.get(key)
+        if b is None:
+            rate, capacity = VENUE_LIMITS.get(venue, {}).get(klass) or DEFAULT_LIMITS.get(klass, DEFAULT_LIMITS["rest"])
+            b = self._buckets[key] = TokenBucket(rate, capacity)
+        return b
+
+    async def acquire(self, venue: Optional[str], klass: str = "rest", *, cost: float = 1.0,
+                      priority: int = PRIORITY_NORMAL) -> float:
+        if not self.enabled or not venue:
+            return 0.0
+        return await self.bucket(venue, klass).acquire(cost, priority)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            f"{v}:{k}": {"tokens": b.tokens, "throttled": b.throttled, "waited": b.waited}
+            for (v, k), b in self._buckets.items()
+        }
+
+
+# Global singleton
+RATE_LIMITER = RateLimiter()
@@ -7,7 +7,10 @@ from pathlib import Path
 from curl_cffi import requests as curl_requests
 from eth_utils import to_checksum_address
 from .variational_auth import VariationalAuth
+from .meta_cache import META_CACHE
+from .rate_limiter import RATE_LIMITER, PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL, request_priority
 import time
+from datetime import datetime
 
 BASE_URL = "https://omni.variational.io"
 
@@ -32,6 +35,27 @@ def _fnum(x):
     except Exception:
         return None
 
+# indicative quote 만료 시각 -> 남은 시간(초). 응답에 만료 필드가 없거나 해석 불가면 None
+_QUOTE_EXPIRY_KEYS = ("expires_at", "expiry", "expires_at_ms", "valid_until")
+
+
+def _quote_expires_in_s(resp: dict, now: Optional[float] = None) -> Optional[float]:
+    now = time.time() if now is None else now
+    for key in _QUOTE_EXPIRY_KEYS:
+        v = resp.get(key)
+        if v is None:
+            continue
+        ts = _fnum(v)
+        if ts is None:
+            try:
+                ts = datetime.fromisoformat(str(v).replace("Z", "+00:00")).timestamp()
+            except ValueError:
+                continue
+        elif ts > 1e12:
+            ts /= 1000.0  # epoch ms
+        return ts - now
+    return None
+
 # 입력 cookie dict에서 vr-token 값만 추출
 def _extract_vr_token_from_cookies(cookies: Optional[Dict[str, str]]) -> Optional[str]:
     """
@@ -103,6 +127,7 @@ def _extract_indicative_core(resp: dict) -> dict:
         "mark_price": _fnum(resp.get("mark_price")),
         "index_price": _fnum(resp.get("index_price")),
         "quote_id": resp.get("quote_id"),
+        "expires_in_s": _quote_expires_in_s(resp),
         "margins": {
             "existing": {
                 "initial_margin": _fnum((mr.get("existing_margin") or {}).get("initial_margin")),
@@ -264,6 +289,9 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
         self.options.setdefault("min_price_refresh_ms", 250)  # 최소 
         self.options.setdefault("auto_login_on_demand", True)  # 자동 로그인 허용 플래그
         self.options.setdefault("funding_interval_s", 3600) # 3600 으로 강제됨, 처음 받는 response와 달리 항시 3600
+        self.options.setdefault("quote_prefetch_interval", 0.5)  # 백그라운드 indicative quote 최소 갱신 간격 (초)
+        self.options.setdefault("quote_ttl_ms", 2000)  # 응답에 quote 만료 시각이 없을 때 캐시된 quote_id 사용 가능 시간
+        self.options.setdefault("quote_refresh_margin_ms", 300)  # 만료 이만큼 전에 사전 조회 quote 갱신
         self._impersonate = self.options.get("impersonate", "chrome")
         self._timeout = float(self.options.get("timeout", 10.0))
         self.session_cookies = session_cookies
@@ -285,6 +313,17 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
         self._session_ready: bool = False
         self._vr_token: Optional[str] = None  # 메모리 보관
 
+        # 지속 HTTP 세션 (TLS/impersonate 핸드셰이크를 요청마다 하지 않도록 재사용, 최초 요청 시 생성)
+        self._http: Optional[curl_requests.AsyncSession] = None
+        self._http_inflight: Dict[curl_requests.AsyncSession, int] = {}  # 세션별 진행 중인 요청 수 (교체된 세션 close 시점 판단)
+
+        # 사전 조회 quote 캐시: (coin, qty) -> (quote_id, monotonic 만료 시각). 1회용 (사용 시 제거)
+        self._quote_cache: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._quote_task: Optional[asyncio.Task] = None
+        self._quote_wakeup: Optional[asyncio.Event] = None  # quote가 사용되면 set -> 즉시 재조회
+        self.quote_cache_hits = 0
+        self.quote_cache_misses = 0
+
     def get_perp_quote(self, symbol, *, is_basic_coll=False):
         return 'USD'
 
@@ -445,24 +484,74 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
     # ---------------------------
     # 내부: HTTP 호출
     # ---------------------------
-    async def _request(self, method: str, path: str, *, params=None, json_body=None) -> Any:
+    def _get_http(self) -> curl_requests.AsyncSession:
+        if self._http is None:
+            self._http = curl_requests.AsyncSession(impersonate=self._impersonate, timeout=self._timeout)
+        return self._http
+
+    async def _retire_http(self, s: Optional[curl_requests.AsyncSession] = None) -> None:
+        """
+        세션 교체: 이후 요청은 새 세션으로 연결하고, 기존 세션은 진행 중인 요청이 모두 끝난 뒤에 닫는다.
+        (prefetch 조회 오류가 같은 세션으로 진행 중인 다른 task의 주문 POST를 끊지 않도록)
+        """
+        s = self._http if s is None else s
+        if s is None:
+            return
+        if self._http is s:
+            self._http = None
+        if not self._http_inflight.get(s):
+            await self._close_http(s)
+
+    async def _release_http(self, s: curl_requests.AsyncSession) -> None:
+        n = self._http_inflight.get(s, 0) - 1
+        if n > 0:
+            self._http_inflight[s] = n
+            return
+        self._http_inflight.pop(s, None)
+        if s is not self._http:
+            await self._close_http(s)  # 교체된 세션의 마지막 요청
+
+    @staticmethod
+    async def _close_http(s: curl_requests.AsyncSession) -> None:
+        try:
+            await s.close()
+        except Exception:
+            pass
+
+    async def _request(self, method: str, path: str, *, params=None, json_body=None, priority: Optional[int] = None) -> Any:
         headers, cookies = await self._headers_and_cookies()
         url = BASE_URL + path
-        async with curl_requests.AsyncSession(impersonate=self._impersonate, timeout=self._timeout) as s:
-            if method.upper() == "GET":
-                r = await s.get(url, params=params, headers=headers, cookies=cookies)
-            elif method.upper() == "POST":
-                r = await s.post(url, json=json_body, headers=headers, cookies=cookies)
-            elif method.upper() == "PUT":
-                r = await s.put(url, json=json_body, headers=headers, cookies=cookies)
-            else:
-                r = await s.request(method.upper(), url, params=params, json=json_body, headers=headers, cookies=cookies)
-            r.raise_for_status()
-            ct = (r.headers or {}).get("content-type", "")
+        method = method.upper()
+        if priority is None:
+            priority = request_priority(method, path)
+        await RATE_LIMITER.acquire("variational", "rest", priority=priority)
+        # GET은 연결 오류 시 새 세션으로 1회 재시도, 주문 등 POST/PUT은 중복 실행 위험이 있어 재시도하지 않음
+        attempts = 2 if method == "GET" else 1
+        for attempt in range(attempts):
+            s = self._get_http()
+            self._http_inflight[s] = self._http_inflight.get(s, 0) + 1
             try:
-                return r.json() if "application/json" in ct else r.text
-            except Exception:
-                return r.text
+                if method == "GET":
+                    r = await s.get(url, params=params, headers=headers, cookies=cookies)
+                elif method == "POST":
+                    r = await s.post(url, json=json_body, headers=headers, cookies=cookies)
+                elif method == "PUT":
+                    r = await s.put(url, json=json_body, headers=headers, cookies=cookies)
+                else:
+                    r = await s.request(method, url, params=params, json=json_body, headers=headers, cookies=cookies)
+                break
+            except curl_requests.RequestsError:
+                await self._retire_http(s)
+                if attempt + 1 >= attempts:
+                    raise
+            finally:
+                await self._release_http(s)
+        r.raise_for_status()
+        ct = (r.headers or {}).get("content-type", "")
+        try:
+            return r.json() if "application/json" in ct else r.text
+        except Exception:
+            return r.text
     
     # ---------------------------
     # 내부: 런타임 캐시 유틸
@@ -485,6 +574,79 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
         }
         self._rt_cache[coin.upper()] = entry
 
+    @staticmethod
+    def _qty_key(qty) -> str:
+        s = f"{float(qty):.10f}"
+        return s.rstrip("0").rstrip(".")
+
+    def _quote_deadline(self, core: dict, now: float) -> float:
+        """quote_id 사용 가능 시한 (monotonic). 응답의 만료 시각 우선, 없으면 quote_ttl_ms"""
+        expires_in = core.get("expires_in_s")
+        if expires_in is None:
+            expires_in = float(self.options.get("quote_ttl_ms", 2000)) / 1000.0
+        return now + expires_in
+
+    def _take_cached_quote(self, coin: str, qty) -> Optional[str]:
+        """만료 전의 사전 조회 quote_id 반환 (1회용 -> 꺼내면서 제거, 백그라운드 루프가 바로 재조회)"""
+        entry = self._quote_cache.pop((coin, self._qty_key(qty)), None)
+        if entry is None:
+            return None
+        if self._quote_wakeup is not None:
+            self._quote_wakeup.set()
+        quote_id, deadline = entry
+        if time.monotonic() >= deadline:
+            return None
+        return quote_id
+
+    async def _quote_prefetch_loop(self, coin: str, qtys: List[str], interval: float) -> None:
+        """
+        quote를 조회해 두고, 헤징이 없는 동안은 캐시된 quote가 만료되기 직전까지 대기 (고정 주기 폴링 X).
+        quote가 사용되면(_take_cached_quote) 바로 깨어나 재조회. 최소 간격은 interval.
+        """
+        funding = int(self.options.get("funding_interval_s", 3600))
+        margin = float(self.options.get("quote_refresh_margin_ms", 300)) / 1000.0
+        self._quote_wakeup = wakeup = asyncio.Event()
+        while True:
+            wakeup.clear()
+            results = await asyncio.gather(
+                *(self._fetch_indicative_quote(coin=coin, qty=q, funding_interval_s=funding, priority=PRIORITY_LOW) for q in qtys),
+                return_exceptions=True,
+            )
+            now = time.monotonic()
+            for q, core in zip(qtys, results):
+                if isinstance(core, Exception):
+                    continue
+                quote_id = core.get("quote_id")
+                if quote_id:
+                    self._quote_cache[(coin, q)] = (quote_id, self._quote_deadline(core, now))
+            deadlines = [self._quote_cache[(coin, q)][1] for q in qtys if (coin, q) in self._quote_cache]
+            wait = min(deadlines) - margin - time.monotonic() if len(deadlines) == len(qtys) else 0.0
+            await asyncio.sleep(interval)
+            if wait > interval:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=wait - interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start_quote_prefetch(self, symbol: str, sizes, *, interval: Optional[float] = None) -> None:
+        """
+        헤징 코인 + 표준 주문 수량들의 indicative quote를 백그라운드에서 주기적으로 조회해 둔다.
+        market create_order가 같은 수량이면 quote 조회 없이 바로 주문 (quote_id는 수량 단위로 발급).
+        """
+        if self._quote_task is not None:
+            self._quote_task.cancel()
+        coin = str(symbol).upper()
+        qtys = list(dict.fromkeys(self._qty_key(q) for q in sizes))
+        interval = float(interval if interval is not None else self.options.get("quote_prefetch_interval", 0.5))
+        self._quote_task = asyncio.create_task(self._quote_prefetch_loop(coin, qtys, interval))
+
+    def stop_quote_prefetch(self) -> None:
+        if self._quote_task is not None:
+            self._quote_task.cancel()
+            self._quote_task = None
+        self._quote_wakeup = None
+        self._quote_cache.clear()
+
     def _get_cached_instrument(self, coin: str, funding_interval_s: Optional[int] = None) -> Optional[dict]:
         entry = self._rt_cache.get(coin.upper())
         if not entry:
@@ -523,57 +685,27 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
         self._vr_token = _extract_vr_token_from_cookies(self.session_cookies) or _load_vr_token_from_cache(self.address)
         self._session_ready = True
 
-        # 2) supported_assets
+        # 2) supported_assets (디스크 메타 캐시, TTL 지나면 백그라운드 재조회)
         method, path = ENDPOINTS["supported_assets"]
-        raw = await self._request(method, path)
-        data = raw if isinstance(raw, dict) else json.loads(str(raw))
+        data, age = await META_CACHE.get(
+            f"variational:{BASE_URL}{path}",
+            self._fetch_supported_assets,
+            on_refresh=lambda d: self._apply_supported_assets(d, int(time.monotonic() * 1000)),
+            validate=lambda d: isinstance(d, dict) and len(d) > 0,
+        )
 
         # 3) 시드 캐시 구성
+        # 디스크 캐시에서 온 가격은 오래됐으므로 last_price_at_ms=0 → fetch_price throttle에 걸리지 않고 재조회
         self._asset_list = []
-        now_ms = int(time.monotonic() * 1000)
-        for sym, items in data.items():
-            if not isinstance(items, list) or not items:
-                continue
-            it = items[0] if isinstance(items[0], dict) else None
-            if not it:
-                continue
-            if not it.get("has_perp", False):
-                continue
-            if it.get("is_close_only_mode", False):
-                continue
-
-            coin = str(it.get("asset") or sym).upper()
-            
-            # 현재는 3600으로 강제하고 있음
-            #funding_interval_s = int(it.get("funding_interval_s", 3600))
-            funding_interval_s = self.options.get("funding_interval_s")
-
-            price = _fnum(it.get("price"))
-
-            instrument = {
-                "instrument_type": "perpetual_future",
-                "underlying": coin,
-                "funding_interval_s": funding_interval_s,
-                "settlement_asset": "USDC",
-            }
-            self._rt_cache[coin] = {
-                "instrument": instrument,
-                "quote_id": None,
-                "mark_price": price,
-                "qty": None,
-                "funding_interval_s": funding_interval_s,
-                "last_price_at_ms": now_ms,
-            }
-            self._asset_list.append(coin)
-
-        self._asset_list.sort()
+        self._apply_supported_assets(data, int(time.monotonic() * 1000) if age == 0.0 else 0)
         self._initialized = True
         return {"ok": True, "assets": list(self._asset_list), "seeded": len(self._rt_cache)}
     
     # ---------------------------
     # 내부: API별 래퍼
     # ---------------------------
-    async def _fetch_indicative_quote(self, coin: str, qty: str | float, funding_interval_s: int = 3600) -> dict:
+    async def _fetch_indicative_quote(self, coin: str, qty: str | float, funding_interval_s: int = 3600,
+                                      priority: int = PRIORITY_NORMAL) -> dict:
         method, path = ENDPOINTS["indicative_quote"]
         payload = {
             "instrument": {
@@ -584,7 +716,7 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
             },
             "qty": str(qty),
         }
-        data = await self._request(method, path, json_body=payload)
+        data = await self._request(method, path, json_body=payload, priority=priority)
         core = _extract_indicative_core(data if isinstance(data, dict) else json.loads(str(data)))
         self._cache_update_from_core(coin, core)  # [ADDED] 런타임 캐시 반영
         return core
@@ -652,6 +784,53 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
     async def _supported_assets_raw(self):
         method, path = ENDPOINTS["supported_assets"]
         return await self._request(method, path)
+
+    async def _fetch_supported_assets(self) -> dict:
+        raw = await self._supported_assets_raw()
+        return raw if isinstance(raw, dict) else json.loads(str(raw))
+
+    def _apply_supported_assets(self, data: dict, now_ms: int) -> None:
+        """
+        has_perp=True && !is_close_only_mode 심볼만 대상으로 instrument/price(seed) 캐시.
+        이미 캐시된 코인(indicative로 갱신된 instrument/quote_id)은 덮어쓰지 않는다.
+        """
+        assets = set(self._asset_list)
+        for sym, items in data.items():
+            if not isinstance(items, list) or not items:
+                continue
+            it = items[0] if isinstance(items[0], dict) else None
+            if not it:
+                continue
+            if not it.get("has_perp", False):
+                continue
+            if it.get("is_close_only_mode", False):
+                continue
+
+            coin = str(it.get("asset") or sym).upper()
+            
+            # 현재는 3600으로 강제하고 있음
+            #funding_interval_s = int(it.get("funding_interval_s", 3600))
+            funding_interval_s = self.options.get("funding_interval_s")
+
+            price = _fnum(it.get("price"))
+
+            instrument = {
+                "instrument_type": "perpetual_future",
+                "underlying": coin,
+                "funding_interval_s": funding_interval_s,
+                "settlement_asset": "USDC",
+            }
+            self._rt_cache.setdefault(coin, {
+                "instrument": instrument,
+                "quote_id": None,
+                "mark_price": price,
+                "qty": None,
+                "funding_interval_s": funding_interval_s,
+                "last_price_at_ms": now_ms,
+            })
+            assets.add(coin)
+
+        self._asset_list = sorted(assets)
     
     # ---------------------------
     # Public API
@@ -743,10 +922,29 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
             )
             return res.get('rfq_id')
 
+        # market: 사전 조회된 quote가 있으면 바로 주문 (quote 조회 왕복 생략)
+        quote_id = self._take_cached_quote(coin, amount)
+        if quote_id:
+            try:
+                res = await self._create_market_order(
+                    coin=coin,
+                    side=side,
+                    quote_id=quote_id,
+                    max_slippage=float(self.options.get("max_slippage", 0.01)),
+                )
+                self.quote_cache_hits += 1
+                return res.get('rfq_id')
+            except curl_requests.RequestsError as e:
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                # 4xx(만료/거부된 quote)만 직렬 경로로 재시도. 연결 오류/5xx는 주문 여부가 불명확해 그대로 전파
+                if status is None or int(status) >= 500:
+                    raise
+        self.quote_cache_misses += 1
+
         # market: 최신 quote_id 필요
         cached = self._rt_cache.get(coin)
         funding = int((cached or {}).get("funding_interval_s") or self.options.get("funding_interval_s", 3600))
-        core = await self._fetch_indicative_quote(coin=coin, qty=str(amount), funding_interval_s=funding)
+        core = await self._fetch_indicative_quote(coin=coin, qty=str(amount), funding_interval_s=funding, priority=PRIORITY_HIGH)
         quote_id = core.get("quote_id")
         if not quote_id:
             raise RuntimeError("quote_id를 얻지 못했습니다. indicative quote 실패.")
@@ -820,5 +1018,6 @@ class VariationalExchange(MultiPerpDexMixin, MultiPerpDex):
         return await super().close_position(symbol, position)
 
     async def close(self):
-        """No persistent session to close"""
-        pass
\ No newline at end of file
+        """Stop quote prefetch and close the persistent HTTP session"""
+        self.stop_quote_prefetch()
+        await self._retire_http()
\ No newline at end of file
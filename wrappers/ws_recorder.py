@@ -0,0 +1,137 @@
+"""
+WebSocket Frame Recorder / Replayer
+===================================
+BaseWSClient 수신 루프의 raw 프레임을 수신 시각과 함께 append-only 파일에 기록하고,
+같은 프레임을 네트워크 없이 클라이언트의 _decode_message -> _handle_message 로 다시 흘려보낸다.
+(실제 트래픽으로 handler 프로파일링, 오더북 불일치 재현, codec/orderbook 변경 벤치마크)
+
+파일 형식 (.mpws):
+    header : b"MPWS1\\n"
+    record : <q recv_time_ns> <I payload_len> <B kind(0=text utf-8, 1=binary)> payload
+    - 프레임 원문 그대로 저장 (JSON 재인코딩/base64 없음), 재기동 시 같은 파일에 이어서 append
+    - 마지막 레코드가 잘린 파일(프로세스 강제 종료)은 잘린 레코드 직전까지 읽음
+
+녹화:
+    client.start_recording("pacifica.mpws")       # 실행 중인 클라이언트
+    MPDEX_WS_RECORD_DIR=./captures python ...      # 모든 BaseWSClient가 연결 시 자동 녹화 (<클래스명>-<시각>.mpws)
+
+재생:
+    client = PacificaWSClient()                    # connect() 하지 않음
+    stats = await WSReplayer(client, "pacifica.mpws", speed=0).run()   # 0 = 최대 속도, 1.0 = 실시간, N = N배속
+"""
+import asyncio
+import os
+import struct
+import time
+from typing import Any, Iterator, Optional, Tuple
+
+MAGIC = b"MPWS1\n"
+_RECORD = struct.Struct("<qIB")
+KIND_TEXT = 0
+KIND_BINARY = 1
+
+
+class WSRecorder:
+    """수신 프레임 append-only 기록기 (수신 루프에서 동기 호출, 버퍼링 쓰기)"""
+
+    def __init__(self, path: str, buffering: int = 1 << 16):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._f = open(path, "ab", buffering=buffering)
+        if self._f.tell() == 0:
+            self._f.write(MAGIC)
+        self.frames = 0
+        self.bytes = 0
+
+    def record(self, raw: Any, recv_time_ns: Optional[int] = None) -> None:
+        if self._f is None:
+            return
+        if isinstance(raw, str):
+            payload, kind = raw.encode("utf-8"), KIND_TEXT
+        else:
+            payload, kind = bytes(raw), KIND_BINARY
+        self._f.write(_RECORD.pack(recv_time_ns or time.time_ns(), len(payload), kind))
+        self._f.write(payload)
+        self.frames += 1
+        self.bytes += len(payload)
+
+    def flush(self) -> None:
+        if self._f is not None:
+            self._f.flush()
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+
+def read_frames(path: str) -> Iterator[Tuple[int, Any]]:
+    """(recv_time_ns, raw) 순회. raw는 기록 당시 타입 (text -> str, binary -> bytes)"""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path}: not a ws recording (bad header)")
+        while True:
+            head = f.read(_RECORD.size)
+            if len(head) < _RECORD.size:
+                return
+            ts, length, kind = _RECORD.unpack(head)
+            payload = f.read(length)
+            if len(payload) < length:
+                return  # 잘린 마지막 레코드
+            yield ts, payload.decode("utf-8") if kind == KIND_TEXT else payload
+
+
+def recording_path(directory: str, name: str) -> str:
+    return os.path.join(directory, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}.mpws")
+
+
+class WSReplayer:
+    """
+    녹화 파일을 클라이언트 handler로 재생.
+    speed: 1.0 = 녹화 간격 그대로, N = N배속, 0 (또는 None) = 대기 없이 최대 속도
+    """
+
+    def __init__(self, client, path: str, speed: Optional[float] = 0.0):
+        self.client = client
+        self.path = path
+        self.speed = speed or 0.0
+        self.frames = 0
+        self.errors = 0
+        self.elapsed = 0.0
+        self.handler_time = 0.0  # decode + handle 누적 (대기 시간 제외)
+
+    async def run(self, limit: Optional[int] = None) -> dict:
+        client = self.client
+        first_ts = None
+        t0 = time.perf_counter()
+        for ts, raw in read_frames(self.path):
+            if limit is not None and self.frames >= limit:
+                break
+            if self.speed > 0:
+                if first_ts is None:
+                    first_ts = ts
+                due = (ts - first_ts) / 1e9 / self.speed
+                wait = due - (time.perf_counter() - t0)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            h0 = time.perf_counter()
+            try:
+                await client._handle_message(client._decode_message(raw))
+            except Exception:
+                self.errors += 1
+            self.handler_time += time.perf_counter() - h0
+            self.frames += 1
+            if self.speed <= 0 and self.frames % 1000 == 0:
+                await asyncio.sleep(0)  # 최대 속도에서도 다른 태스크(resync 등) 진행 허용
+        self.elapsed = time.perf_counter() - t0
+        return self.stats()
+
+    def stats(self) -> dict:
+        return {
+            "frames": self.frames,
+            "errors": self.errors,
+            "elapsed_s": self.elapsed,
+            "msgs_per_sec": self.frames / self.elapsed if self.elapsed else 0.0,
+            "handler_us_per_msg": self.handler_time / self.frames * 1e6 if self.frames else 0.0,
+        }
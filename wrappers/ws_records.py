@@ -0,0 +1,198 @@
+"""
+WS Cache Records
+================
+WS 캐시에 저장하는 고정 스키마 레코드 (가격 틱, 포지션, 주문).
+
+핸들러가 프레임마다 항목별로 새 dict를 만드는 대신 compact 객체 하나만 만든다.
+- msgspec 설치 시: msgspec.Struct (wire key -> 필드 rename 포함, bytes에서 바로 typed decode 가능)
+- 미설치 시: 같은 필드를 가진 __slots__ 클래스 (from_wire로 생성)
+
+레코드는 dict처럼 .get(key)로 읽을 수 있고, public getter는 .to_dict()로 기존 dict 형식을 반환한다.
+
+사용법:
+    from wrappers.ws_records import PacificaPriceTick, HAS_MSGSPEC
+
+    tick = PacificaPriceTick.from_wire(item)   # decode된 dict 항목에서 생성
+    tick.get("mark")                            # dict 호환 읽기
+    tick.to_dict()                              # getter 반환용
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:  # optional dependency
+    msgspec = None
+    HAS_MSGSPEC = False
+
+
+def _record_get(self, key: str, default: Any = None) -> Any:
+    return getattr(self, key, default)
+
+
+def _record_to_dict(self) -> Dict[str, Any]:
+    return {f: getattr(self, f) for f in self.FIELDS}
+
+
+def define_record(name: str, fields: Sequence[Tuple[str, Any]], wire: Optional[Dict[str, str]] = None):
+    """
+    레코드 타입 생성.
+    fields: [(attr, default), ...]
+    wire: {attr: wire_key} (원본 프레임의 축약 key, 없으면 attr 이름 그대로)
+    """
+    wire = wire or {}
+    attrs = tuple(f for f, _ in fields)
+    spec = tuple((f, wire.get(f, f), d) for f, d in fields)
+
+    def from_wire(cls, item: Dict[str, Any]):
+        """decode된 wire dict 항목에서 생성"""
+        return cls(**{f: item.get(w, d) for f, w, d in spec})
+
+    namespace = {
+        "FIELDS": attrs,
+        "get": _record_get,
+        "to_dict": _record_to_dict,
+        "from_wire": classmethod(from_wire),
+    }
+
+    if HAS_MSGSPEC:
+        return msgspec.defstruct(
+            name,
+            [(f, Any, d) for f, d in fields],
+            rename=dict(wire) or None,
+            namespace=namespace,
+            module=__name__,
+            gc=False,
+        )
+
+    def __init__(self, **kwargs):
+        for f, d in fields:
+            setattr(self, f, kwargs.get(f, d))
+
+    def __repr__(self):
+        return f"{name}({', '.join(f'{f}={getattr(self, f)!r}' for f in attrs)})"
+
+    namespace.update({"__slots__": attrs, "__init__": __init__, "__repr__": __repr__, "__module__": __name__})
+    return type(name, (), namespace)
+
+
+def define_frame(name: str, item_type: Any):
+    """
+    {"channel": str, "data": [item_type, ...]} 프레임 Struct (msgspec 전용, 미설치 시 None).
+    bytes에서 중간 dict 없이 레코드 리스트로 바로 decode 하기 위해 사용.
+    """
+    if not HAS_MSGSPEC:
+        return None
+    return msgspec.defstruct(
+        name,
+        [("channel", str, ""), ("data", List[item_type], msgspec.field(default_factory=list))],
+        namespace={"get": _record_get},
+        module=__name__,
+    )
+
+
+# ==================== Pacifica ====================
+
+PacificaPriceTick = define_record(
+    "PacificaPriceTick",
+    [
+        ("symbol", ""),
+        ("mark", None),
+        ("mid", None),
+        ("oracle", None),
+        ("funding", None),
+        ("next_funding", None),
+        ("open_interest", None),
+        ("volume_24h", None),
+        ("yesterday_price", None),
+        ("timestamp", None),
+    ],
+)
+
+# Format: [{s, d, a, p, m, f, i, l, t}, ...]
+PacificaPosition = define_record(
+    "PacificaPosition",
+    [
+        ("symbol", ""),
+        ("side", None),  # bid or ask
+        ("amount", "0"),
+        ("entry_price", None),
+        ("margin", None),
+        ("funding_fee", None),
+        ("is_isolated", False),
+        ("liquidation_price", None),
+        ("timestamp", None),
+    ],
+    wire={
+        "symbol": "s", "side": "d", "amount": "a", "entry_price": "p", "margin": "m",
+        "funding_fee": "f", "is_isolated": "i", "liquidation_price": "l", "timestamp": "t",
+    },
+)
+
+# Format: [{i, I, s, d, p, a, f, c, t, st, ot, sp, ro}, ...]
+PacificaOrder = define_record(
+    "PacificaOrder",
+    [
+        ("order_id", None),
+        ("client_order_id", None),
+        ("symbol", ""),
+        ("side", None),  # bid or ask
+        ("price", None),
+        ("amount", None),
+        ("filled_amount", None),
+        ("cancelled_amount", None),
+        ("timestamp", None),
+        ("stop_type", None),
+        ("order_type", None),
+        ("stop_price", None),
+        ("reduce_only", False),
+    ],
+    wire={
+        "order_id": "i", "client_order_id": "I", "symbol": "s", "side": "d", "price": "p",
+        "amount": "a", "filled_amount": "f", "cancelled_amount": "c", "timestamp": "t",
+        "stop_type": "st", "order_type": "ot", "stop_price": "sp", "reduce_only": "ro",
+    },
+)
+
+PacificaPricesFrame = define_frame("PacificaPricesFrame", PacificaPriceTick)
+PacificaPositionsFrame = define_frame("PacificaPositionsFrame", PacificaPosition)
+PacificaOrdersFrame = define_frame("PacificaOrdersFrame", PacificaOrder)
+
+
+# ==================== Backpack ====================
+# Backpack 프레임은 {"stream", "data": {...}} 단건 구조라 handler에서 정규화(side 변환 등) 후 생성
+
+BackpackMarkPrice = define_record(
+    "BackpackMarkPrice",
+    [("mark_price", None), ("index_price", None), ("funding_rate", None), ("next_funding_time", None), ("time", 0)],
+)
+
+BackpackPosition = define_record(
+    "BackpackPosition",
+    [
+        ("symbol", ""),
+        ("side", None),
+        ("size", "0"),
+        ("entry_price", None),
+        ("mark_price", None),
+        ("unrealized_pnl", None),
+        ("realized_pnl", None),
+        ("position_id", None),
+        ("time", 0),
+    ],
+)
+
+BackpackOrder = define_record(
+    "BackpackOrder",
+    [
+        ("id", None),
+        ("symbol", None),
+        ("side", None),
+        ("size", None),
+        ("price", None),
+        ("order_type", None),
+        ("status", None),
+        ("executed_qty", None),
+        ("time", 0),
+    ],
+)